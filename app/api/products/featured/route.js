@@ -13,8 +13,12 @@ function getSeasonalMultiplier() {
 export async function GET() {
   let connection;
   try {
+    // Phase timings reported in the Server-Timing header (see tests/test_perf_featured_products.py)
+    const poolStart = performance.now();
+
     // Get connection from pool
     connection = await pool.getConnection();
+    const dbStart = performance.now();
 
     // First, check if there are any products with sales
     const [salesCheck] = await connection.execute(
@@ -62,6 +66,7 @@ export async function GET() {
     }
 
     const [products] = await connection.execute(query);
+    const pricingStart = performance.now();
 
     // Calculate discounts and format response
     const formattedProducts = products.map((product) => {
@@ -98,10 +103,23 @@ export async function GET() {
       };
     });
 
-    return NextResponse.json({
-      products: formattedProducts,
-      hasSales: salesCheck[0].count > 0,
-    });
+    const pricingEnd = performance.now();
+
+    return NextResponse.json(
+      {
+        products: formattedProducts,
+        hasSales: salesCheck[0].count > 0,
+      },
+      {
+        headers: {
+          "Server-Timing": [
+            `pool;dur=${(dbStart - poolStart).toFixed(2)}`,
+            `db;dur=${(pricingStart - dbStart).toFixed(2)}`,
+            `pricing;dur=${(pricingEnd - pricingStart).toFixed(2)}`,
+          ].join(", "),
+        },
+      }
+    );
   } catch (error) {
     console.error("Error fetching featured products:", error);
     return NextResponse.json(
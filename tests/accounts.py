@@ -0,0 +1,122 @@
+"""
+Pool of pre-provisioned test accounts that tests lease instead of sharing VALID_EMAIL.
+
+The pool bulk-creates ACCOUNT_POOL_SIZE users in one INSERT with the bcrypt hash already
+stored for VALID_EMAIL, so no per-user hashing is needed. It then logs them all in once, in
+parallel, and keeps each account's auth_token. A lease is a queue pop. Signing a browser or a
+requests session in is a cookie write, and on return the account's cart, wishlist, orders and
+history are deleted so the next test starts clean.
+
+Accounts are named lease-<host>-<pid>-<n>, so parallel runs (tests.distributed) never share
+them. A session that crashes before closing its pool leaves its accounts behind, so every new
+pool first sweeps lease accounts whose process is gone from this host or that are older than
+ACCOUNT_POOL_STALE_HOURS.
+
+Use through the `leased_account` / `leased_driver` fixtures in conftest.py.
+"""
+import hashlib
+import os
+import queue
+import re
+import socket
+
+import requests
+
+from tests.config import (
+    ACCOUNT_LEASE_TIMEOUT,
+    ACCOUNT_POOL_LOGIN_WORKERS,
+    ACCOUNT_POOL_SIZE,
+    ACCOUNT_POOL_STALE_HOURS,
+    BASE_URL,
+    VALID_PASSWORD,
+)
+from tests.db import connect, create_users, delete_users, known_password_hash, wipe_user_data
+from tests.perf import api_login, run_concurrently
+
+AUTH_COOKIE = "auth_token"
+LEASE_PREFIX = "lease"
+HOST_TAG = hashlib.md5(socket.gethostname().encode()).hexdigest()[:6]
+_OWNER_PATTERN = re.compile(rf"^{LEASE_PREFIX}-([0-9a-f]+)-(\d+)-\d+@")
+
+def owner_prefix(pid=None):
+    """Returns the account prefix of the pool owned by process pid (default: this one) on this host."""
+    return f"{LEASE_PREFIX}-{HOST_TAG}-{os.getpid() if pid is None else pid}"
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by another user
+    return True
+
+def sweep_stale_accounts(cursor, stale_hours=ACCOUNT_POOL_STALE_HOURS):
+    """Deletes pool accounts left by sessions that never closed their pool; returns how many users went."""
+    cursor.execute(
+        "SELECT email, created_at < NOW() - INTERVAL %s HOUR AS expired FROM users WHERE email LIKE %s",
+        (stale_hours, f"{LEASE_PREFIX}-%@mavs.uta.edu"),
+    )
+    stale = set()
+    for row in cursor.fetchall():
+        match = _OWNER_PATTERN.match(row["email"])
+        if not match:
+            continue
+        host, pid = match.group(1), int(match.group(2))
+        if row["expired"] or (host == HOST_TAG and not _process_alive(pid)):
+            stale.add(f"{LEASE_PREFIX}-{host}-{pid}")
+    return sum(delete_users(cursor, prefix) for prefix in sorted(stale))
+
+def _fetch_token(account):
+    session = requests.Session()
+    api_login(session, account["email"], account["password"])
+    return session.cookies[AUTH_COOKIE]
+
+class AccountPool:
+    """Creates, hands out and finally deletes a fixed set of test users."""
+
+    def __init__(self, size=ACCOUNT_POOL_SIZE, prefix=None):
+        self.prefix = prefix or owner_prefix()
+        with connect() as connection:
+            with connection.cursor() as cursor:
+                sweep_stale_accounts(cursor)
+                delete_users(cursor, self.prefix)
+                users = create_users(cursor, self.prefix, size, known_password_hash(cursor))
+        self.accounts = [{"id": user_id, "email": email, "password": VALID_PASSWORD} for user_id, email in users]
+        for account, token in zip(self.accounts, run_concurrently(_fetch_token, self.accounts, ACCOUNT_POOL_LOGIN_WORKERS)):
+            account["token"] = token
+        self._free = queue.Queue()
+        for account in self.accounts:
+            self._free.put(account)
+
+    def lease(self, timeout=ACCOUNT_LEASE_TIMEOUT):
+        """Returns a free account dict (id, email, password, token), waiting up to timeout seconds."""
+        try:
+            return self._free.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No free test account within {timeout}s; raise ACCOUNT_POOL_SIZE") from None
+
+    def release(self, account):
+        """Wipes the account's data and puts it back in the pool."""
+        with connect() as connection:
+            with connection.cursor() as cursor:
+                wipe_user_data(cursor, account["id"])
+        self._free.put(account)
+
+    def close(self):
+        with connect() as connection:
+            with connection.cursor() as cursor:
+                delete_users(cursor, self.prefix)
+
+def authenticated_session(account):
+    """Returns a requests session signed in as the account without calling /api/auth/login."""
+    session = requests.Session()
+    session.cookies.set(AUTH_COOKIE, account["token"])
+    return session
+
+def sign_in_browser(driver, account):
+    """Signs the browser in as the account by setting its auth_token cookie."""
+    driver.get(BASE_URL)
+    driver.delete_cookie(AUTH_COOKIE)
+    driver.add_cookie({"name": AUTH_COOKIE, "value": account["token"], "path": "/", "httpOnly": True})
+    driver.refresh()
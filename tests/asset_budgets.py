@@ -0,0 +1,147 @@
+"""
+Per-route JavaScript, CSS, image and font byte budgets.
+
+Enabled with `pytest --asset-budgets`. The session `driver` then records CDP network events
+with the HTTP cache disabled, so every page load transfers its full payload. After each test,
+requests are grouped by the document that loaded them (CDP loaderId), the document URL is
+mapped back to its app/ route (/product/12 -> /product/[id]), and encoded (transferred)
+bytes are summed per asset type. The largest load seen for a route is compared with its
+entry in ASSET_BUDGETS_PATH, and any route over budget fails the run with a diff. A measured
+route with no budget (a missing or null entry) fails too, so an unrecorded budget never passes
+silently.
+
+`--update-asset-budgets` writes the measured sizes plus ASSET_BUDGET_HEADROOM back to the
+budget file instead. Review that diff like any other change.
+"""
+import json
+import re
+from urllib.parse import urlparse
+
+import pytest
+
+from tests.cdp import collect_requests, drain_network_events
+from tests.config import ASSET_BUDGET_HEADROOM, ASSET_BUDGETS_PATH, BASE_URL
+
+ASSET_TYPES = {"Script": "js", "Stylesheet": "css", "Image": "image", "Font": "font"}
+
+def route_patterns():
+    """Returns [(route, compiled regex)] for every page under app/, static routes first."""
+    from tests.perf import discover_routes
+    pages = [r["route"] for r in discover_routes() if r["kind"] == "page"]
+    patterns = [(route, re.compile("^" + re.sub(r"\\\[\w+\\\]", "[^/]+", re.escape(route)) + "/?$")) for route in pages]
+    return sorted(patterns, key=lambda pattern: "[" in pattern[0])
+
+def load_budgets(path=ASSET_BUDGETS_PATH):
+    with open(path, encoding="utf-8") as budgets:
+        return json.load(budgets)
+
+def page_loads(events):
+    """Groups network events into page loads: [{"url", "bytes": {asset type: bytes}}]."""
+    loads = {}
+    for request in collect_requests(events):
+        load = loads.setdefault(request["loader_id"], {"url": None, "bytes": dict.fromkeys(ASSET_TYPES.values(), 0)})
+        if request["resource_type"] == "Document":
+            load["url"] = request["url"]
+        elif request["resource_type"] in ASSET_TYPES:
+            load["bytes"][ASSET_TYPES[request["resource_type"]]] += request["bytes"]
+    return [load for load in loads.values() if load["url"]]
+
+def budget_diff(measured, budgets):
+    """Returns one row per (route, type) over budget: {route, type, budget, actual, delta}."""
+    over = []
+    for route, sizes in sorted(measured.items()):
+        for asset_type, actual in sizes.items():
+            budget = budgets.get(route, {}).get(asset_type)
+            if budget is not None and actual > budget:
+                over.append({"route": route, "type": asset_type, "budget": budget, "actual": actual, "delta": actual - budget})
+    return over
+
+def unbudgeted(measured, budgets):
+    """Returns one row per measured (route, type) with no recorded budget: {route, type, actual}."""
+    return [
+        {"route": route, "type": asset_type, "actual": actual}
+        for route, sizes in sorted(measured.items())
+        for asset_type, actual in sizes.items()
+        if budgets.get(route, {}).get(asset_type) is None
+    ]
+
+class AssetBudgets:
+    """Pytest plugin that measures shipped bytes per route and enforces the checked-in budgets."""
+
+    def __init__(self, update=False):
+        self.update = update
+        self.patterns = route_patterns()
+        self.origin = urlparse(BASE_URL).netloc
+        self.measured = {}
+        self.over_budget = []
+        self.missing_budgets = []
+
+    def route_for(self, url):
+        parsed = urlparse(url)
+        if parsed.netloc != self.origin:
+            return None
+        for route, pattern in self.patterns:
+            if pattern.match(parsed.path):
+                return route
+        return None
+
+    def record(self, driver):
+        """Folds the page loads buffered in the driver's performance log into self.measured."""
+        for load in page_loads(drain_network_events(driver)):
+            route = self.route_for(load["url"])
+            if route is None:
+                continue
+            sizes = self.measured.setdefault(route, dict.fromkeys(ASSET_TYPES.values(), 0))
+            for asset_type, size in load["bytes"].items():
+                sizes[asset_type] = max(sizes[asset_type], size)
+
+    # --- Pytest hooks ---
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_teardown(self, item):
+        # Runs before fixture finalizers, so the session driver is still open
+        driver = item.funcargs.get("driver")
+        if driver is not None:
+            self.record(driver)
+
+    def pytest_sessionfinish(self, session):
+        if not self.measured:
+            return
+        from tests.perf import write_report
+        budgets = load_budgets()
+        write_report("asset_bytes", {"routes": self.measured, "budgets": budgets})
+        if self.update:
+            for route, sizes in self.measured.items():
+                budgets[route] = {asset_type: int(size * ASSET_BUDGET_HEADROOM) for asset_type, size in sizes.items()}
+            with open(ASSET_BUDGETS_PATH, "w", encoding="utf-8") as budget_file:
+                json.dump(dict(sorted(budgets.items())), budget_file, indent=2)
+                budget_file.write("\n")
+            return
+        self.over_budget = budget_diff(self.measured, budgets)
+        self.missing_budgets = unbudgeted(self.measured, budgets)
+        if self.over_budget or self.missing_budgets:
+            session.exitstatus = 1
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.measured:
+            return
+        budgets = load_budgets()
+        terminalreporter.section("transferred bytes per route (KB)")
+        terminalreporter.write_line(f"{'route':<32} " + " ".join(f"{t:>12}" for t in ASSET_TYPES.values()))
+        for route, sizes in sorted(self.measured.items()):
+            cells = []
+            for asset_type, size in sizes.items():
+                budget = budgets.get(route, {}).get(asset_type)
+                cells.append(f"{size / 1024:>5.0f}/{budget / 1024:<6.0f}" if budget is not None else f"{size / 1024:>5.0f}/-     ")
+            terminalreporter.write_line(f"{route:<32} " + " ".join(cells))
+        if self.update:
+            terminalreporter.write_line(f"Budgets updated in {ASSET_BUDGETS_PATH}")
+        for row in self.over_budget:
+            terminalreporter.write_line(
+                f"OVER BUDGET {row['route']} {row['type']}: {row['actual']} bytes > {row['budget']} "
+                f"(+{row['delta']} bytes, +{100 * row['delta'] / row['budget']:.1f}%)", red=True,
+            )
+        for row in self.missing_budgets:
+            terminalreporter.write_line(
+                f"NO BUDGET {row['route']} {row['type']}: {row['actual']} bytes; record one with --update-asset-budgets", red=True,
+            )
@@ -0,0 +1,189 @@
+"""
+Semester-start sign-up and login storm generator.
+
+    python -m tests.auth_storm --rate 40 --seconds 30
+
+POST /api/auth/signup and POST /api/auth/login each run a bcrypt operation (cost 10) and hold
+a mysql2 pool connection while they do. A storm fires both at a fixed offered rate:
+AUTH_STORM_SIGNUP_SHARE of it is sign-ups, each with a unique email and student_id, and the rest
+are logins rotating through AUTH_STORM_LOGIN_USERS existing accounts. Arrivals follow a fixed
+schedule, so slow responses overlap instead of slowing the storm down.
+
+Two probes run alongside every AUTH_STORM_PROBE_INTERVAL, and neither is an auth route:
+
+* /api/listings needs a pool connection, so it shows event-loop stall plus pool wait;
+* /api/auth/current-user without a cookie touches neither the pool nor bcrypt, so it shows
+  event-loop stall alone.
+
+Stall is estimated as a probe's latency over its latency with no storm. A sign-up answered 409
+can only mean the route's random 5-digit user id collided, because our emails and student ids
+are unique. These are counted as id_conflicts.
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tests.config import (
+    AUTH_STORM_LOGIN_USERS,
+    AUTH_STORM_MAX_ERROR_RATE,
+    AUTH_STORM_MIN_THROUGHPUT,
+    AUTH_STORM_P95_BUDGET_MS,
+    AUTH_STORM_PROBE_INTERVAL,
+    AUTH_STORM_SIGNUP_SHARE,
+    AUTH_STORM_WORKERS,
+    BASE_URL,
+    VALID_PASSWORD,
+)
+from tests.db import connect, create_users, delete_users, known_password_hash
+from tests.perf import latency_by_kind, over_baseline, thread_session, tolerant_request
+
+LOGIN_PREFIX = "perf-auth-login"
+SIGNUP_PREFIX = "perf-auth-signup"
+AUTH_KINDS = {"signup": 201, "login": 200}  # kind -> expected status
+PROBES = {"listings_probe": "/api/listings", "loop_probe": "/api/auth/current-user"}
+
+def create_login_users(count=AUTH_STORM_LOGIN_USERS):
+    """Creates the accounts the storm logs in as and returns their emails."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, LOGIN_PREFIX)
+            return [email for _, email in create_users(cursor, LOGIN_PREFIX, count, known_password_hash(cursor))]
+
+def delete_storm_users():
+    """Deletes the login accounts and every account the storm signed up."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            return delete_users(cursor, LOGIN_PREFIX) + delete_users(cursor, SIGNUP_PREFIX)
+
+class AuthStorm:
+    """Fires sign-ups, logins and the probes against base_url at a fixed offered rate."""
+
+    def __init__(self, login_emails, base_url=BASE_URL, seed=49):
+        self.login_emails = login_emails
+        self.base_url = base_url
+        self.rng = random.Random(seed)
+        self.run_token = f"{int(time.time()) % 0x10000:04x}"  # Keeps student ids unique across runs
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    # --- Requests ---
+
+    def _next_number(self):
+        with self._lock:
+            self._counter += 1
+            return self._counter
+
+    def _request(self, kind, method, path, session=None, **kwargs):
+        result = tolerant_request(kind, session or thread_session(), method, f"{self.base_url}{path}", **kwargs)
+        del result["response"]
+        return result
+
+    def signup(self):
+        n = self._next_number()
+        return self._request("signup", "POST", "/api/auth/signup", json={
+            "name": f"Storm Student {n}",
+            "email": f"{SIGNUP_PREFIX}-{self.run_token}-{n}@mavs.uta.edu",
+            "password": VALID_PASSWORD,
+            "studentId": f"S{self.run_token}{n:06d}",
+            "dateOfBirth": "2005-08-15",
+            "agreeToTerms": True,
+        })
+
+    def login(self):
+        email = self.login_emails[self._next_number() % len(self.login_emails)]
+        # A fresh session each time, so no auth cookie carries over to other requests
+        return self._request("login", "POST", "/api/auth/login", session=requests.Session(),
+                             json={"email": email, "password": VALID_PASSWORD})
+
+    def probe(self, kind):
+        return self._request(kind, "GET", PROBES[kind])
+
+    # --- Run ---
+
+    def schedule(self, rate, seconds, signup_share=AUTH_STORM_SIGNUP_SHARE):
+        """Returns [(offset seconds, action)] for one step: evenly spaced arrivals, each stream at a random phase."""
+        streams = [(rate * signup_share, self.signup), (rate * (1 - signup_share), self.login)]
+        streams += [(1 / AUTH_STORM_PROBE_INTERVAL, lambda kind=kind: self.probe(kind)) for kind in PROBES]
+        events = []
+        for stream_rate, action in streams:
+            if stream_rate <= 0:
+                continue
+            interval = 1 / stream_rate
+            offset = self.rng.uniform(0, interval)
+            while offset < seconds:
+                events.append((offset, action))
+                offset += interval
+        return sorted(events, key=lambda event: event[0])
+
+    def run(self, rate, seconds, signup_share=AUTH_STORM_SIGNUP_SHARE, workers=AUTH_STORM_WORKERS):
+        """Runs one step at `rate` auth requests/s (0 for probes only) and returns its summary."""
+        events = self.schedule(rate, seconds, signup_share)
+        futures = []
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for offset, action in events:
+                delay = started + offset - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(action))
+            results = [future.result() for future in futures]
+        return summarize_step(results, time.perf_counter() - started, rate)
+
+def summarize_step(results, wall_seconds, rate):
+    """Aggregates one step: latency and outcomes per kind, auth throughput and sustainability."""
+    by_kind = defaultdict(list)
+    for result in results:
+        by_kind[result["kind"]].append(result)
+    auth = [r for kind in AUTH_KINDS for r in by_kind[kind]]
+    succeeded = sum(1 for r in auth if r["status"] == AUTH_KINDS[r["kind"]])
+    failed = len(auth) - succeeded
+    step = {
+        "offered_rate": rate,
+        "wall_s": round(wall_seconds, 2),
+        "auth_requests": len(auth),
+        "auth_failed": failed,
+        "error_rate": round(failed / len(auth), 4) if auth else 0.0,
+        "achieved_rate": round(succeeded / wall_seconds, 1),
+        "id_conflicts": sum(1 for r in by_kind["signup"] if r["status"] == 409),
+        "statuses": {kind: dict(Counter(str(r["status"]) for r in rows)) for kind, rows in sorted(by_kind.items())},
+        "latency": latency_by_kind(results),
+    }
+    step["sustainable"] = sustainable(step)
+    return step
+
+def sustainable(step):
+    """True when the step kept up with its offered rate, within the error and latency budgets."""
+    if step["offered_rate"] == 0:
+        return True
+    within_budget = all((step["latency"].get(kind, {}).get("p95") or 0) <= AUTH_STORM_P95_BUDGET_MS for kind in AUTH_KINDS)
+    kept_up = step["achieved_rate"] >= AUTH_STORM_MIN_THROUGHPUT * step["offered_rate"]
+    return within_budget and kept_up and step["error_rate"] <= AUTH_STORM_MAX_ERROR_RATE
+
+# --- Entry point ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fire a sign-up and login storm at BASE_URL.")
+    parser.add_argument("--rate", type=float, required=True, help="Offered auth requests per second.")
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--signup-share", type=float, default=AUTH_STORM_SIGNUP_SHARE)
+    args = parser.parse_args(argv)
+
+    try:
+        storm = AuthStorm(create_login_users())
+        baseline = storm.run(0, min(args.seconds, 10))
+        step = storm.run(args.rate, args.seconds, args.signup_share)
+        step["stall_ms"] = {kind: over_baseline(step, baseline, kind) for kind in PROBES}
+    finally:
+        delete_storm_users()
+    print(json.dumps(step, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Many isolated browser contexts inside one Chrome process.
+
+One "owner" Chrome is started with a remote debugging port. Each context is created with CDP
+Target.createBrowserContext (its own cookies, storage and cache) and gets one tab. A separate,
+lightweight WebDriver session attaches to the same Chrome through `debuggerAddress` and is
+pinned to that tab, so every context has its own (driver, wait) pair. Pairs can be driven in
+parallel from threads, and the existing helpers (login, add_item_to_cart, ...) work unchanged.
+
+A single WebDriver session runs one command at a time, so parallel contexts need one
+chromedriver each. These chromedrivers are small, but rss_mb() counts them along with Chrome so
+memory comparisons against one Chrome per user stay fair.
+"""
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.config import BROWSER_CONTEXT_DEBUG_PORT
+from tests.conftest import chrome_options, create_chrome
+from tests.perf import process_tree_rss_mb
+
+class BrowserContextPool:
+    """Owns one Chrome and hands out isolated contexts as (driver, wait) pairs."""
+
+    def __init__(self, debug_port=BROWSER_CONTEXT_DEBUG_PORT):
+        options = chrome_options()
+        options.add_argument(f"--remote-debugging-port={debug_port}")
+        self.debug_port = debug_port
+        self.browser = create_chrome(options)
+        self.contexts = []
+        self._lock = threading.Lock()
+
+    def new_context(self):
+        """Creates an isolated context with one tab and returns (driver, wait) bound to it."""
+        with self._lock:
+            context_id = self.browser.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+            target_id = self.browser.execute_cdp_cmd(
+                "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+            )["targetId"]
+        options = webdriver.ChromeOptions()
+        options.debugger_address = f"127.0.0.1:{self.debug_port}"
+        attached = create_chrome(options)
+        attached.switch_to.window(target_id)  # ChromeDriver window handles are CDP target ids
+        self.contexts.append({"context_id": context_id, "target_id": target_id, "driver": attached})
+        return attached, WebDriverWait(attached, 10)
+
+    @property
+    def browser_pid(self):
+        """PID of the chromedriver that launched Chrome; Chrome and its renderers are its descendants."""
+        return self.browser.service.process.pid
+
+    def rss_mb(self):
+        """Resident memory (MB) of Chrome, its renderers and every chromedriver attached to a context."""
+        pids = [self.browser_pid] + [context["driver"].service.process.pid for context in self.contexts]
+        return round(sum(process_tree_rss_mb(pid) for pid in pids), 1)
+
+    def dispose(self, attached):
+        """Closes the context that `attached` (a driver from new_context) is bound to."""
+        with self._lock:
+            context = next(c for c in self.contexts if c["driver"] is attached)
+            self.contexts.remove(context)
+        self._dispose(context)
+
+    def _dispose(self, context):
+        try:
+            self.browser.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context["context_id"]})
+        except Exception as e:
+            print(f"Could not dispose browser context {context['context_id']}: {e}")
+        try:
+            context["driver"].quit()
+        except Exception:
+            pass  # Its tab is already gone with the disposed context
+
+    def close(self):
+        for context in self.contexts:
+            self._dispose(context)
+        self.contexts = []
+        self.browser.quit()
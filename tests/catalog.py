@@ -0,0 +1,190 @@
+"""
+Incremental, content-hashed catalog loader for test databases.
+
+    python -m tests.catalog             # sync products with constants/*.json
+    python -m tests.catalog --dry-run   # report what would change
+
+database/importProducts.js inserts the catalog one product at a time. This loader keeps a
+side table, CATALOG_HASH_TABLE, that maps each catalog pid to its product id and a SHA-256
+of its JSON record and category. A sync reads every JSON file, hashes each record and
+writes only what changed. All writes happen in one transaction:
+
+* new pids are inserted as multi-row INSERTs of CATALOG_BATCH_SIZE rows;
+* pids whose hash changed are rewritten with multi-row INSERT ... ON DUPLICATE KEY UPDATE
+  on the product id. Stock and sales counters are left alone;
+* pids tracked in the side table but gone from the files are deleted.
+
+The product columns are derived exactly as importProducts.js derives them. On the first sync
+of a database seeded by importProducts.js, products are adopted by their image_url
+(/images/product/<pid>.jpg) instead of being duplicated. A pid listed in more than one
+file is loaded once, from the file listed last in CATEGORY_FILES.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+from tests.config import CATALOG_BATCH_SIZE, CATALOG_DIR, CATALOG_HASH_TABLE
+from tests.db import connect, insert_many
+
+# Same mapping as database/importProducts.js
+CATEGORY_FILES = {
+    "product_apparel_info.json": "Apparel",
+    "product_accessories_info.json": "Accessories",
+    "product_spirit_gear_info.json": "Spirit Gear",
+    "product_school_supplies.json": "School Supplies",
+    "product_gifts_info.json": "Gifts",
+}
+CONTENT_COLUMNS = ["name", "description", "price", "category_id", "image_url", "product_details", "tags", "item_details"]
+DEFAULT_STOCK = 100
+
+def read_catalog(catalog_dir=CATALOG_DIR):
+    """Returns {pid: {"category": name, "record": dict}} for every product in the mapped JSON files."""
+    catalog = {}
+    for filename, category in CATEGORY_FILES.items():
+        path = os.path.join(catalog_dir, filename)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as catalog_file:
+            for record in json.load(catalog_file):
+                catalog[record["pid"]] = {"category": category, "record": record}
+    return catalog
+
+def content_hash(entry):
+    canonical = json.dumps([entry["category"], entry["record"]], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def image_url(pid):
+    return f"/images/product/{pid}.jpg"
+
+def product_columns(pid, entry, category_ids):
+    """Maps a catalog record to product column values (CONTENT_COLUMNS order), as importProducts.js does."""
+    record = entry["record"]
+    return (
+        record["product_name"],
+        record["product_description"],
+        float(record["price"].replace("$", "")),
+        category_ids[entry["category"]],
+        image_url(pid),
+        json.dumps(record["product_details"]),
+        json.dumps(record["tags"]),
+        json.dumps(record["item_details"]),
+    )
+
+def _ensure_hash_table(cursor):
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {CATALOG_HASH_TABLE} (
+            pid VARCHAR(64) PRIMARY KEY,
+            product_id INT NOT NULL,
+            content_hash CHAR(64) NOT NULL,
+            FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
+        )
+        """
+    )
+
+def _category_ids(cursor, names):
+    insert_many(cursor, "INSERT IGNORE INTO categories (category_name) VALUES (%s)", [(name,) for name in sorted(names)])
+    cursor.execute("SELECT id, category_name FROM categories")
+    return {row["category_name"]: row["id"] for row in cursor.fetchall()}
+
+def _products_by_image(cursor, pids):
+    """Returns {pid: product id} for products whose image_url belongs to one of pids."""
+    found = {}
+    pids = list(pids)
+    for start in range(0, len(pids), CATALOG_BATCH_SIZE):
+        chunk = pids[start:start + CATALOG_BATCH_SIZE]
+        cursor.execute(
+            "SELECT id, image_url FROM products WHERE image_url IN (" + ", ".join(["%s"] * len(chunk)) + ") ORDER BY id",
+            tuple(image_url(pid) for pid in chunk),
+        )
+        by_url = {image_url(pid): pid for pid in chunk}
+        for row in cursor.fetchall():
+            found.setdefault(by_url[row["image_url"]], row["id"])
+    return found
+
+def plan_sync(catalog, tracked):
+    """Splits pids into (new, changed, unchanged, removed) given {pid: (product_id, hash)} from the side table."""
+    new, changed, unchanged = [], [], []
+    for pid, entry in catalog.items():
+        if pid not in tracked:
+            new.append(pid)
+        elif tracked[pid][1] != content_hash(entry):
+            changed.append(pid)
+        else:
+            unchanged.append(pid)
+    removed = [pid for pid in tracked if pid not in catalog]
+    return new, changed, unchanged, removed
+
+def sync_catalog(catalog=None, dry_run=False):
+    """Brings the products table in line with the catalog and returns counts per outcome plus elapsed seconds."""
+    started = time.perf_counter()
+    catalog = read_catalog() if catalog is None else catalog
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            _ensure_hash_table(cursor)
+            cursor.execute(f"SELECT pid, product_id, content_hash FROM {CATALOG_HASH_TABLE}")
+            tracked = {row["pid"]: (row["product_id"], row["content_hash"]) for row in cursor.fetchall()}
+            new, changed, unchanged, removed = plan_sync(catalog, tracked)
+
+            # Adopt products seeded by importProducts.js: treat them as changed rather than new
+            adopted = _products_by_image(cursor, new) if new else {}
+            for pid, product_id in adopted.items():
+                tracked[pid] = (product_id, None)
+            changed += list(adopted)
+            new = [pid for pid in new if pid not in adopted]
+
+            stats = {
+                "records": len(catalog),
+                "inserted": len(new),
+                "updated": len(changed),
+                "unchanged": len(unchanged),
+                "deleted": len(removed),
+                "adopted": len(adopted),
+            }
+            if dry_run:
+                connection.rollback()
+                return {**stats, "seconds": round(time.perf_counter() - started, 3)}
+
+            category_ids = _category_ids(cursor, {entry["category"] for entry in catalog.values()})
+            columns = ", ".join(CONTENT_COLUMNS)
+            placeholders = ", ".join(["%s"] * len(CONTENT_COLUMNS))
+            if changed:
+                insert_many(cursor, (
+                    f"INSERT INTO products (id, {columns}) VALUES (%s, {placeholders}) "
+                    "ON DUPLICATE KEY UPDATE " + ", ".join(f"{column} = VALUES({column})" for column in CONTENT_COLUMNS)
+                ), [(tracked[pid][0], *product_columns(pid, catalog[pid], category_ids)) for pid in changed], CATALOG_BATCH_SIZE)
+            if new:
+                insert_many(cursor, (
+                    # Placeholders only, so pymysql sends each batch as one multi-row INSERT
+                    f"INSERT INTO products ({columns}, stock_quantity) VALUES ({placeholders}, %s)"
+                ), [(*product_columns(pid, catalog[pid], category_ids), DEFAULT_STOCK) for pid in new], CATALOG_BATCH_SIZE)
+                inserted = _products_by_image(cursor, new)
+                missing = set(new) - set(inserted)
+                if missing:
+                    raise RuntimeError(f"Inserted products not found by image_url: {sorted(missing)[:5]}")
+                tracked.update({pid: (product_id, None) for pid, product_id in inserted.items()})
+            if removed:
+                insert_many(cursor, "DELETE FROM products WHERE id = %s", [(tracked[pid][0],) for pid in removed], CATALOG_BATCH_SIZE)
+            if new or changed:
+                insert_many(cursor, (
+                    f"INSERT INTO {CATALOG_HASH_TABLE} (pid, product_id, content_hash) VALUES (%s, %s, %s) "
+                    "ON DUPLICATE KEY UPDATE product_id = VALUES(product_id), content_hash = VALUES(content_hash)"
+                ), [(pid, tracked[pid][0], content_hash(catalog[pid])) for pid in new + changed], CATALOG_BATCH_SIZE)
+    return {**stats, "seconds": round(time.perf_counter() - started, 3)}
+
+# --- Entry point ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync the products table with the catalog JSON files.")
+    parser.add_argument("--catalog-dir", default=CATALOG_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing.")
+    args = parser.parse_args(argv)
+    stats = sync_catalog(read_catalog(args.catalog_dir), dry_run=args.dry_run)
+    print(", ".join(f"{key}={value}" for key, value in stats.items()))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
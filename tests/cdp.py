@@ -0,0 +1,107 @@
+"""
+Chrome DevTools Protocol helpers for the browser benchmarks.
+
+Network events come from Chrome's performance log, enabled by the `perf_driver` fixture
+(`goog:loggingPrefs` = {"performance": "ALL"}).
+"""
+import json
+import time
+
+# --- Network log ---
+
+def drain_network_events(driver):
+    """Returns and clears the Network.* CDP events buffered since the last call."""
+    events = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"].startswith("Network."):
+            events.append(message)
+    return events
+
+def collect_requests(events):
+    """Folds CDP network events into one dict per request.
+
+    Each request has url, loader_id (shared by a document and everything it loads),
+    resource_type, status, mime_type, headers (lower-cased), bytes (encoded bytes received
+    over the network) and source, one of "memory", "disk", "revalidated" (304) or "network".
+    """
+    requests_by_id = {}
+    served_from_cache = set()
+    for event in events:
+        params = event["params"]
+        request_id = params.get("requestId")
+        method = event["method"]
+        if method == "Network.requestWillBeSent":
+            requests_by_id.setdefault(request_id, {
+                "url": params["request"]["url"],
+                "loader_id": params.get("loaderId"),
+                "resource_type": params.get("type", "Other"),
+                "status": None,
+                "mime_type": None,
+                "headers": {},
+                "bytes": 0,
+                "from_disk_cache": False,
+            })
+        elif method == "Network.requestServedFromCache":
+            served_from_cache.add(request_id)
+        elif method == "Network.responseReceived" and request_id in requests_by_id:
+            response = params["response"]
+            requests_by_id[request_id].update({
+                "resource_type": params.get("type", requests_by_id[request_id]["resource_type"]),
+                "status": response.get("status"),
+                "mime_type": response.get("mimeType"),
+                "headers": {key.lower(): value for key, value in response.get("headers", {}).items()},
+                "from_disk_cache": response.get("fromDiskCache", False),
+            })
+        elif method == "Network.loadingFinished" and request_id in requests_by_id:
+            requests_by_id[request_id]["bytes"] = params.get("encodedDataLength", 0)
+
+    for request_id, request in requests_by_id.items():
+        if request.pop("from_disk_cache"):
+            request["source"] = "disk"
+        elif request_id in served_from_cache:
+            request["source"] = "memory"
+        elif request["status"] == 304:
+            request["source"] = "revalidated"
+        else:
+            request["source"] = "network"
+    return list(requests_by_id.values())
+
+def clear_browser_cache(driver):
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+# --- Page readiness ---
+
+def wait_for_network_idle(driver, idle_seconds=0.5, timeout=15):
+    """Waits until document.readyState is complete and no new resource entries appear for idle_seconds."""
+    deadline = time.monotonic() + timeout
+    last_count, stable_since = -1, time.monotonic()
+    while time.monotonic() < deadline:
+        state, count = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        if state != "complete" or count != last_count:
+            last_count, stable_since = count, time.monotonic()
+        elif time.monotonic() - stable_since >= idle_seconds:
+            return True
+        time.sleep(0.1)
+    return False
+
+# --- Device emulation ---
+
+def apply_device_profile(driver, profile):
+    """Applies CPU throttling, network shaping and a mobile viewport/user agent from a DEVICE_PROFILES entry."""
+    driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": profile["cpu_throttling_rate"]})
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.emulateNetworkConditions", {"offline": False, **profile["network"]})
+    driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {**profile["viewport"], "mobile": True})
+    driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": True})
+    driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": profile["user_agent"]})
+
+def navigation_load_ms(driver):
+    """Returns navigation start to loadEventEnd for the current document, or None if it has not finished loading."""
+    duration = driver.execute_script(
+        "const nav = performance.getEntriesByType('navigation')[0];"
+        "return nav && nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null;"
+    )
+    return round(duration, 1) if duration is not None else None
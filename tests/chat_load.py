@@ -0,0 +1,236 @@
+"""
+Support-chat polling load simulator.
+
+    python -m tests.chat_load --students 50 --admins 2 --seconds 60
+
+Every open app/support tab polls GET /api/chat every CHAT_STUDENT_POLL_SECONDS. Every open
+app/contact-admin console polls GET /api/support every CHAT_ADMIN_SESSIONS_POLL_SECONDS and
+polls GET /api/chat for its selected session every CHAT_ADMIN_MESSAGES_POLL_SECONDS. On any
+poll, a tab sends a message (POST /api/chat) with probability CHAT_SEND_PROBABILITY.
+
+Like setInterval, polls fire on a fixed schedule whether or not the previous poll has
+returned, so slow responses overlap rather than slowing the cadence down. Each tab starts at a
+random phase. Students are leased test accounts (tests/accounts.py). Each one sends an opening
+message before it is measured, so its support session exists.
+
+Alongside the polling, a probe requests CHAT_PROBE_PATH every CHAT_PROBE_INTERVAL as a signed-in
+shopper. The Node mysql2 pool (connectionLimit 10 in database/db.js) is inside the app process
+and cannot be observed directly. Pool wait is therefore estimated as the probe's latency over
+its latency with no chat load. Database load is read from MySQL itself: Questions per second,
+plus per-statement counts and time for the support_chat_* statements.
+"""
+import argparse
+import heapq
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tests.accounts import AUTH_COOKIE, AccountPool
+from tests.config import (
+    ADMIN_EMAIL,
+    ADMIN_PASSWORD,
+    BASE_URL,
+    CHAT_ADMIN_CONSOLES,
+    CHAT_ADMIN_MESSAGES_POLL_SECONDS,
+    CHAT_ADMIN_SESSIONS_POLL_SECONDS,
+    CHAT_PROBE_INTERVAL,
+    CHAT_PROBE_PATH,
+    CHAT_SEND_PROBABILITY,
+    CHAT_STUDENT_POLL_SECONDS,
+    CHAT_WORKERS,
+)
+from tests.db import connect, digest_delta, digest_snapshot, ensure_user, global_status, known_password_hash
+from tests.perf import (
+    api_login,
+    latency_by_kind,
+    over_baseline,
+    run_concurrently,
+    summarize,
+    thread_session,
+    tolerant_request,
+)
+
+CHAT_TABLES = "support_chat"
+STATUS_COUNTERS = ["Questions", "Threads_connected"]
+
+def admin_token(base_url=BASE_URL):
+    """Returns an auth_token for the admin user, creating it with the test password if needed."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            ensure_user(cursor, ADMIN_EMAIL, "admin", known_password_hash(cursor), "ADMIN0001")
+    session = requests.Session()
+    api_login(session, ADMIN_EMAIL, ADMIN_PASSWORD, base_url)
+    return session.cookies[AUTH_COOKIE]
+
+class ChatLoad:
+    """Drives student tabs, admin consoles and the checkout probe against base_url."""
+
+    def __init__(self, students, admin_token, probe_account, base_url=BASE_URL, seed=41):
+        self.students = students
+        self.admin_token = admin_token
+        self.probe_account = probe_account
+        self.base_url = base_url
+        self.rng = random.Random(seed)
+        self._opened = set()
+        self._lock = threading.Lock()
+
+    # --- Requests ---
+
+    def _request(self, kind, method, path, token, **kwargs):
+        url = f"{self.base_url}{path}"
+        return tolerant_request(kind, thread_session(), method, url, cookies={AUTH_COOKIE: token}, **kwargs)
+
+    def _send(self, kind, token, user_id, message_type):
+        body = {
+            "userId": user_id,
+            "content": f"load test message from {message_type}",
+            "timestamp": int(time.time()),
+            "type": message_type,
+        }
+        return self._request(kind, "POST", "/api/chat", token, json=body)
+
+    def _chance(self):
+        with self._lock:
+            return self.rng.random() < CHAT_SEND_PROBABILITY
+
+    def open_tabs(self, count):
+        """Sends an opening message for each of the first `count` students that has not sent one."""
+        new = [s for s in self.students[:count] if s["id"] not in self._opened]
+        results = run_concurrently(lambda s: self._send("student_send", s["token"], s["id"], "user"), new, CHAT_WORKERS)
+        failed = [r for r in results if r["status"] != 200]
+        assert not failed, f"{len(failed)} opening messages failed (first status {failed[0]['status']})"
+        self._opened.update(s["id"] for s in new)
+
+    # --- Tabs ---
+
+    def _student_tab(self, student):
+        def poll():
+            results = [self._request("student_poll", "GET", f"/api/chat?userId={student['id']}", student["token"])]
+            if self._chance():
+                results.append(self._send("student_send", student["token"], student["id"], "user"))
+            return results
+        return poll
+
+    def _admin_console(self):
+        console = {"sessions": [], "selected": None}
+
+        def poll_sessions():
+            result = self._request("admin_sessions", "GET", "/api/support", self.admin_token)
+            if result["status"] == 200:
+                user_ids = [s["user_id"] for s in result["response"].json().get("sessions", [])]
+                with self._lock:
+                    if user_ids and (console["selected"] not in user_ids or self.rng.random() < 0.2):
+                        console["selected"] = self.rng.choice(user_ids)
+            return [result]
+
+        def poll_messages():
+            user_id = console["selected"]
+            if user_id is None:
+                return []
+            results = [self._request("admin_messages", "GET", f"/api/chat?userId={user_id}", self.admin_token)]
+            if self._chance():
+                results.append(self._send("admin_send", self.admin_token, user_id, "admin"))
+            return results
+
+        return [(CHAT_ADMIN_SESSIONS_POLL_SECONDS, poll_sessions), (CHAT_ADMIN_MESSAGES_POLL_SECONDS, poll_messages)]
+
+    def _probe(self):
+        return [self._request("probe", "GET", CHAT_PROBE_PATH, self.probe_account["token"])]
+
+    # --- Run ---
+
+    def run(self, students, admins, seconds, workers=CHAT_WORKERS):
+        """Runs `students` tabs and `admins` consoles for `seconds` and returns the step summary."""
+        self.open_tabs(students)
+        tabs = [(CHAT_STUDENT_POLL_SECONDS, self._student_tab(s)) for s in self.students[:students]]
+        for _ in range(admins):
+            tabs.extend(self._admin_console())
+        tabs.append((CHAT_PROBE_INTERVAL, self._probe))
+
+        with connect() as connection:
+            with connection.cursor() as cursor:
+                status_before, digests_before = global_status(cursor, STATUS_COUNTERS), digest_snapshot(cursor)
+
+        futures = []
+        started = time.perf_counter()
+        deadline = started + seconds
+        # (due, tab index): every tab starts at a random phase within its interval
+        schedule = [(started + self.rng.uniform(0, interval), index) for index, (interval, _) in enumerate(tabs)]
+        heapq.heapify(schedule)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while schedule[0][0] < deadline:
+                due, index = heapq.heappop(schedule)
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                interval, poll = tabs[index]
+                futures.append((due, executor.submit(self._timed, poll, due)))
+                heapq.heappush(schedule, (due + interval, index))
+            results = [result for _, future in futures for result in future.result()]
+        wall_seconds = time.perf_counter() - started
+
+        with connect() as connection:
+            with connection.cursor() as cursor:
+                status_after, digests_after = global_status(cursor, STATUS_COUNTERS), digest_snapshot(cursor)
+        chat_statements = digest_delta(digests_before, digests_after, text_filter=CHAT_TABLES)
+        return summarize_step(
+            results, wall_seconds, students, admins,
+            queries=status_after["Questions"] - status_before["Questions"],
+            threads_connected=status_after["Threads_connected"],
+            chat_statements=chat_statements,
+        )
+
+    def _timed(self, poll, due):
+        lateness_ms = (time.perf_counter() - due) * 1000
+        results = poll()
+        for result in results:
+            result.pop("response", None)
+            result["lateness_ms"] = lateness_ms
+        return results
+
+def summarize_step(results, wall_seconds, students, admins, queries, threads_connected, chat_statements):
+    """Aggregates one step: request latency per kind, errors, schedule lateness and database load."""
+    chat_queries = sum(statement["count"] for statement in chat_statements)
+    return {
+        "students": students,
+        "admins": admins,
+        "wall_s": round(wall_seconds, 2),
+        "requests": len(results),
+        "errors": sum(1 for r in results if r["status"] is None or r["status"] >= 500),
+        "lateness_ms": summarize([r["lateness_ms"] for r in results]),
+        "latency": latency_by_kind(results),
+        "queries_per_s": round(queries / wall_seconds, 1),
+        "chat_queries_per_s": round(chat_queries / wall_seconds, 1),
+        "chat_db_ms_per_s": round(sum(s["total_ms"] for s in chat_statements) / wall_seconds, 1),
+        "threads_connected": threads_connected,
+        "chat_statements": chat_statements[:10],
+    }
+
+# --- Entry point ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate open support-chat tabs and admin consoles against BASE_URL.")
+    parser.add_argument("--students", type=int, required=True)
+    parser.add_argument("--admins", type=int, default=CHAT_ADMIN_CONSOLES)
+    parser.add_argument("--seconds", type=float, default=60)
+    args = parser.parse_args(argv)
+
+    pool = AccountPool(size=args.students + 1, prefix="perf-chat")
+    try:
+        accounts = [pool.lease() for _ in range(args.students + 1)]
+        load = ChatLoad(accounts[1:], admin_token(), accounts[0])
+        baseline = load.run(0, 0, min(args.seconds, 10))
+        step = load.run(args.students, args.admins, args.seconds)
+        step["pool_wait_ms"] = over_baseline(step, baseline, "probe")
+    finally:
+        pool.close()
+    print(json.dumps(step, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
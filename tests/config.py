@@ -1,6 +1,7 @@
 """
 Configuration settings for Selenium tests.
 """
+import os
 
 BASE_URL = "http://localhost:3000"  # Replace with your actual app URL
 
@@ -8,4 +9,177 @@ BASE_URL = "http://localhost:3000"  # Replace with your actual app URL
 VALID_EMAIL = "testuser@mavs.uta.edu"
 VALID_PASSWORD = "password@123"
 INVALID_PASSWORD = "wrongpassword"
-UNREGISTERED_EMAIL = "nosuchuser@example.com" 
\ No newline at end of file
+UNREGISTERED_EMAIL = "nosuchuser@example.com"
+
+# --- Performance benchmarks (run with `pytest --perf`) ---
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PERF_RESULTS_DIR = os.environ.get("PERF_RESULTS_DIR", os.path.join(PROJECT_ROOT, "tests", "perf_results"))
+
+# Port used when a benchmark starts its own `next start` (keeps clear of the dev server on 3000)
+PERF_SERVER_PORT = int(os.environ.get("PERF_SERVER_PORT", "3100"))
+PERF_SERVER_START_TIMEOUT = 60  # seconds
+
+# Sample values substituted for dynamic route segments such as /product/[id]
+ROUTE_PARAM_SAMPLES = {
+    "id": "1",
+    "category": "apparel",
+    "orderId": "1",
+}
+
+# Cold-start benchmark
+COLD_START_WARM_REQUESTS = 10  # K steady-state requests per route after the first hit
+COLD_START_ISOLATE_ROUTES = True  # Restart `next start` before each route so every first hit is truly cold
+COLD_START_SKIP_ROUTES = ["/api/ai-logs/update"]  # GET handlers that write to the database
+
+# Recommendation latency vs interaction-history size
+RECOMMENDATION_HISTORY_SIZES = [10, 100, 1000, 10000, 100000]  # ai_recommendation_logs rows per seeded user
+RECOMMENDATION_REQUESTS_PER_USER = 5
+RECOMMENDATION_LATENCY_BUDGET_MS = 2000  # p95 budget for the heaviest user
+
+# Search parameter sweep and slow-query fuzzer
+SEARCH_SWEEP_WORKERS = 8  # Concurrent requests against /api/products/search
+SEARCH_FUZZ_CASES = 200
+SEARCH_FUZZ_SEED = 28
+SEARCH_ROWS_EXAMINED_TOP_N = 20  # Slowest cases re-run serially to attribute rows examined
+
+# Throttled device profiles (pytest --device-profile=<name>), applied through CDP.
+# Network presets match Chrome DevTools' "Fast 3G" and "Slow 3G" (throughput in bytes/second).
+DEVICE_PROFILES = {
+    "mid-android": {
+        "cpu_throttling_rate": 4,
+        "network": {"latency": 562.5, "downloadThroughput": 180000, "uploadThroughput": 84375},
+        "viewport": {"width": 412, "height": 915, "deviceScaleFactor": 2.625},
+        "user_agent": "Mozilla/5.0 (Linux; Android 13; Pixel 7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
+    },
+    "low-android": {
+        "cpu_throttling_rate": 6,
+        "network": {"latency": 2000, "downloadThroughput": 50000, "uploadThroughput": 50000},
+        "viewport": {"width": 360, "height": 640, "deviceScaleFactor": 2},
+        "user_agent": "Mozilla/5.0 (Linux; Android 10; Moto G4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
+    },
+}
+
+# Page load budgets (navigation start to loadEventEnd, ms) per test module under each profile
+DEVICE_PROFILE_LOAD_BUDGETS_MS = {
+    "mid-android": {"test_home_page": 8000, "test_product_listings_page": 8000, "test_product_detail_page": 8000},
+    "low-android": {"test_home_page": 25000, "test_product_listings_page": 25000, "test_product_detail_page": 25000},
+}
+
+# Deep-pagination crawler for /api/listings
+LISTINGS_MAX_PAGES = None  # Crawl every page; set an int to cap very large catalogs
+
+# Per-test / per-request SQL accounting (pytest --sql-accounting=test|request)
+SQL_N_PLUS_ONE_THRESHOLD = 5  # Same statement digest this many times in one test/request is flagged
+
+# Admin dashboard benchmark (admin routes check the JWT for this email and the name "admin")
+ADMIN_EMAIL = "admin@mavs.uta.edu"
+ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD", VALID_PASSWORD)
+ADMIN_ORDER_VOLUMES = [1000, 10000, 100000, 300000]  # Cumulative synthetic orders measured at each step
+ADMIN_ORDER_HISTORY_YEARS = 3
+ADMIN_SEED_CUSTOMERS = 500
+ADMIN_REQUESTS_PER_ENDPOINT = 5
+ADMIN_DASHBOARD_BUDGET_MS = 1000  # p95 above this at a volume suggests pre-aggregated rollups
+
+# Isolated browser contexts inside one Chrome (CDP Target.createBrowserContext)
+BROWSER_CONTEXT_POOL_SIZE = 8
+BROWSER_CONTEXT_DEBUG_PORT = 9333  # Remote debugging port the per-context WebDriver sessions attach to
+
+# Remote WebDriver / distributed runs (python -m tests.distributed)
+WEBDRIVER_URL = os.environ.get("WEBDRIVER_URL")  # When set, drivers are created on this remote endpoint instead of locally
+WEBDRIVER_ENDPOINTS = [url for url in os.environ.get("WEBDRIVER_ENDPOINTS", "").split(",") if url]
+WEBDRIVER_HEALTH_TIMEOUT = 5  # seconds for a node's /status check
+DISTRIBUTED_MAX_ATTEMPTS = 2  # A module is retried once on another node if its node went unhealthy mid-run
+DISTRIBUTED_CHROMEDRIVER_BASE_PORT = 9515  # First port for --spawn-chromedrivers local nodes
+
+# Pre-provisioned test accounts leased to tests (tests/accounts.py)
+ACCOUNT_POOL_SIZE = 16
+ACCOUNT_POOL_LOGIN_WORKERS = 8  # Parallel /api/auth/login calls when the pool fetches its tokens
+ACCOUNT_LEASE_TIMEOUT = 60  # seconds to wait for a free account before failing the test
+ACCOUNT_POOL_STALE_HOURS = 12  # Pool accounts older than this are swept even if their owner ran on another host
+
+# Per-route transferred-byte budgets (pytest --asset-budgets)
+ASSET_BUDGETS_PATH = os.path.join(PROJECT_ROOT, "tests", "asset_budgets.json")
+ASSET_BUDGET_HEADROOM = 1.10  # --update-asset-budgets records measured bytes plus this margin
+
+# Production traffic replay (tests/replay.py)
+REPLAY_LOG_PATH = os.environ.get("REPLAY_LOG_PATH")  # Access log (JSON lines or combined format) to replay
+REPLAY_SPEEDS = [1, 5, 20]  # Time compression factors
+REPLAY_WINDOW_SECONDS = 900  # Replay only the first N seconds of the log (None for all of it)
+REPLAY_ACCOUNTS = 50  # Test accounts the log's user keys are mapped onto
+REPLAY_WORKERS = 64  # Concurrent in-flight requests
+
+# Support-chat polling load (tests/chat_load.py); cadences match app/support and app/contact-admin
+CHAT_STUDENT_COUNTS = [10, 50, 100, 200]  # Concurrently open student support tabs at each step
+CHAT_ADMIN_CONSOLES = 2
+CHAT_STUDENT_POLL_SECONDS = 2  # app/support/page.jsx: GET /api/chat
+CHAT_ADMIN_SESSIONS_POLL_SECONDS = 5  # app/contact-admin/page.jsx: GET /api/support
+CHAT_ADMIN_MESSAGES_POLL_SECONDS = 2  # app/contact-admin/page.jsx: GET /api/chat for the open session
+CHAT_SEND_PROBABILITY = 0.05  # Chance that a tab sends a message on a given poll
+CHAT_STEP_SECONDS = 30  # Measured duration at each student count
+CHAT_WORKERS = 256  # Concurrent in-flight requests
+CHAT_PROBE_PATH = "/api/cart"  # Pool-bound checkout request timed alongside the polling
+CHAT_PROBE_INTERVAL = 0.5  # seconds between probe requests
+CHAT_PROBE_BUDGET_MS = 500  # Probe p95 above this means polling is starving checkout
+
+# /featured -> /api/ai-logs/update rebuild benchmark (runs its own `next start` on PERF_SERVER_PORT)
+AI_LOGS_SEED_USERS = 200  # Users with interactions inside the one-hour window the rebuild reads
+AI_LOGS_VIEWS_PER_USER = 20
+AI_LOGS_WISHLIST_PER_USER = 5
+AI_LOGS_CART_ITEMS_PER_USER = 3
+AI_LOGS_ROUNDS = 5  # Server restarts; each one resets the route's in-process 5-minute throttle
+AI_LOGS_CONCURRENT_VISITS = 20  # Simultaneous /featured visits per round
+AI_LOGS_REGRESSION_TOLERANCE = 1.25  # Fail if rows per visit or duplication exceed the best recorded run (update p95: the median run) by this factor
+
+# /api/products/featured throughput and pricing consistency
+FEATURED_CONCURRENCY_LEVELS = [1, 8, 32, 64]
+FEATURED_REQUESTS_PER_LEVEL = 200
+FEATURED_P95_BUDGET_MS = 500  # p95 at the highest concurrency level
+
+# Same-user concurrent cart mutations (tests/test_perf_cart_race.py)
+CART_RACE_BURST = 10  # Parallel calls per burst
+CART_RACE_ROUNDS = 5  # Bursts per scenario, each from a wiped cart
+CART_RACE_ASSERT_INCREMENTS = False  # PUT /api/cart/update takes an absolute quantity; enable once it accepts deltas or versions
+
+# Incremental catalog loader (python -m tests.catalog)
+CATALOG_DIR = os.path.join(PROJECT_ROOT, "constants")
+CATALOG_HASH_TABLE = "catalog_hashes"  # Side table: catalog pid -> product id and content hash
+CATALOG_BATCH_SIZE = 500  # Rows per multi-row INSERT
+CATALOG_INCREMENTAL_BUDGET_S = 1.0  # Re-seeding after a one-product edit must finish within this
+
+# Order-history scaling for heavy buyers (tests/test_perf_order_history.py)
+ORDER_HISTORY_SIZES = [1, 10, 100, 1000, 5000]  # Orders seeded per user; one user per size
+ORDER_HISTORY_DAYS = 4 * 365  # Seeded order dates spread over this many days
+ORDER_HISTORY_REQUESTS = 10  # Timed calls per endpoint and user
+ORDER_HISTORY_RENDER_TIMEOUT = 120  # seconds for /orders to render the largest history
+ORDER_HISTORY_P95_BUDGET_MS = 1000  # /api/orders p95 above this marks the history size that needs pagination
+ORDER_HISTORY_PAYLOAD_BUDGET_BYTES = 1_000_000  # Same, for the /api/orders response size
+
+# Local mirror for external storefront images (python -m tests.image_mirror, pytest --image-mirror)
+IMAGE_MIRROR_DIR = os.path.join(PROJECT_ROOT, "tests", "image_mirror")
+IMAGE_MIRROR_HOSTS = ["images.unsplash.com", "i.pravatar.cc"]
+IMAGE_MIRROR_WIDTH = 1200  # Pixels; mirrored copies are fetched at this width and served for every requested width
+IMAGE_MIRROR_LOADS = 5  # Cold home-page loads per mode in TC-PERF-021
+# Mirror archive (python -m tests.image_mirror --pack) unpacked into an empty mirror on isolated CI
+IMAGE_MIRROR_ARCHIVE = os.environ.get("IMAGE_MIRROR_ARCHIVE")
+
+# Category browsing benchmark (tests/test_perf_category_pages.py)
+CATEGORY_STRESS_SLUG = "apparel"  # Largest category; walked by several clients at once
+CATEGORY_STRESS_WALKERS = 16  # Concurrent clients each walking every page of CATEGORY_STRESS_SLUG
+CATEGORY_P95_BUDGET_MS = 500  # /api/category p95 under the stress walk
+
+# Semester-start sign-up/login storm (python -m tests.auth_storm, tests/test_perf_auth_storm.py)
+AUTH_STORM_RATES = [5, 10, 20, 40, 80]  # Offered auth requests/s (sign-ups + logins) at each step
+AUTH_STORM_SIGNUP_SHARE = 0.3  # Fraction of the offered rate that is sign-ups
+AUTH_STORM_STEP_SECONDS = 20  # Measured duration at each rate
+AUTH_STORM_LOGIN_USERS = 50  # Existing accounts the logins rotate through
+AUTH_STORM_WORKERS = 256  # Concurrent in-flight requests
+AUTH_STORM_PROBE_INTERVAL = 0.25  # seconds between probe requests to each probe route
+AUTH_STORM_P95_BUDGET_MS = 1000  # A rate is sustainable if sign-up and login p95 stay within this...
+AUTH_STORM_MAX_ERROR_RATE = 0.01  # ...at most this fraction fails...
+AUTH_STORM_MIN_THROUGHPUT = 0.95  # ...and at least this fraction of the offered rate completes
+
+# Timing-variance analysis (pytest --timing-reruns K, python -m tests.timing_variance)
+TIMING_VARIANCE_NOISY_CV = 0.2  # stdev/mean at or above this marks a test as noisy...
+TIMING_VARIANCE_NOISE_FLOOR_S = 0.5  # ...if its stdev is also at least this many seconds
+TIMING_VARIANCE_SLOW_S = 10  # A test whose fastest run takes at least this long is slow
+TIMING_VARIANCE_TIMEOUT_SLACK = 0.95  # An empty implicit-wait lookup this close to the timeout counts as hitting it
@@ -2,6 +2,8 @@
 Pytest configuration file for Selenium fixtures.
 """
 
+from collections import Counter
+
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -10,33 +12,250 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from tests.config import BASE_URL, VALID_EMAIL, VALID_PASSWORD
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from tests.config import BASE_URL, VALID_EMAIL, VALID_PASSWORD, DEVICE_PROFILES, DEVICE_PROFILE_LOAD_BUDGETS_MS, WEBDRIVER_URL
+from tests.cdp import apply_device_profile, navigation_load_ms
+from tests.interactions import interaction_latencies
 
-@pytest.fixture(scope="session")
-def driver():
-    """Provides a Selenium WebDriver instance (Chrome) for the test session."""
+# Page load timings recorded under --device-profile, written to perf_results/ at session end
+device_profile_timings = []
+# External images requested under --image-mirror that the mirror does not have
+image_mirror_misses = Counter()
+
+def pytest_addoption(parser):
+    """Registers command line switches for the benchmark suite."""
+    parser.addoption("--perf", action="store_true", default=False, help="Run performance benchmarks (tests marked 'perf').")
+    parser.addoption("--sql-accounting", default=None, choices=["test", "request"],
+                     help="Attribute MySQL statements to each test or each API request and flag N+1 candidates.")
+    parser.addoption("--device-profile", default=None, choices=sorted(DEVICE_PROFILES),
+                     help="Emulate a throttled mobile device (CPU, network, viewport) in every browser.")
+    parser.addoption("--asset-budgets", action="store_true", default=False,
+                     help="Measure JS/CSS/image/font bytes per route and fail on routes over tests/asset_budgets.json.")
+    parser.addoption("--update-asset-budgets", action="store_true", default=False,
+                     help="Like --asset-budgets, but rewrite tests/asset_budgets.json from the measured sizes.")
+    parser.addoption("--image-mirror", action="store_true", default=False,
+                     help="Serve external images from the local mirror (tests/image_mirror.py) instead of the CDN.")
+    parser.addoption("--timing-reruns", type=int, default=None, metavar="K",
+                     help="Run every selected test K times and rank tests by duration variance and wasted wait.")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: performance benchmark, only runs with --perf")
+    mode = config.getoption("--sql-accounting")
+    if mode:
+        from tests.query_accounting import QueryAccounting
+        config.pluginmanager.register(QueryAccounting(mode), "sql-accounting")
+    if asset_budgets_enabled(config):
+        from tests.asset_budgets import AssetBudgets
+        config.pluginmanager.register(AssetBudgets(update=config.getoption("--update-asset-budgets")), "asset-budgets")
+    reruns = config.getoption("--timing-reruns")
+    if reruns:
+        from tests.timing_variance import TimingVariance
+        config.pluginmanager.register(TimingVariance(reruns), "timing-variance")
+
+def pytest_collection_modifyitems(config, items):
+    """Skips benchmarks unless --perf is given, so the functional suite stays fast."""
+    if config.getoption("--perf"):
+        return
+    skip_perf = pytest.mark.skip(reason="Performance benchmark; run with --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+def pytest_sessionfinish(session):
+    profile = session.config.getoption("--device-profile")
+    if profile and device_profile_timings:
+        from tests.perf import write_report
+        write_report(f"device_profile_{profile}", {"profile": profile, "tests": device_profile_timings})
+    if image_mirror_misses:
+        # Under --image-mirror a missing image is a silent 404 in the page, so it fails the run here
+        from tests.perf import write_report
+        write_report("image_mirror_misses", {"misses": dict(image_mirror_misses)})
+        session.exitstatus = 1
+
+def pytest_terminal_summary(terminalreporter):
+    """Reports click-to-paint latency per interaction type collected by tests.interactions,
+    the per-locator query cost collected by the page objects in tests.pages, and any image
+    the --image-mirror mirror did not have."""
+    from tests.pages import locator_costs
+    from tests.perf import summarize, write_report
+    if interaction_latencies:
+        summary = {kind: summarize(samples) for kind, samples in sorted(interaction_latencies.items())}
+        write_report("interaction_latency", {"interactions": summary})
+        terminalreporter.section("interaction latency (click to paint)")
+        for kind, stats in summary.items():
+            terminalreporter.write_line(f"{kind:<18} n={stats['count']:<4} p50={stats['p50']:>8.1f}ms  p95={stats['p95']:>8.1f}ms")
+    if locator_costs:
+        costs = dict(sorted(locator_costs.items(), key=lambda item: -item[1]["total_ms"]))
+        write_report("locator_costs", {"locators": costs})
+        terminalreporter.section("locator query cost")
+        terminalreporter.write_line(f"{'locator':<32} {'queries':>8} {'cache hits':>11} {'stale':>6} {'total':>10}")
+        for name, cost in costs.items():
+            terminalreporter.write_line(
+                f"{name:<32} {cost['queries']:>8} {cost['cache_hits']:>11} {cost['stale_refreshes']:>6} {cost['total_ms']:>8.0f}ms"
+            )
+    if image_mirror_misses:
+        terminalreporter.section("images missing from the mirror (served as 404)")
+        for url, count in sorted(image_mirror_misses.items()):
+            terminalreporter.write_line(f"{count:>5}x {url}", red=True)
+        terminalreporter.write_line("Refresh the mirror with `python -m tests.image_mirror` and re-pack its archive")
+
+def asset_budgets_enabled(config):
+    return config.getoption("--asset-budgets") or config.getoption("--update-asset-budgets")
+
+def chrome_options(performance_logging=False):
+    """Builds the Chrome options shared by every driver fixture."""
     options = webdriver.ChromeOptions()
     # Add any desired options (e.g., headless mode)
     # options.add_argument("--headless")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
-    
-    service = ChromeService(ChromeDriverManager().install())
-    _driver = webdriver.Chrome(service=service, options=options)
+    if performance_logging:
+        # Exposes CDP Network.* events through driver.get_log("performance")
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+class RemoteChrome(webdriver.Remote):
+    """Chrome on a remote WebDriver endpoint that keeps the CDP and log commands used by the benchmarks."""
+
+    def __init__(self, url, options):
+        super().__init__(command_executor=ChromiumRemoteConnection(url, "goog", "chrome"), options=options)
+
+    def get_log(self, log_type):
+        return self.execute("getLog", {"type": log_type})["value"]
+
+def create_chrome(options):
+    """Starts Chrome with the suite's implicit wait, on WEBDRIVER_URL if set, locally otherwise."""
+    if WEBDRIVER_URL and not options.debugger_address:
+        _driver = RemoteChrome(WEBDRIVER_URL, options)
+    else:
+        service = ChromeService(ChromeDriverManager().install())
+        _driver = webdriver.Chrome(service=service, options=options)
     _driver.implicitly_wait(5) # Implicit wait for element finding
+    return _driver
+
+def apply_selected_device_profile(config, _driver):
+    """Applies the --device-profile emulation, if one was selected."""
+    profile = config.getoption("--device-profile")
+    if profile:
+        apply_device_profile(_driver, DEVICE_PROFILES[profile])
+
+def start_image_mirror(config, _driver):
+    """Starts serving external images from the local mirror if --image-mirror was given; returns the mirror or None."""
+    if not config.getoption("--image-mirror"):
+        return None
+    from tests.image_mirror import ImageMirror, ensure_filled
+    ensure_filled()
+    return ImageMirror(_driver).start()
+
+def stop_image_mirror(mirror):
+    """Stops the mirror and records the images it had to answer with a 404."""
+    if mirror:
+        mirror.stop()
+        image_mirror_misses.update(mirror.misses)
+
+@pytest.fixture(scope="session")
+def driver(request):
+    """Provides a Selenium WebDriver instance (Chrome) for the test session."""
+    measure_assets = asset_budgets_enabled(request.config)
+    _driver = create_chrome(chrome_options(performance_logging=measure_assets))
+    if measure_assets:
+        # Every load transfers its full payload, so byte totals do not depend on test order
+        _driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+    apply_selected_device_profile(request.config, _driver)
+    mirror = start_image_mirror(request.config, _driver)
     yield _driver
+    stop_image_mirror(mirror)
     _driver.quit()
 
+@pytest.fixture(scope="function")
+def perf_driver(request):
+    """Provides a fresh Chrome (empty profile and cache) with CDP performance logging enabled."""
+    _driver = create_chrome(chrome_options(performance_logging=True))
+    apply_selected_device_profile(request.config, _driver)
+    mirror = start_image_mirror(request.config, _driver)
+    yield _driver
+    stop_image_mirror(mirror)
+    _driver.quit()
+
+@pytest.fixture(scope="session")
+def browser_context_pool():
+    """Provides one Chrome that hands out isolated browser contexts (see tests/browser_contexts.py)."""
+    from tests.browser_contexts import BrowserContextPool
+    pool = BrowserContextPool()
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="function")
+def context_sessions(browser_context_pool):
+    """Factory fixture: context_sessions(n) returns n (driver, wait) pairs, each in its own isolated context."""
+    created = []
+    def create(count):
+        sessions = [browser_context_pool.new_context() for _ in range(count)]
+        created.extend(sessions)
+        return sessions
+    yield create
+    for _driver, _ in created:
+        browser_context_pool.dispose(_driver)
+
+@pytest.fixture(scope="function")
+def context_driver(browser_context_pool):
+    """Drop-in for `driver`: a fresh isolated context (own cookies and storage) in the shared Chrome."""
+    _driver, _ = browser_context_pool.new_context()
+    yield _driver
+    browser_context_pool.dispose(_driver)
+
+@pytest.fixture(scope="function")
+def context_wait(context_driver):
+    """Drop-in for `wait`, bound to context_driver."""
+    return WebDriverWait(context_driver, 10)
+
+@pytest.fixture(scope="session")
+def account_pool():
+    """Provides the session's pool of pre-provisioned test accounts (see tests/accounts.py)."""
+    from tests.accounts import AccountPool
+    pool = AccountPool()
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="function")
+def leased_account(account_pool):
+    """Leases a test account (dict with id, email, password, token) and wipes its data on return."""
+    account = account_pool.lease()
+    yield account
+    account_pool.release(account)
+
+@pytest.fixture(scope="function")
+def leased_driver(driver, leased_account):
+    """Provides the driver signed in as a freshly leased account."""
+    from tests.accounts import AUTH_COOKIE, sign_in_browser
+    sign_in_browser(driver, leased_account)
+    yield driver
+    driver.delete_cookie(AUTH_COOKIE)
+
+@pytest.fixture(autouse=True)
+def device_profile_budget(request):
+    """Under --device-profile, checks the test's final page load against DEVICE_PROFILE_LOAD_BUDGETS_MS."""
+    profile = request.config.getoption("--device-profile")
+    module = request.module.__name__.rsplit(".", 1)[-1]
+    budget = DEVICE_PROFILE_LOAD_BUDGETS_MS.get(profile, {}).get(module)
+    yield
+    if budget is None or "driver" not in request.fixturenames:
+        return
+    load_ms = navigation_load_ms(request.getfixturevalue("driver"))
+    device_profile_timings.append({"test": request.node.nodeid, "load_ms": load_ms, "budget_ms": budget})
+    if load_ms is not None and load_ms > budget:
+        pytest.fail(f"Page load {load_ms:.0f}ms exceeds the {budget}ms budget for {module} on {profile}")
+
 @pytest.fixture(scope="function")
 def wait(driver):
     """Provides a WebDriverWait instance for explicit waits."""
     return WebDriverWait(driver, 10) # 10-second timeout
 
-def login(driver, wait):
+def login(driver, wait, email=VALID_EMAIL, password=VALID_PASSWORD):
     """Helper function to perform login."""
     driver.get(f"{BASE_URL}/login")
-    wait.until(EC.presence_of_element_located((By.ID, "email"))).send_keys(VALID_EMAIL)
-    driver.find_element(By.ID, "password").send_keys(VALID_PASSWORD)
+    wait.until(EC.presence_of_element_located((By.ID, "email"))).send_keys(email)
+    driver.find_element(By.ID, "password").send_keys(password)
     driver.find_element(By.XPATH, "//button[contains(text(), 'Login')]").click()
     # Wait for successful login indicator (e.g., user menu or specific element on home page)
     try:
@@ -0,0 +1,225 @@
+"""
+Direct MySQL access for benchmark seeding and query accounting.
+
+Connection settings come from the same variables as database/db.js (DB_HOST, DB_USER,
+DB_PASSWORD, DB_NAME, DB_PORT), read from the environment or the project's .env file.
+"""
+import hashlib
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pymysql
+import pymysql.cursors
+
+from tests.config import PROJECT_ROOT, VALID_EMAIL
+
+SEED_BATCH_SIZE = 5000
+
+def _load_dotenv(path=os.path.join(PROJECT_ROOT, ".env")):
+    """Reads KEY=VALUE pairs from .env without overriding variables already set."""
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            os.environ.setdefault(key.strip(), value.strip().strip("'\""))
+
+def db_settings():
+    """Returns pymysql connection kwargs for the application database."""
+    _load_dotenv()
+    missing = [name for name in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME") if name not in os.environ]
+    if missing:
+        raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+    return {
+        "host": os.environ["DB_HOST"],
+        "user": os.environ["DB_USER"],
+        "password": os.environ["DB_PASSWORD"],
+        "database": os.environ["DB_NAME"],
+        "port": int(os.environ.get("DB_PORT", 3306)),
+    }
+
+@contextmanager
+def connect(**overrides):
+    """Yields a DictCursor connection that commits on success and rolls back on error."""
+    connection = pymysql.connect(**{**db_settings(), "cursorclass": pymysql.cursors.DictCursor, **overrides})
+    try:
+        yield connection
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+def insert_many(cursor, sql, rows, batch_size=SEED_BATCH_SIZE):
+    """Runs executemany in batches so large seeds stay within max_allowed_packet.
+
+    pymysql only turns an INSERT into one multi-row statement per batch when its VALUES clause
+    holds nothing but placeholders, so an INSERT with literal values is rejected rather than
+    silently sent row by row.
+    """
+    if sql.lstrip().upper().startswith(("INSERT", "REPLACE")) and not pymysql.cursors.RE_INSERT_VALUES.match(sql):
+        raise ValueError(f"INSERT would not be batched; use only placeholders in VALUES: {sql}")
+    for start in range(0, len(rows), batch_size):
+        cursor.executemany(sql, rows[start:start + batch_size])
+
+def product_ids(cursor):
+    cursor.execute("SELECT id FROM products ORDER BY id")
+    return [row["id"] for row in cursor.fetchall()]
+
+def product_prices(cursor):
+    """Returns [(id, price)] for every product."""
+    cursor.execute("SELECT id, price FROM products ORDER BY id")
+    return [(row["id"], row["price"]) for row in cursor.fetchall()]
+
+ORDER_STATUSES = ["pending", "processing", "shipped", "delivered", "cancelled"]
+# Address, city, state, zip, phone and email shared by every seeded order
+SEED_SHIPPING = ("701 S Nedderman Dr", "Arlington", "TX", "76019", "8172722011", "perf@mavs.uta.edu")
+SEED_SHIPPING_FEE = Decimal("5.99")
+SEED_TAX_RATE = Decimal("0.0825")
+
+def seed_orders(cursor, user_ids, products, count, history_days, rng, max_items=4):
+    """Bulk-creates `count` orders (1 to max_items items each) for user_ids, dated over the last history_days.
+
+    products is [(id, price)] as returned by product_prices. Returns the number of order_items created.
+    """
+    now = datetime.now()
+    cursor.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM orders")
+    first_new_id = cursor.fetchone()["max_id"]
+    carts = []
+    for _ in range(count):
+        lines = [(rng.choice(products), rng.randint(1, 3)) for _ in range(rng.randint(1, max_items))]
+        subtotal = sum(price * quantity for (_, price), quantity in lines)
+        carts.append((rng.choice(user_ids), now - timedelta(seconds=rng.randint(0, history_days * 86400)), subtotal, lines))
+    insert_many(cursor, (
+        "INSERT INTO orders (user_id, order_date, shipping_address, shipping_city, shipping_state, shipping_zip, "
+        "shipping_phone, shipping_email, payment_method, subtotal, shipping_fee, tax, total_amount, status, created_at) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+    ), [
+        (user_id, created, *SEED_SHIPPING, "Credit Card", subtotal, SEED_SHIPPING_FEE, round(subtotal * SEED_TAX_RATE, 2),
+         round(subtotal * (1 + SEED_TAX_RATE) + SEED_SHIPPING_FEE, 2), rng.choice(ORDER_STATUSES), created)
+        for user_id, created, subtotal, _ in carts
+    ])
+    # Match the new order ids back to their carts by insertion order
+    cursor.execute("SELECT id FROM orders WHERE id > %s ORDER BY id LIMIT %s", (first_new_id, count))
+    order_ids = [row["id"] for row in cursor.fetchall()]
+    items = [
+        (order_id, product_id, quantity, price)
+        for order_id, (_, _, _, lines) in zip(order_ids, carts)
+        for (product_id, price), quantity in lines
+    ]
+    insert_many(cursor, "INSERT INTO order_items (order_id, product_id, quantity, price) VALUES (%s, %s, %s, %s)", items)
+    return len(items)
+
+def known_password_hash(cursor):
+    """Returns the bcrypt hash stored for VALID_EMAIL so seeded users share the known test password."""
+    cursor.execute("SELECT password FROM users WHERE email = %s", (VALID_EMAIL,))
+    row = cursor.fetchone()
+    if row is None:
+        raise RuntimeError(f"Test user {VALID_EMAIL} does not exist; create it before seeding benchmark users")
+    return row["password"]
+
+def create_users(cursor, prefix, count, password_hash):
+    """Bulk-creates users named <prefix>-<n>@mavs.uta.edu and returns [(id, email)] in creation order."""
+    student_prefix = hashlib.md5(prefix.encode()).hexdigest()[:6].upper()
+    rows = [
+        (f"Perf {prefix} {n}", f"{prefix}-{n}@mavs.uta.edu", password_hash, f"P{student_prefix}{n}", "2000-01-01", True)
+        for n in range(count)
+    ]
+    insert_many(cursor, (
+        "INSERT INTO users (name, email, password, student_id, date_of_birth, agree_to_terms) "
+        "VALUES (%s, %s, %s, %s, %s, %s)"
+    ), rows)
+    cursor.execute("SELECT id, email FROM users WHERE email LIKE %s ORDER BY id", (f"{prefix}-%@mavs.uta.edu",))
+    return [(row["id"], row["email"]) for row in cursor.fetchall()]
+
+def ensure_user(cursor, email, name, password_hash, student_id):
+    """Returns the id of the user with this email, creating it first if needed."""
+    cursor.execute("SELECT id FROM users WHERE email = %s", (email,))
+    row = cursor.fetchone()
+    if row:
+        return row["id"]
+    cursor.execute(
+        "INSERT INTO users (name, email, password, student_id, date_of_birth, agree_to_terms) "
+        "VALUES (%s, %s, %s, %s, '2000-01-01', TRUE)",
+        (name, email, password_hash, student_id),
+    )
+    return cursor.lastrowid
+
+def delete_users(cursor, prefix):
+    """Deletes users created by create_users; their carts, logs and orders go with them via ON DELETE CASCADE."""
+    cursor.execute("DELETE FROM users WHERE email LIKE %s", (f"{prefix}-%@mavs.uta.edu",))
+    return cursor.rowcount
+
+# Per-user rows a test can leave behind; child rows (cart_items, order_items, payments,
+# support_chat_messages) go with them via ON DELETE CASCADE
+USER_DATA_TABLES = ["carts", "wishlists", "orders", "browsing_history", "ai_recommendation_logs", "support_chat_sessions"]
+
+def wipe_user_data(cursor, user_id):
+    """Deletes everything a user has done (cart, wishlist, orders, history, chats) but keeps the account."""
+    for table in USER_DATA_TABLES:
+        cursor.execute(f"DELETE FROM {table} WHERE user_id = %s", (user_id,))
+
+def user_data_counts(cursor, user_id):
+    """Returns {table: rows} of the user's rows in each of USER_DATA_TABLES."""
+    counts = {}
+    for table in USER_DATA_TABLES:
+        cursor.execute(f"SELECT COUNT(*) AS count FROM {table} WHERE user_id = %s", (user_id,))
+        counts[table] = cursor.fetchone()["count"]
+    return counts
+
+# --- performance_schema statement accounting ---
+
+def global_status(cursor, names):
+    """Returns {name: int} for the given SHOW GLOBAL STATUS counters (e.g. Questions, Threads_running)."""
+    cursor.execute(
+        "SELECT VARIABLE_NAME, VARIABLE_VALUE FROM performance_schema.global_status WHERE VARIABLE_NAME IN ("
+        + ", ".join(["%s"] * len(names)) + ")",
+        tuple(names),
+    )
+    return {row["VARIABLE_NAME"]: int(row["VARIABLE_VALUE"]) for row in cursor.fetchall()}
+
+def digest_snapshot(cursor, schema=None):
+    """Returns {digest: row} from performance_schema.events_statements_summary_by_digest."""
+    cursor.execute(
+        """
+        SELECT DIGEST, DIGEST_TEXT, COUNT_STAR, SUM_TIMER_WAIT, SUM_ROWS_EXAMINED, SUM_ROWS_SENT, SUM_LOCK_TIME
+        FROM performance_schema.events_statements_summary_by_digest
+        WHERE SCHEMA_NAME = %s
+        """,
+        (schema or db_settings()["database"],),
+    )
+    return {row["DIGEST"]: row for row in cursor.fetchall()}
+
+def digest_delta(before, after, text_filter=None):
+    """Returns per-digest differences between two snapshots, dropping digests with no new executions
+    and the snapshot queries themselves.
+
+    Timer columns are converted from picoseconds to milliseconds.
+    """
+    delta = []
+    for digest, row in after.items():
+        base = before.get(digest, {})
+        count = row["COUNT_STAR"] - base.get("COUNT_STAR", 0)
+        if count <= 0:
+            continue
+        text = row["DIGEST_TEXT"] or ""
+        if "performance_schema" in text:
+            continue  # The snapshot queries themselves
+        if text_filter and text_filter.lower() not in text.lower():
+            continue
+        delta.append({
+            "digest": digest,
+            "text": text,
+            "count": count,
+            "total_ms": (row["SUM_TIMER_WAIT"] - base.get("SUM_TIMER_WAIT", 0)) / 1e9,
+            "lock_ms": (row["SUM_LOCK_TIME"] - base.get("SUM_LOCK_TIME", 0)) / 1e9,
+            "rows_examined": row["SUM_ROWS_EXAMINED"] - base.get("SUM_ROWS_EXAMINED", 0),
+            "rows_sent": row["SUM_ROWS_SENT"] - base.get("SUM_ROWS_SENT", 0),
+        })
+    return sorted(delta, key=lambda d: d["total_ms"], reverse=True)
@@ -0,0 +1,260 @@
+"""
+Distributes test modules across several remote WebDriver endpoints.
+
+    python -m tests.distributed --endpoints http://ci-a:4444,http://ci-b:4444 -- --perf
+    python -m tests.distributed --spawn-chromedrivers 4            # local chromedrivers on 9515..
+
+Each endpoint is a node. Test modules (slowest first, using the previous run's timings) are
+dealt round-robin into per-node queues. Every node runs its modules one at a time as a pytest
+subprocess with WEBDRIVER_URL pointing at the node, so conftest.create_chrome opens the browser
+there. A node that empties its queue steals from the back of the longest remaining queue. Nodes
+are health-checked (GET /status) before each module; a module that fails while its node went
+unhealthy is put back for another node. JUnit results and perf_results/ artifacts from every
+subprocess are merged into one report at the end.
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+
+import requests
+
+from tests.config import (
+    DISTRIBUTED_CHROMEDRIVER_BASE_PORT,
+    DISTRIBUTED_MAX_ATTEMPTS,
+    PERF_RESULTS_DIR,
+    PROJECT_ROOT,
+    WEBDRIVER_ENDPOINTS,
+    WEBDRIVER_HEALTH_TIMEOUT,
+)
+from tests.perf import load_history, write_report
+
+REPORT_NAME = "distributed_run"
+TESTS_DIR = os.path.join(PROJECT_ROOT, "tests")
+PYTEST_OK = (0, 5)  # 5: no tests collected (e.g. a perf-only module without --perf)
+
+# --- Helper Functions ---
+
+def node_healthy(url):
+    """True when the WebDriver endpoint reports it can create new sessions."""
+    try:
+        response = requests.get(f"{url.rstrip('/')}/status", timeout=WEBDRIVER_HEALTH_TIMEOUT)
+        return response.ok and response.json().get("value", {}).get("ready", False)
+    except (requests.RequestException, ValueError):
+        return False
+
+def discover_modules():
+    """Returns test module paths relative to the project root, slowest first by the last recorded run."""
+    modules = sorted(os.path.relpath(path, PROJECT_ROOT) for path in glob.glob(os.path.join(TESTS_DIR, "test_*.py")))
+    history = load_history(REPORT_NAME)
+    durations = {}
+    if history:
+        for node in history[-1]["nodes"]:
+            for run in node["runs"]:
+                durations[run["module"]] = run["seconds"]
+    return sorted(modules, key=lambda module: durations.get(module, 0), reverse=True)
+
+def spawn_chromedrivers(count):
+    """Starts `count` local chromedriver processes on consecutive ports and returns (processes, urls)."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    binary = ChromeDriverManager().install()
+    processes, urls = [], []
+    for index in range(count):
+        port = DISTRIBUTED_CHROMEDRIVER_BASE_PORT + index
+        processes.append(subprocess.Popen([binary, f"--port={port}"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        urls.append(f"http://127.0.0.1:{port}")
+    deadline = time.monotonic() + 30
+    while not all(node_healthy(url) for url in urls):
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"chromedriver did not become ready on {urls}")
+        time.sleep(0.5)
+    return processes, urls
+
+class Node:
+    """One WebDriver endpoint with its own queue of modules."""
+
+    def __init__(self, index, url):
+        self.name = f"node{index}"
+        self.url = url
+        self.queue = deque()
+        self.healthy = True
+        self.runs = []
+
+class Coordinator:
+    """Runs test modules on a set of nodes with work stealing and merges what they produce."""
+
+    def __init__(self, endpoints, pytest_args, run_dir):
+        self.nodes = [Node(index, url) for index, url in enumerate(endpoints)]
+        self.pytest_args = pytest_args
+        self.run_dir = run_dir
+        self.attempts = {}
+        self._lock = threading.Lock()
+
+    def distribute(self, modules):
+        for index, module in enumerate(modules):
+            self.nodes[index % len(self.nodes)].queue.append(module)
+
+    def next_module(self, node):
+        """Takes the node's next module, or steals the last one from the longest other queue."""
+        with self._lock:
+            if node.queue:
+                return node.queue.popleft()
+            victim = max(self.nodes, key=lambda other: len(other.queue))
+            return victim.queue.pop() if victim.queue else None
+
+    def run_module(self, node, module):
+        """Runs one module on the node in a pytest subprocess; returns its run record."""
+        stem = os.path.splitext(os.path.basename(module))[0]
+        with self._lock:
+            attempt = self.attempts[module] = self.attempts.get(module, 0) + 1
+        output_dir = os.path.join(self.run_dir, node.name, f"{stem}-{attempt}")
+        os.makedirs(output_dir, exist_ok=True)
+        env = {**os.environ, "WEBDRIVER_URL": node.url, "PERF_RESULTS_DIR": os.path.join(output_dir, "perf_results")}
+        command = [sys.executable, "-m", "pytest", module, "-p", "no:cacheprovider",
+                   f"--junitxml={os.path.join(output_dir, 'junit.xml')}", *self.pytest_args]
+        started = time.perf_counter()
+        with open(os.path.join(output_dir, "pytest.log"), "w", encoding="utf-8") as log:
+            returncode = subprocess.call(command, cwd=PROJECT_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+        return {"module": module, "attempt": attempt, "returncode": returncode,
+                "seconds": round(time.perf_counter() - started, 2), "output_dir": output_dir}
+
+    def worker(self, node):
+        while True:
+            if not node_healthy(node.url):
+                node.healthy = False
+                print(f"{node.name} ({node.url}) failed its health check; its queue is left to the other nodes")
+                return
+            module = self.next_module(node)
+            if module is None:
+                return
+            run = self.run_module(node, module)
+            node.runs.append(run)
+            print(f"{node.name}: {module} -> exit {run['returncode']} in {run['seconds']}s")
+            if run["returncode"] not in PYTEST_OK and not node_healthy(node.url):
+                with self._lock:
+                    if self.attempts[module] < DISTRIBUTED_MAX_ATTEMPTS:
+                        run["requeued"] = True
+                        node.queue.appendleft(module)  # Stolen by a healthy node once this one retires
+
+    def run(self, modules):
+        self.distribute(modules)
+        threads = [threading.Thread(target=self.worker, args=(node,), name=node.name) for node in self.nodes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return [module for node in self.nodes for module in node.queue]
+
+    def final_runs(self):
+        """The last attempt of every module that ran."""
+        return [run for node in self.nodes for run in node.runs if not run.get("requeued")]
+
+# --- Merging ---
+
+def merge_junit(runs, output_path):
+    """Combines every subprocess's JUnit XML into one <testsuites> document."""
+    merged = ET.Element("testsuites")
+    for run in runs:
+        path = os.path.join(run["output_dir"], "junit.xml")
+        if not os.path.exists(path):
+            continue
+        root = ET.parse(path).getroot()
+        for suite in root.iter("testsuite"):
+            suite.set("name", run["module"])
+            merged.append(suite)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    ET.ElementTree(merged).write(output_path, encoding="utf-8", xml_declaration=True)
+    return output_path
+
+def merge_perf_results(runs, target_dir):
+    """Copies every subprocess's perf_results/ into target_dir.
+
+    History files are appended. A report written by several modules (session-level reports
+    such as interaction_latency) becomes {"runs": [...]} with one entry per module.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+    reports = {}
+    for run in runs:
+        source_dir = os.path.join(run["output_dir"], "perf_results")
+        if not os.path.isdir(source_dir):
+            continue
+        for filename in sorted(os.listdir(source_dir)):
+            source = os.path.join(source_dir, filename)
+            if filename.endswith(".history.jsonl"):
+                with open(source, encoding="utf-8") as new, open(os.path.join(target_dir, filename), "a", encoding="utf-8") as history:
+                    history.write(new.read())
+            elif filename.endswith(".json"):
+                with open(source, encoding="utf-8") as report:
+                    reports.setdefault(filename, []).append({"module": run["module"], **json.load(report)})
+            else:
+                target = os.path.join(target_dir, filename)
+                if os.path.exists(target):
+                    stem, extension = os.path.splitext(filename)
+                    target = os.path.join(target_dir, f"{stem}.{os.path.basename(run['output_dir'])}{extension}")
+                shutil.copyfile(source, target)
+    for filename, records in reports.items():
+        payload = records[0] if len(records) == 1 else {"runs": records}
+        with open(os.path.join(target_dir, filename), "w", encoding="utf-8") as report:
+            json.dump(payload, report, indent=2, default=str)
+
+# --- Entry point ---
+
+def parse_args(argv=None):
+    """Returns (parser, options, pytest args). Everything after the first `--` goes to pytest untouched."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    pytest_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, pytest_args = argv[:split], argv[split + 1:]
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--endpoints", default=",".join(WEBDRIVER_ENDPOINTS),
+                        help="Comma-separated WebDriver URLs (default: $WEBDRIVER_ENDPOINTS).")
+    parser.add_argument("--spawn-chromedrivers", type=int, default=0,
+                        help="Start this many local chromedrivers and use them as the nodes.")
+    parser.add_argument("modules", nargs="*", help="Test modules to run (default: every tests/test_*.py).")
+    return parser, parser.parse_args(argv), pytest_args
+
+def main(argv=None):
+    parser, args, pytest_args = parse_args(argv)
+    processes, endpoints = [], [url for url in args.endpoints.split(",") if url]
+    if args.spawn_chromedrivers:
+        processes, endpoints = spawn_chromedrivers(args.spawn_chromedrivers)
+    if not endpoints:
+        parser.error("No endpoints: pass --endpoints, set WEBDRIVER_ENDPOINTS or use --spawn-chromedrivers")
+
+    run_dir = os.path.join(PERF_RESULTS_DIR, "distributed", time.strftime("%Y%m%d-%H%M%S"))
+    coordinator = Coordinator(endpoints, pytest_args, run_dir)
+    try:
+        not_run = coordinator.run(args.modules or discover_modules())
+    finally:
+        for process in processes:
+            process.terminate()
+
+    runs = coordinator.final_runs()
+    junit_path = merge_junit(runs, os.path.join(run_dir, "junit.xml"))
+    merge_perf_results(runs, PERF_RESULTS_DIR)
+    write_report(REPORT_NAME, {
+        "nodes": [{"name": node.name, "url": node.url, "healthy": node.healthy,
+                   "runs": [{k: v for k, v in run.items() if k != "output_dir"} for run in node.runs]}
+                  for node in coordinator.nodes],
+        "not_run": not_run,
+        "junit": junit_path,
+    })
+
+    failed = [run["module"] for run in runs if run["returncode"] not in PYTEST_OK]
+    print(f"\n{len(runs)} modules on {len(endpoints)} nodes; {len(failed)} failed, {len(not_run)} not run. JUnit: {junit_path}")
+    for module in failed:
+        print(f"  FAILED  {module}")
+    for module in not_run:
+        print(f"  NOT RUN {module}")
+    return 1 if failed or not_run else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""
+Local mirror for the external images on the storefront pages.
+
+    python -m tests.image_mirror                        # pre-fetch every external image the app references
+    python -m tests.image_mirror --check                # list referenced images missing from the mirror
+    python -m tests.image_mirror --pack mirror.tar.gz   # archive the mirror as a CI artifact
+    python -m tests.image_mirror --unpack mirror.tar.gz # restore it where there is no network
+
+The home page hero, category cards and testimonials load images from IMAGE_MIRROR_HOSTS. They
+are requested either directly or through Next's /_next/image optimizer, which fetches them from
+the CDN on the server. `ImageMirror` attaches a second CDP client to the driver's tab and enables
+Fetch for those URLs. It answers each Fetch.requestPaused from IMAGE_MIRROR_DIR, so no image
+request reaches the CDN or the optimizer. An image missing from the mirror gets a 404 and is
+counted in `misses`. Every other request continues untouched.
+
+Each image is stored once per source URL, fetched IMAGE_MIRROR_WIDTH pixels wide through the
+CDN's own resize parameter, and served for every width the page asks for. manifest.json maps
+source URLs to files. The mirror directory is ignored by git. A job with network access
+fills it and publishes it with --pack. An isolated CI job restores that artifact with --unpack, or
+sets IMAGE_MIRROR_ARCHIVE so `--image-mirror` unpacks it into an empty mirror before the first
+test. Under `--image-mirror`, any image missing from the mirror fails the session (see conftest).
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import sys
+import tarfile
+import threading
+from collections import Counter
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+import requests
+import websocket
+
+from tests.config import IMAGE_MIRROR_ARCHIVE, IMAGE_MIRROR_DIR, IMAGE_MIRROR_HOSTS, IMAGE_MIRROR_WIDTH, PROJECT_ROOT
+
+SOURCE_DIRS = ["app", "components", "constants"]
+SOURCE_EXTENSIONS = (".js", ".jsx")
+MANIFEST_FILE = "manifest.json"
+NEXT_IMAGE_PATH = "/_next/image"
+EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp", "image/avif": ".avif"}
+
+# --- Mirror contents ---
+
+def source_url(request_url):
+    """Returns the external image URL a browser request is for, directly or via /_next/image, or None."""
+    parsed = urlparse(request_url)
+    if parsed.path == NEXT_IMAGE_PATH:
+        request_url = parse_qs(parsed.query).get("url", [""])[0]
+    return request_url if urlparse(request_url).hostname in IMAGE_MIRROR_HOSTS else None
+
+def referenced_urls(root=PROJECT_ROOT):
+    """Returns every IMAGE_MIRROR_HOSTS URL that appears in the app's source files, sorted."""
+    pattern = re.compile(r"https://(?:" + "|".join(re.escape(host) for host in IMAGE_MIRROR_HOSTS) + r")/[^\s\"'`)]+")
+    urls = set()
+    for source_dir in SOURCE_DIRS:
+        for directory, _, filenames in os.walk(os.path.join(root, source_dir)):
+            for filename in filenames:
+                if filename.endswith(SOURCE_EXTENSIONS):
+                    with open(os.path.join(directory, filename), encoding="utf-8") as source:
+                        urls.update(pattern.findall(source.read()))
+    return sorted(urls)
+
+def resized(url):
+    """Asks the CDN for an IMAGE_MIRROR_WIDTH-wide copy when the URL carries a `w` parameter (as Unsplash's do)."""
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    if "w" not in query:
+        return url
+    query["w"] = [str(IMAGE_MIRROR_WIDTH)]
+    return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
+def load_manifest(mirror_dir=IMAGE_MIRROR_DIR):
+    """Returns {source URL: {"file", "content_type", "bytes"}}, or {} for an empty mirror."""
+    path = os.path.join(mirror_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as manifest:
+        return json.load(manifest)
+
+def prefetch(urls, mirror_dir=IMAGE_MIRROR_DIR, refresh=False):
+    """Downloads every URL not yet mirrored (all of them with refresh=True) and returns (fetched, failed)."""
+    os.makedirs(mirror_dir, exist_ok=True)
+    manifest = load_manifest(mirror_dir)
+    fetched, failed = [], []
+    for url in urls:
+        if url in manifest and not refresh:
+            continue
+        try:
+            response = requests.get(resized(url), timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"Could not fetch {url}: {e}")
+            failed.append(url)
+            continue
+        content_type = response.headers.get("Content-Type", "image/jpeg").split(";")[0]
+        filename = hashlib.sha1(url.encode()).hexdigest()[:16] + EXTENSIONS.get(content_type, ".img")
+        with open(os.path.join(mirror_dir, filename), "wb") as image:
+            image.write(response.content)
+        manifest[url] = {"file": filename, "content_type": content_type, "bytes": len(response.content)}
+        fetched.append(url)
+    with open(os.path.join(mirror_dir, MANIFEST_FILE), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    return fetched, failed
+
+def pack(archive, mirror_dir=IMAGE_MIRROR_DIR):
+    """Writes the manifest and every image it lists to a .tar.gz; returns the number of images."""
+    manifest = load_manifest(mirror_dir)
+    if not manifest:
+        raise RuntimeError(f"The mirror in {mirror_dir} is empty; run `python -m tests.image_mirror` first")
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(os.path.join(mirror_dir, MANIFEST_FILE), arcname=MANIFEST_FILE)
+        for entry in manifest.values():
+            tar.add(os.path.join(mirror_dir, entry["file"]), arcname=entry["file"])
+    return len(manifest)
+
+def unpack(archive, mirror_dir=IMAGE_MIRROR_DIR):
+    """Restores a pack() archive into mirror_dir and returns its manifest. Only flat regular files are accepted."""
+    os.makedirs(mirror_dir, exist_ok=True)
+    with tarfile.open(archive, "r:gz") as tar:
+        members = tar.getmembers()
+        unsafe = [m.name for m in members if not m.isfile() or os.path.basename(m.name) != m.name or m.name.startswith(".")]
+        if unsafe:
+            raise RuntimeError(f"{archive} is not an image mirror archive: {unsafe[:5]}")
+        tar.extractall(mirror_dir, members=members)
+    return load_manifest(mirror_dir)
+
+def ensure_filled(mirror_dir=IMAGE_MIRROR_DIR, archive=IMAGE_MIRROR_ARCHIVE):
+    """Unpacks IMAGE_MIRROR_ARCHIVE into an empty mirror; raises if the mirror is still empty."""
+    if not load_manifest(mirror_dir) and archive:
+        unpack(archive, mirror_dir)
+    if not load_manifest(mirror_dir):
+        raise RuntimeError(
+            f"The image mirror in {mirror_dir} is empty; run `python -m tests.image_mirror`, "
+            "`--unpack` a mirror archive or set IMAGE_MIRROR_ARCHIVE"
+        )
+
+# --- Interception ---
+
+class ImageMirror:
+    """Serves IMAGE_MIRROR_HOSTS images to the driver's current tab from the mirror, via CDP Fetch."""
+
+    def __init__(self, driver, mirror_dir=IMAGE_MIRROR_DIR):
+        self.driver = driver
+        self.mirror_dir = mirror_dir
+        self.manifest = load_manifest(mirror_dir)
+        self.served = Counter()
+        self.misses = Counter()
+        self._socket = None
+        self._thread = None
+        self._send_lock = threading.Lock()
+        self._next_id = 0
+
+    def start(self):
+        """Attaches to the tab and returns once Fetch interception is active."""
+        address = self.driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if not address:
+            raise RuntimeError("The image mirror needs a local Chrome that exposes its DevTools debuggerAddress")
+        targets = requests.get(f"http://{address}/json", timeout=10).json()
+        target = next(t for t in targets if t["id"] == self.driver.current_window_handle)
+        self._socket = websocket.create_connection(target["webSocketDebuggerUrl"], suppress_origin=True)
+        patterns = [{"urlPattern": f"*://{host}/*"} for host in IMAGE_MIRROR_HOSTS]
+        enable_id = self._send("Fetch.enable", {"patterns": patterns + [{"urlPattern": f"*{NEXT_IMAGE_PATH}?*"}]})
+        while json.loads(self._socket.recv()).get("id") != enable_id:
+            pass
+        self._thread = threading.Thread(target=self._serve, name="image-mirror", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Detaches; Chrome drops the interception together with this CDP session."""
+        if self._socket is not None:
+            self._socket.close()
+            self._thread.join(timeout=5)
+            self._socket = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _send(self, method, params):
+        with self._send_lock:
+            self._next_id += 1
+            self._socket.send(json.dumps({"id": self._next_id, "method": method, "params": params}))
+            return self._next_id
+
+    def _serve(self):
+        while True:
+            try:
+                message = json.loads(self._socket.recv())
+            except (websocket.WebSocketException, OSError, ValueError):
+                return  # Socket closed by stop() or by the browser
+            if message.get("method") == "Fetch.requestPaused":
+                self._answer(message["params"])
+
+    def _answer(self, params):
+        request_id = params["requestId"]
+        url = source_url(params["request"]["url"])
+        if url is None:
+            self._send("Fetch.continueRequest", {"requestId": request_id})
+            return
+        entry = self.manifest.get(url)
+        if entry is None:
+            self.misses[url] += 1
+            self._send("Fetch.fulfillRequest", {"requestId": request_id, "responseCode": 404, "body": ""})
+            return
+        with open(os.path.join(self.mirror_dir, entry["file"]), "rb") as image:
+            body = base64.b64encode(image.read()).decode()
+        self.served[url] += 1
+        self._send("Fetch.fulfillRequest", {
+            "requestId": request_id,
+            "responseCode": 200,
+            "responseHeaders": [
+                {"name": "Content-Type", "value": entry["content_type"]},
+                {"name": "Cache-Control", "value": "no-store"},
+            ],
+            "body": body,
+        })
+
+# --- Entry point ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-fetch the app's external images into the local mirror.")
+    parser.add_argument("--mirror-dir", default=IMAGE_MIRROR_DIR)
+    parser.add_argument("--refresh", action="store_true", help="Re-download images that are already mirrored.")
+    parser.add_argument("--check", action="store_true", help="Only list referenced images missing from the mirror.")
+    parser.add_argument("--pack", metavar="ARCHIVE", help="Write the mirror to a .tar.gz for use as a CI artifact.")
+    parser.add_argument("--unpack", metavar="ARCHIVE", help="Restore the mirror from a --pack archive, then check it.")
+    args = parser.parse_args(argv)
+    urls = referenced_urls()
+    if args.pack:
+        print(f"Packed {pack(args.pack, args.mirror_dir)} images into {args.pack}")
+        return 0
+    if args.unpack:
+        print(f"Unpacked {len(unpack(args.unpack, args.mirror_dir))} images from {args.unpack}")
+    if args.check or args.unpack:
+        missing = [url for url in urls if url not in load_manifest(args.mirror_dir)]
+        for url in missing:
+            print(f"missing: {url}")
+        print(f"{len(urls) - len(missing)}/{len(urls)} referenced images mirrored")
+        return 1 if missing else 0
+    fetched, failed = prefetch(urls, args.mirror_dir, refresh=args.refresh)
+    print(f"referenced={len(urls)}, fetched={len(fetched)}, failed={len(failed)}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
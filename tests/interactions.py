@@ -0,0 +1,87 @@
+"""
+Interaction latency (click-to-paint) instrumentation for the page helpers.
+
+measure_click() clicks an element and reports an INP-style latency: from the click event's
+timestamp (recorded with performance.mark) to the first frame painted after the DOM reflects
+the change. "Reflects the change" is a JavaScript predicate evaluated on every DOM mutation
+with `target` (the clicked element) and `args` (extra values passed from Python) in scope.
+
+Latencies are collected per interaction type in `interaction_latencies`; conftest reports
+p50/p95 per type at the end of the session.
+"""
+from collections import defaultdict
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Interaction type -> list of latencies (ms) observed during this session
+interaction_latencies = defaultdict(list)
+
+# --- Common "change is visible" predicates ---
+TOAST_SHOWN = "document.querySelectorAll('[data-sonner-toast]').length > args[0]"
+TEXT_CHANGED = "!args[0].isConnected || args[0].textContent !== args[1]"
+ATTRIBUTE_CHANGED = "!target.isConnected || target.getAttribute(args[0]) !== args[1]"
+# args[0] is a product grid; args[1] (pass False) latches once its loading skeleton has shown,
+# so the change counts only after the refetch has replaced the skeleton with results
+GRID_RELOADED = (
+    "(args[1] = args[1] || !!args[0].querySelector('.animate-pulse')) && !args[0].querySelector('.animate-pulse')"
+)
+
+_INSTALL_OBSERVER_JS = """
+const [type, target, predicateSource, args] = arguments;
+const predicate = new Function('target', 'args', 'return (' + predicateSource + ');');
+const state = {type: type, start: null, end: null};
+window.__interactionProbe = state;
+
+document.addEventListener('click', (event) => {
+  if (state.start !== null) return;
+  state.start = event.timeStamp;
+  performance.mark(type + ':click', {startTime: event.timeStamp});
+  check();
+}, {capture: true, once: true});
+
+const observer = new MutationObserver(() => check());
+function check() {
+  if (state.start === null || state.end !== null) return;
+  let done = false;
+  try { done = predicate(target, args); } catch (e) { done = false; }
+  if (!done) return;
+  observer.disconnect();
+  state.end = -1;
+  // The first animation frame after the change has committed, then a task after it has painted
+  requestAnimationFrame(() => setTimeout(() => {
+    state.end = performance.now();
+    performance.mark(type + ':painted');
+    performance.measure(type, type + ':click', type + ':painted');
+  }, 0));
+}
+observer.observe(document.body, {childList: true, subtree: true, characterData: true, attributes: true});
+"""
+
+_READ_PROBE_JS = """
+const state = window.__interactionProbe;
+return state && state.end > 0 ? [state.end - state.start] : null;
+"""
+
+def toast_count(driver):
+    """Returns how many sonner toasts are currently rendered (baseline for TOAST_SHOWN)."""
+    return driver.execute_script("return document.querySelectorAll('[data-sonner-toast]').length;")
+
+def measure_click(driver, interaction_type, element, predicate, *args, timeout=10):
+    """Clicks element and records its click-to-paint latency under interaction_type.
+
+    Returns the latency in ms, or None if the predicate never became true within timeout
+    (the click still happens, so callers keep their own functional waits).
+    """
+    try:
+        driver.execute_script(_INSTALL_OBSERVER_JS, interaction_type, element, predicate, list(args))
+    except WebDriverException:
+        element.click()
+        return None
+    element.click()
+    try:
+        latency = WebDriverWait(driver, timeout).until(lambda d: d.execute_script(_READ_PROBE_JS))[0]
+    except (TimeoutException, WebDriverException):
+        return None
+    interaction_latencies[interaction_type].append(latency)
+    return latency
@@ -0,0 +1,149 @@
+"""
+Locator registry shared by the page objects (tests/pages.py) and the test modules.
+
+Every selector is declared once here under a unique registry name. A Locator is a plain
+(By, value) tuple, so it can be passed straight to expected_conditions and find_element(*locator).
+Its registry name is what tests.pages uses to cache handles and record query cost.
+"""
+from selenium.webdriver.common.by import By
+
+_registry = {}
+
+class Locator(tuple):
+    """A (By, value) pair carrying its registry name."""
+
+    def __new__(cls, name, value, by=By.CSS_SELECTOR):
+        instance = super().__new__(cls, (by, value))
+        instance.name = name
+        return instance
+
+    def __repr__(self):
+        return f"Locator({self.name!r}, {self[1]!r})"
+
+def locator(name, value, by=By.CSS_SELECTOR):
+    """Registers and returns a locator; each name may be registered only once."""
+    if name in _registry:
+        raise ValueError(f"Locator {name!r} is already registered as {_registry[name][1]!r}")
+    _registry[name] = Locator(name, value, by)
+    return _registry[name]
+
+def registered():
+    """Returns {name: Locator} for every registered locator."""
+    return dict(_registry)
+
+# --- Shared across pages ---
+HEADER = locator("header", "header")
+PAGE_HEADING = locator("page_heading", "h1")
+LOADING_SPINNER = locator("loading_spinner", "div.animate-spin.rounded-full.h-8.w-8.border-b-2.border-\\[\\#0064B1\\]")
+PRODUCTS_GRID = locator("products_grid", "div.grid.grid-cols-1.sm\\:grid-cols-2.lg\\:grid-cols-3.xl\\:grid-cols-4.gap-6")
+PRODUCT_CARD = locator("product_card", "div.bg-white.rounded-lg.shadow.overflow-hidden")
+PRODUCT_CARD_IMAGE = locator("product_card.image", "div.relative.aspect-square img")
+PRODUCT_CARD_TITLE = locator("product_card.title", "h3.text-lg.font-medium.text-gray-900")
+PRODUCT_CARD_PRICE = locator("product_card.price", "p.text-lg.font-semibold.text-\\[\\#0064B1\\]")
+PRODUCT_CARD_CATEGORY = locator("product_card.category", "p.text-sm.text-gray-500")
+PRODUCT_CARD_TITLE_LINK = locator("product_card.title_link", f"{PRODUCT_CARD[1]} {PRODUCT_CARD_TITLE[1]}")
+
+# --- Home page ---
+HERO_SECTION = locator("home.hero", "section.relative.h-\\[600px\\]")
+HERO_TITLE = locator("home.hero.title", "h1.text-4xl.font-bold.text-white")
+HERO_DESCRIPTION = locator("home.hero.description", "p.text-lg.text-white\\/90")
+HERO_BUTTON = locator("home.hero.button", "a.bg-white\\/10")
+FEATURED_SECTION = locator("home.featured", "section.py-16.bg-zinc-50")
+FEATURED_TITLE = locator("home.featured.title", "h2.text-3xl.font-bold.text-\\[\\#0064B1\\]")
+FEATURED_DESCRIPTION = locator("home.featured.description", "p.text-lg.text-zinc-600")
+CATEGORIES_SECTION = locator("home.categories", "section.py-16.bg-white")
+CATEGORY_CARD = locator("home.category_card", "a.group.block.overflow-hidden.rounded-lg.shadow-md")
+CATEGORY_IMAGE = locator("home.category_card.image", "div.relative.h-48.overflow-hidden img")
+CATEGORY_TITLE = locator("home.category_card.title", "h3.text-white.font-bold.text-xl")
+CATEGORY_COUNT = locator("home.category_card.count", "p.text-zinc-300.text-sm")
+VIEW_ALL_PRODUCTS_LINK = locator("home.view_all_products", "//a[contains(., 'View All Products')]", By.XPATH)
+
+# --- Product listings page ---
+LISTINGS_TITLE = locator("listings.title", "h1.text-4xl.font-bold.text-\\[\\#0064B1\\]")
+LISTINGS_DESCRIPTION = locator("listings.description", "p.text-zinc-600.text-lg")
+SEARCH_INPUT = locator("listings.search_input", "input[placeholder='Search products...']")
+SEARCH_BUTTON = locator("listings.search_button", "button.bg-\\[\\#0064B1\\]")
+FILTER_BUTTON = locator("listings.filter_button", "button:has(svg.h-4.w-4)")
+FILTER_PANEL = locator("listings.filter_panel", "div.bg-white.p-4.rounded-lg.shadow-sm")
+CATEGORY_FILTER = locator("listings.category_filter", "select[value='all']")
+SIZE_FILTER_BADGE = locator("listings.size_filter.badge", "div.flex.flex-wrap.gap-2 span")
+COLOR_FILTER_BADGE = locator("listings.color_filter.badge", "div.flex.flex-wrap.gap-2 span")
+PRICE_FILTER_INPUT = locator("listings.price_filter.input", "div.flex.gap-2 input")
+SORT_SELECT = locator("listings.sort", "select[value='newest']")
+PAGINATION = locator("listings.pagination", "div.flex.justify-center.items-center.gap-2")
+PAGINATION_PREV_BUTTON = locator("listings.pagination.prev", "button:has(svg.h-4.w-4):first-child")
+PAGINATION_NEXT_BUTTON = locator("listings.pagination.next", "button:has(svg.h-4.w-4):last-child")
+PAGINATION_TEXT = locator("listings.pagination.text", "span.text-sm")
+LISTINGS_LOADING_SKELETON = locator("listings.loading_skeleton", "div.animate-pulse.bg-gray-200.rounded-lg.aspect-square")
+NO_PRODUCTS_MESSAGE = locator("listings.no_products", "div.col-span-full.text-center.py-12")
+RESULTS_INFO = locator("listings.results_info", "p.text-sm.text-zinc-600")
+
+# --- Product detail page ---
+PDP_IMAGES = locator("pdp.images", "div.space-y-4")
+PDP_MAIN_IMAGE = locator("pdp.main_image", "div.relative.aspect-square.overflow-hidden.rounded-lg img")
+PDP_THUMBNAIL = locator("pdp.thumbnail", "div.grid.grid-cols-4.gap-4 button")
+PDP_TITLE = locator("pdp.title", "h1.text-2xl.font-semibold.text-zinc-900")
+PDP_CATEGORY = locator("pdp.category", "p.text-zinc-500")
+PDP_PRICE = locator("pdp.price", "span.text-3xl.font-bold.text-\\[\\#0064B1\\]")
+PDP_ORIGINAL_PRICE = locator("pdp.original_price", "span.text-lg.text-zinc-400.line-through")
+PDP_DISCOUNT = locator("pdp.discount", "span.bg-red-500")
+PDP_RATING = locator("pdp.rating", "div.flex.items-center.gap-2")
+PDP_STAR = locator("pdp.rating.star", "svg.w-5.h-5")
+PDP_REVIEW_COUNT = locator("pdp.rating.review_count", "span.text-zinc-600")
+PDP_SIZE_SELECT = locator("pdp.size", "select[value='']")
+PDP_COLOR_SELECT = locator("pdp.color", "select[value='']")
+PDP_QUANTITY_SELECT = locator("pdp.quantity", "select[value='1']")
+PDP_ADD_TO_CART_BUTTON = locator("pdp.add_to_cart", "button.bg-\\[\\#0064B1\\]")
+PDP_WISHLIST_BUTTON = locator("pdp.wishlist", "button[aria-label='Add to wishlist'], button[aria-label='Remove from wishlist']")
+PDP_SHARE_BUTTON = locator("pdp.share", "button:has(svg.h-4.w-4)")
+PDP_DESCRIPTION = locator("pdp.description", "p.text-zinc-600")
+PDP_DETAILS = locator("pdp.details", "ul.list-disc.list-inside.space-y-2.text-zinc-600")
+PDP_LOADING_SKELETON = locator("pdp.loading_skeleton", "div.animate-pulse.bg-gray-200.rounded-lg")
+PDP_ERROR_MESSAGE = locator("pdp.error", "div.text-center h1.text-2xl.font-bold.text-red-600")
+PDP_ERROR_DETAIL = locator("pdp.error.detail", "div.text-center p.text-zinc-600")
+TOAST_VIEW_CART_BUTTON = locator("toast.view_cart", "button:has-text('View Cart')")
+
+# --- Cart page ---
+CART_TITLE = locator("cart.title", "h1.text-3xl.font-bold")
+CART_ITEMS_CONTAINER = locator("cart.items", "div.lg\\:col-span-2.space-y-4")
+CART_ITEM = locator("cart.item", "div.bg-white.rounded-lg.shadow-sm.p-4.flex.gap-4")
+CART_ITEM_IMAGE = locator("cart.item.image", "div.shrink-0.aspect-square.w-24.relative.rounded-md.overflow-hidden img")
+CART_ITEM_TITLE = locator("cart.item.title", "a.font-medium.hover\\:text-\\[\\#0064B1\\]")
+CART_ITEM_CATEGORY = locator("cart.item.category", "div.text-sm.text-zinc-600")
+CART_ITEM_PRICE = locator("cart.item.price", "span.font-medium")
+CART_ITEM_QUANTITY = locator("cart.item.quantity", "span.w-8.text-center")
+CART_ITEM_DECREASE_BUTTON = locator("cart.item.decrease", "button:has(svg.h-4.w-4):first-child")
+CART_ITEM_INCREASE_BUTTON = locator("cart.item.increase", "button:has(svg.h-4.w-4):last-child")
+CART_ITEM_REMOVE_BUTTON = locator("cart.item.remove", "button:has(svg.h-4.w-4.mr-1)")
+ORDER_SUMMARY = locator("cart.summary", "div.bg-white.rounded-lg.shadow-sm.p-6")
+ORDER_SUBTOTAL = locator("cart.summary.subtotal", "div.space-y-4.mb-4 div:first-child span:last-child")
+ORDER_SHIPPING = locator("cart.summary.shipping", "div.space-y-4.mb-4 div:nth-child(2) span:last-child")
+ORDER_TAX = locator("cart.summary.tax", "div.space-y-4.mb-4 div:nth-child(3) span:last-child")
+ORDER_TOTAL = locator("cart.summary.total", "div.flex.justify-between.items-center.font-bold.text-xl.mb-4 span:last-child")
+CHECKOUT_BUTTON = locator("cart.checkout", "button.w-full")
+EMPTY_CART_MESSAGE = locator("cart.empty", "h1.text-2xl.font-bold")
+CONTINUE_SHOPPING_BUTTON = locator("cart.continue_shopping", "a:has(button)")
+UPDATE_MESSAGE = locator("cart.update_message", "div.mb-4.p-4.rounded")
+CHECKOUT_SHIPPING_HEADING = locator("checkout.shipping_heading", "//h2[contains(text(), 'Shipping address')]", By.XPATH)
+
+# --- Wishlist page ---
+WISHLIST_TITLE = locator("wishlist.title", "h1.text-4xl.font-bold.text-\\[\\#0064B1\\]")
+WISHLIST_ITEMS_CONTAINER = locator("wishlist.items", "div.bg-white.rounded-lg.shadow.overflow-hidden")
+WISHLIST_ITEM = locator("wishlist.item", "div.flex.items-center.p-6")
+WISHLIST_ITEM_IMAGE = locator("wishlist.item.image", "div.relative.h-24.w-24 img")
+WISHLIST_ITEM_TITLE = locator("wishlist.item.title", "h3.text-lg.font-medium.text-gray-900 a")
+WISHLIST_ITEM_CATEGORY = locator("wishlist.item.category", "p.mt-1.text-sm.text-gray-500")
+WISHLIST_ITEM_PRICE = locator("wishlist.item.price", "p.text-lg.font-semibold.text-\\[\\#0064B1\\]")
+WISHLIST_ITEM_REMOVE_BUTTON = locator("wishlist.item.remove", "button[aria-label='Remove from wishlist']")
+EMPTY_WISHLIST_MESSAGE = locator("wishlist.empty", "h2.text-2xl.font-semibold.text-zinc-900")
+BROWSE_PRODUCTS_BUTTON = locator("wishlist.browse_products", "a[href='/listings']")
+VIEW_DETAILS_BUTTON = locator("wishlist.view_details", "a:has(svg.h-4.w-4.mr-2)")
+WISHLIST_LOADING_SPINNER = locator("wishlist.loading_spinner", "svg.h-8.w-8.animate-spin.text-\\[\\#0064B1\\]")
+
+# --- Orders page ---
+ORDERS_LOADING_SPINNER = locator("orders.loading_spinner", "svg.h-8.w-8.animate-spin.text-\\[\\#0064B1\\]")
+ORDER_CARD = locator("orders.card", "div.space-y-6 > div.bg-white.rounded-lg.shadow-sm.overflow-hidden")
+EMPTY_ORDERS_MESSAGE = locator("orders.empty", "div.text-center.py-12 h2")
+
+# --- Order confirmation page ---
+CONFIRMATION_TITLE = locator("confirmation.title", "h1.text-3xl.font-bold.mb-4")
@@ -0,0 +1,401 @@
+"""
+Page objects for the Home, Listings, Product Detail, Cart, Wishlist, Orders and Order
+Confirmation pages.
+
+Pages resolve locators from tests/locators.py and cache the resulting element handles for
+the current render: asking for the same locator again returns the cached handle without a
+browser round trip. Empty find_all() results are not cached. open() starts a new render and
+drops the cache. Actions that go through act()/click()/text() re-resolve a handle once if it
+turns out to be stale, so React re-renders do not break them. Every real query is timed per
+locator name in `locator_costs`, which conftest reports at the end of the session.
+"""
+import time
+from collections import defaultdict
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
+
+from tests.config import BASE_URL
+from tests.conftest import check_toast_message
+from tests.interactions import ATTRIBUTE_CHANGED, GRID_RELOADED, TEXT_CHANGED, TOAST_SHOWN, measure_click, toast_count
+from tests.locators import (
+    CART_ITEM,
+    CART_ITEM_DECREASE_BUTTON,
+    CART_ITEM_INCREASE_BUTTON,
+    CART_ITEM_QUANTITY,
+    CART_ITEM_REMOVE_BUTTON,
+    CART_ITEM_TITLE,
+    CART_ITEMS_CONTAINER,
+    CATEGORY_CARD,
+    CATEGORY_FILTER,
+    COLOR_FILTER_BADGE,
+    CONFIRMATION_TITLE,
+    EMPTY_CART_MESSAGE,
+    EMPTY_ORDERS_MESSAGE,
+    EMPTY_WISHLIST_MESSAGE,
+    FILTER_BUTTON,
+    FILTER_PANEL,
+    LISTINGS_LOADING_SKELETON,
+    LOADING_SPINNER,
+    ORDER_CARD,
+    ORDER_SUBTOTAL,
+    ORDER_TOTAL,
+    ORDERS_LOADING_SPINNER,
+    PDP_ADD_TO_CART_BUTTON,
+    PDP_COLOR_SELECT,
+    PDP_QUANTITY_SELECT,
+    PDP_SHARE_BUTTON,
+    PDP_SIZE_SELECT,
+    PDP_WISHLIST_BUTTON,
+    PRICE_FILTER_INPUT,
+    PRODUCT_CARD,
+    PRODUCTS_GRID,
+    SEARCH_BUTTON,
+    SEARCH_INPUT,
+    SIZE_FILTER_BADGE,
+    SORT_SELECT,
+    WISHLIST_ITEM_REMOVE_BUTTON,
+    WISHLIST_ITEMS_CONTAINER,
+    WISHLIST_LOADING_SPINNER,
+)
+
+# Locator name -> query statistics for this session
+locator_costs = defaultdict(lambda: {"queries": 0, "cache_hits": 0, "stale_refreshes": 0, "total_ms": 0.0})
+
+class BasePage:
+    """Locator lookups with per-render handle caching and stale-handle refresh."""
+
+    path = "/"
+
+    def __init__(self, driver, wait):
+        self.driver = driver
+        self.wait = wait
+        self._handles = {}
+
+    def open(self, path=None):
+        """Navigates to the page (or `path`) and starts a new render."""
+        self.driver.get(f"{BASE_URL}{self.path if path is None else path}")
+        self.invalidate()
+        return self
+
+    def invalidate(self, locator=None):
+        """Drops cached handles: all of them, or only those of one locator."""
+        if locator is None:
+            self._handles.clear()
+            return
+        for key in [key for key in self._handles if key[0] == locator.name]:
+            del self._handles[key]
+
+    def _resolve(self, key, locator, query):
+        cost = locator_costs[locator.name]
+        if key in self._handles:
+            cost["cache_hits"] += 1
+            return self._handles[key]
+        start = time.perf_counter()
+        try:
+            result = query()
+        finally:
+            cost["queries"] += 1
+            cost["total_ms"] += (time.perf_counter() - start) * 1000
+        if result != []:  # An empty list may only mean the list has not rendered yet, so ask again next time
+            self._handles[key] = result
+        return result
+
+    def find(self, locator, condition=EC.presence_of_element_located, within=None):
+        """Returns the element for locator, querying the browser only on the first call per render.
+
+        Page-level lookups wait for `condition`; lookups `within` a parent element are immediate.
+        A cached handle is returned without a stale check, so callers that hold on to it across a
+        re-render should go through act()/click()/text() instead.
+        """
+        if within is not None:
+            return self._resolve((locator.name, within.id), locator, lambda: within.find_element(*locator))
+        return self._resolve((locator.name, condition.__name__), locator, lambda: self.wait.until(condition(locator)))
+
+    def find_all(self, locator, within=None, wait=False):
+        """Returns every element for locator (cached like find). With wait=True, waits for at least one.
+
+        Empty results are not cached, so a no-wait lookup that found nothing never stops a later
+        wait=True lookup from waiting.
+        """
+        if within is not None:
+            return self._resolve((locator.name, within.id, "all"), locator, lambda: within.find_elements(*locator))
+        if wait:
+            return self._resolve((locator.name, "all"), locator, lambda: self.wait.until(EC.presence_of_all_elements_located(locator)))
+        return self._resolve((locator.name, "all"), locator, lambda: self.driver.find_elements(*locator))
+
+    def act(self, locator, action, condition=EC.presence_of_element_located):
+        """Returns action(element), re-resolving the element once if its cached handle went stale."""
+        try:
+            return action(self.find(locator, condition))
+        except StaleElementReferenceException:
+            locator_costs[locator.name]["stale_refreshes"] += 1
+            self.invalidate(locator)
+            return action(self.find(locator, condition))
+
+    def click(self, locator):
+        return self.act(locator, lambda element: element.click(), EC.element_to_be_clickable)
+
+    def text(self, locator):
+        return self.act(locator, lambda element: element.text, EC.visibility_of_element_located)
+
+    def wait_until_gone(self, locator):
+        """Waits for locator to disappear; a timeout is ignored because fast loads may never show it."""
+        try:
+            self.wait.until(EC.invisibility_of_element_located(locator))
+        except TimeoutException:
+            pass
+        self.invalidate()
+
+class HomePage(BasePage):
+    path = "/"
+
+    def product_cards(self):
+        grid = self.find(PRODUCTS_GRID, EC.visibility_of_element_located)
+        return self.find_all(PRODUCT_CARD, within=grid)
+
+    def category_cards(self):
+        return self.find_all(CATEGORY_CARD, wait=True)
+
+class ListingsPage(BasePage):
+    path = "/listings"
+
+    def apply_filters(self, category, size, color, min_price, max_price, sort):
+        """Opens the filter panel and applies category, size, color, price range and sort.
+
+        Size and color badges only change filter state; the grid refetches on the sort change,
+        which is measured as apply_filters up to the reloaded grid's first paint.
+        """
+        try:
+            self.click(FILTER_BUTTON)
+            self.find(FILTER_PANEL, EC.visibility_of_element_located)
+
+            category_select = self.find(CATEGORY_FILTER, EC.element_to_be_clickable)
+            category_select.click()
+            category_select.send_keys(category)
+
+            for badge_locator, value in [(SIZE_FILTER_BADGE, size), (COLOR_FILTER_BADGE, color)]:
+                for badge in self.find_all(badge_locator):
+                    if badge.text == value:
+                        badge.click()
+                        break
+
+            price_inputs = self.find_all(PRICE_FILTER_INPUT)
+            price_inputs[0].clear()
+            price_inputs[0].send_keys(min_price)
+            price_inputs[1].clear()
+            price_inputs[1].send_keys(max_price)
+
+            # Let the refetches from the category and price changes settle before timing the sort
+            self.wait_until_gone(LISTINGS_LOADING_SKELETON)
+            sort_select = self.find(SORT_SELECT, EC.element_to_be_clickable)
+            option = next(o for o in Select(sort_select).options if o.get_attribute("value") == sort)
+            if option.is_selected():
+                option.click()
+            else:
+                grid = self.find(PRODUCTS_GRID, EC.visibility_of_element_located)
+                measure_click(self.driver, "apply_filters", option, GRID_RELOADED, grid, False)
+
+            # Wait for results to update
+            self.wait_until_gone(LISTINGS_LOADING_SKELETON)
+        except (TimeoutException, StopIteration):
+            pytest.fail("Failed to apply filters")
+
+    def search(self, query):
+        try:
+            search_input = self.find(SEARCH_INPUT, EC.element_to_be_clickable)
+            search_input.clear()
+            search_input.send_keys(query)
+            self.click(SEARCH_BUTTON)
+
+            # Wait for results to update
+            time.sleep(1)
+            self.invalidate()
+        except TimeoutException:
+            pytest.fail("Failed to perform search")
+
+class ProductDetailPage(BasePage):
+    def open(self, product_id):
+        return super().open(f"/product/{product_id}")
+
+    def add_to_cart(self, quantity=None, size=None, color=None):
+        """Picks the given options, clicks Add to Cart and waits for the success toast."""
+        try:
+            for select_locator, value in [(PDP_QUANTITY_SELECT, quantity), (PDP_SIZE_SELECT, size), (PDP_COLOR_SELECT, color)]:
+                if value:
+                    select = self.find(select_locator, EC.element_to_be_clickable)
+                    select.click()
+                    select.send_keys(value)
+
+            button = self.find(PDP_ADD_TO_CART_BUTTON, EC.element_to_be_clickable)
+            measure_click(self.driver, "add_to_cart", button, TOAST_SHOWN, toast_count(self.driver))
+            check_toast_message(self.wait, "Added to cart!")
+        except TimeoutException:
+            pytest.fail("Failed to add product to cart")
+
+    def wishlist_label(self):
+        return self.act(PDP_WISHLIST_BUTTON, lambda button: button.get_attribute("aria-label"), EC.element_to_be_clickable)
+
+    def toggle_wishlist(self):
+        """Clicks the wishlist button and waits for its label and toast to flip."""
+        try:
+            initial_state = self.wishlist_label()
+            button = self.find(PDP_WISHLIST_BUTTON, EC.element_to_be_clickable)
+            measure_click(self.driver, "toggle_wishlist", button, ATTRIBUTE_CHANGED, "aria-label", initial_state)
+            self.wait.until(lambda d: self.wishlist_label() != initial_state)
+
+            if "Add" in initial_state:
+                check_toast_message(self.wait, "Added to wishlist")
+            else:
+                check_toast_message(self.wait, "Removed from wishlist")
+        except TimeoutException:
+            pytest.fail("Failed to toggle wishlist status")
+
+    def ensure_in_wishlist(self):
+        """Adds the product to the wishlist unless it is already there."""
+        if "Add" in self.wishlist_label():
+            self.toggle_wishlist()
+
+    def share(self):
+        self.click(PDP_SHARE_BUTTON)
+
+class CartPage(BasePage):
+    path = "/cart"
+
+    def wait_until_updated(self):
+        self.wait_until_gone(LOADING_SPINNER)
+
+    def clear(self):
+        """Removes every item; cached remove buttons are reused until a re-render makes them stale."""
+        try:
+            self.find(CART_ITEMS_CONTAINER, EC.visibility_of_element_located)
+            buttons = self.find_all(CART_ITEM_REMOVE_BUTTON)
+            while buttons:
+                button = buttons[0]
+                try:
+                    button.click()
+                    self.wait.until(EC.staleness_of(button))
+                    buttons = buttons[1:]
+                except StaleElementReferenceException:
+                    locator_costs[CART_ITEM_REMOVE_BUTTON.name]["stale_refreshes"] += 1
+                    self.invalidate(CART_ITEM_REMOVE_BUTTON)
+                    buttons = self.find_all(CART_ITEM_REMOVE_BUTTON)
+            self.invalidate()
+            self.find(EMPTY_CART_MESSAGE, EC.visibility_of_element_located)
+        except TimeoutException:
+            # Cart might already be empty, or selectors are wrong
+            print("Could not find cart items to clear, or cart was already empty.")
+        except Exception as e:
+            print(f"Error during cart clearing: {e}")
+            # Navigate away to reset state if clearing failed badly
+            self.driver.get(BASE_URL)
+
+    def item_for(self, product_id, wait=False):
+        """Returns the cart item row linking to product_id, or None."""
+        for item in self.find_all(CART_ITEM, wait=wait):
+            link = self.find(CART_ITEM_TITLE, within=item)
+            if f"/product/{product_id}" in link.get_attribute("href"):
+                return item
+        return None
+
+    def has_item(self, product_id):
+        try:
+            self.find(CART_ITEMS_CONTAINER)
+            return self.item_for(product_id) is not None
+        except (TimeoutException, NoSuchElementException):
+            return False
+
+    def update_quantity(self, product_id, increase=True):
+        """Clicks + or - on the product's row and waits for its quantity to change."""
+        try:
+            item = self.item_for(product_id, wait=True)
+            if item is None:
+                return False
+            button = item.find_element(*(CART_ITEM_INCREASE_BUTTON if increase else CART_ITEM_DECREASE_BUTTON))
+            quantity_element = self.find(CART_ITEM_QUANTITY, within=item)
+            initial_quantity = int(quantity_element.text)
+            measure_click(self.driver, "update_quantity", button, TEXT_CHANGED, quantity_element, quantity_element.text)
+
+            # Wait for quantity update
+            self.wait.until(lambda d: int(item.find_element(*CART_ITEM_QUANTITY).text) != initial_quantity)
+            self.invalidate(CART_ITEM_QUANTITY)
+            return True
+        except (TimeoutException, NoSuchElementException):
+            return False
+
+    def remove_item(self, product_id):
+        try:
+            item = self.item_for(product_id, wait=True)
+            if item is None:
+                return False
+            self.find(CART_ITEM_REMOVE_BUTTON, within=item).click()
+
+            # Wait for item removal
+            self.wait.until(EC.staleness_of(item))
+            self.invalidate()
+            return True
+        except (TimeoutException, NoSuchElementException):
+            return False
+
+    def summary_value(self, value_type="subtotal"):
+        """Returns the order summary subtotal or total as a float (0.0 if missing)."""
+        locator = ORDER_SUBTOTAL if value_type == "subtotal" else ORDER_TOTAL
+        try:
+            # Summary values change with every cart update, so never serve them from the cache
+            self.invalidate(locator)
+            return float(self.text(locator).replace("$", "").strip())
+        except (TimeoutException, ValueError):
+            print(f"Could not find or parse {value_type} value.")
+            return 0.0
+
+class WishlistPage(BasePage):
+    path = "/wishlist"
+
+    def wait_until_loaded(self):
+        self.wait_until_gone(WISHLIST_LOADING_SPINNER)
+
+    def clear(self):
+        """Removes every item and waits for the empty state."""
+        try:
+            try:
+                self.find(WISHLIST_ITEMS_CONTAINER)
+                remove_buttons = self.find_all(WISHLIST_ITEM_REMOVE_BUTTON)
+                print(f"Found {len(remove_buttons)} items to remove from wishlist.")
+
+                for button in remove_buttons:
+                    if not button.is_displayed():
+                        continue
+                    button.click()
+                    # Wait for item removal animation/update
+                    time.sleep(0.5)
+                    check_toast_message(self.wait, "Removed from wishlist")
+
+                self.invalidate()
+                self.find(EMPTY_WISHLIST_MESSAGE, EC.visibility_of_element_located)
+                print("Wishlist cleared successfully.")
+            except TimeoutException:
+                # Check if already empty
+                self.find(EMPTY_WISHLIST_MESSAGE, EC.visibility_of_element_located)
+                print("Wishlist was already empty.")
+        except Exception as e:
+            print(f"Error during wishlist clearing: {e}")
+            # Navigate away to reset state
+            self.driver.get(BASE_URL)
+
+class OrdersPage(BasePage):
+    path = "/orders"
+
+    def order_cards(self):
+        """Waits for the order list (or its empty state) to render and returns the order cards."""
+        self.wait_until_gone(ORDERS_LOADING_SPINNER)
+        self.wait.until(EC.any_of(EC.presence_of_element_located(ORDER_CARD), EC.presence_of_element_located(EMPTY_ORDERS_MESSAGE)))
+        return self.find_all(ORDER_CARD)
+
+class OrderConfirmationPage(BasePage):
+    def open(self, order_id):
+        return super().open(f"/checkout/{order_id}/confirmation")
+
+    def title(self):
+        return self.text(CONFIRMATION_TITLE)
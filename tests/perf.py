@@ -0,0 +1,319 @@
+"""
+Shared helpers for the performance benchmarks (tests marked `perf`).
+"""
+import json
+import math
+import os
+import re
+import signal
+import socket
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timezone
+
+import requests
+
+from tests.config import (
+    BASE_URL,
+    PERF_RESULTS_DIR,
+    PERF_SERVER_START_TIMEOUT,
+    PROJECT_ROOT,
+    ROUTE_PARAM_SAMPLES,
+)
+from tests.query_accounting import active_accounting
+
+APP_DIR = os.path.join(PROJECT_ROOT, "app")
+
+# --- Statistics ---
+
+def percentile(samples, pct):
+    """Returns the pct-th percentile (0-100) of samples using linear interpolation."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low, high = math.floor(rank), math.ceil(rank)
+    if low == high:
+        return ordered[int(rank)]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def summarize(samples):
+    """Summarizes a list of latencies (ms) as count/mean/min/p50/p95/max."""
+    if not samples:
+        return {"count": 0, "mean": None, "min": None, "p50": None, "p95": None, "max": None}
+    return {
+        "count": len(samples),
+        "mean": round(sum(samples) / len(samples), 2),
+        "min": round(min(samples), 2),
+        "p50": round(percentile(samples, 50), 2),
+        "p95": round(percentile(samples, 95), 2),
+        "max": round(max(samples), 2),
+    }
+
+def latency_by_kind(results):
+    """Summarizes the latency of results ({"kind", "latency_ms", ...}) per kind; failed requests are left out."""
+    by_kind = defaultdict(list)
+    for result in results:
+        samples = by_kind[result["kind"]]  # Kinds whose every request failed still get a (count 0) entry
+        if result["latency_ms"] is not None:
+            samples.append(result["latency_ms"])
+    return {kind: summarize(samples) for kind, samples in sorted(by_kind.items())}
+
+def over_baseline(step, baseline, kind):
+    """How much slower `kind` is in step than in baseline (p50 and p95, ms, floored at 0); None without samples."""
+    loaded, idle = step["latency"].get(kind), baseline["latency"].get(kind)
+    if not loaded or not idle or loaded["count"] == 0 or idle["count"] == 0:
+        return {"p50": None, "p95": None}
+    return {
+        "p50": round(max(loaded["p50"] - idle["p50"], 0), 2),
+        "p95": round(max(loaded["p95"] - idle["p95"], 0), 2),
+    }
+
+# --- HTTP ---
+
+def timed_request(session, method, url, **kwargs):
+    """Performs an HTTP request and returns (response, elapsed_ms)."""
+    kwargs.setdefault("allow_redirects", False)
+    kwargs.setdefault("timeout", 30)
+    accounting = active_accounting()
+    with accounting.track_request(method, url) if accounting else nullcontext():
+        start = time.perf_counter()
+        response = session.request(method, url, **kwargs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    return response, elapsed_ms
+
+def tolerant_request(kind, session, method, url, **kwargs):
+    """Like timed_request, but a connection error is recorded rather than raised.
+
+    Returns {"kind", "status", "latency_ms", "response"}; status, latency_ms and response are None
+    when the request failed.
+    """
+    try:
+        response, elapsed_ms = timed_request(session, method, url, **kwargs)
+        return {"kind": kind, "status": response.status_code, "latency_ms": elapsed_ms, "response": response}
+    except requests.RequestException:
+        return {"kind": kind, "status": None, "latency_ms": None, "response": None}
+
+def server_timing(response):
+    """Parses a Server-Timing header into {metric: duration_ms}; metrics without dur are skipped."""
+    timings = {}
+    for entry in response.headers.get("Server-Timing", "").split(","):
+        name, _, params = entry.strip().partition(";")
+        match = re.search(r"(?:^|;)\s*dur=([\d.]+)", params)
+        if name and match:
+            timings[name] = float(match.group(1))
+    return timings
+
+def api_login(session, email, password, base_url=BASE_URL):
+    """Logs a requests session in through /api/auth/login. The auth_token cookie is kept on the session."""
+    response = session.post(f"{base_url}/api/auth/login", json={"email": email, "password": password}, timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+_thread_state = threading.local()
+
+def thread_session():
+    """Returns a requests session private to the calling thread (sessions are not thread-safe)."""
+    if not hasattr(_thread_state, "session"):
+        _thread_state.session = requests.Session()
+    return _thread_state.session
+
+def run_concurrently(func, items, workers):
+    """Maps func over items on a thread pool and returns the results in input order."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+# --- Route discovery ---
+
+def discover_routes(app_dir=APP_DIR):
+    """Lists every page and GET API handler under app/ as concrete URL paths.
+
+    Dynamic segments such as [id] are filled from ROUTE_PARAM_SAMPLES.
+    Returns a list of dicts: {"route": "/product/[id]", "path": "/product/1", "kind": "page"|"api"}.
+    """
+    routes = []
+    for dirpath, _, filenames in os.walk(app_dir):
+        for filename in filenames:
+            stem, _ = os.path.splitext(filename)
+            if stem == "page":
+                kind = "page"
+            elif stem == "route" and _exports_get(os.path.join(dirpath, filename)):
+                kind = "api"
+            else:
+                continue
+            relative = os.path.relpath(dirpath, app_dir).replace(os.sep, "/")
+            route = "/" if relative == "." else f"/{relative}"
+            routes.append({"route": route, "path": _fill_segments(route), "kind": kind})
+    return sorted(routes, key=lambda r: (r["kind"], r["route"]))
+
+def _exports_get(path):
+    with open(path, encoding="utf-8") as handler:
+        return re.search(r"export\s+(async\s+)?function\s+GET\b", handler.read()) is not None
+
+def _fill_segments(route):
+    return re.sub(r"\[(\w+)\]", lambda m: ROUTE_PARAM_SAMPLES.get(m.group(1), "1"), route)
+
+# --- Results ---
+
+def write_report(name, payload):
+    """Writes the latest results to <name>.json and appends them to <name>.history.jsonl."""
+    os.makedirs(PERF_RESULTS_DIR, exist_ok=True)
+    record = {"timestamp": datetime.now(timezone.utc).isoformat(), "git_sha": _git_sha(), **payload}
+    latest_path = os.path.join(PERF_RESULTS_DIR, f"{name}.json")
+    with open(latest_path, "w", encoding="utf-8") as latest:
+        json.dump(record, latest, indent=2, default=str)
+    with open(os.path.join(PERF_RESULTS_DIR, f"{name}.history.jsonl"), "a", encoding="utf-8") as history:
+        history.write(json.dumps(record, default=str) + "\n")
+    return latest_path
+
+def load_history(name):
+    """Returns every recorded run for a benchmark, oldest first."""
+    path = os.path.join(PERF_RESULTS_DIR, f"{name}.history.jsonl")
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as history:
+        return [json.loads(line) for line in history if line.strip()]
+
+def write_series(name, x_label, series, log_x=True):
+    """Writes {label: [(x, y), ...]} to <name>.csv and, if matplotlib is installed, <name>.png."""
+    os.makedirs(PERF_RESULTS_DIR, exist_ok=True)
+    csv_path = os.path.join(PERF_RESULTS_DIR, f"{name}.csv")
+    with open(csv_path, "w", encoding="utf-8") as csv_file:
+        csv_file.write(f"series,{x_label},value\n")
+        for label, points in series.items():
+            for x, y in points:
+                csv_file.write(f"{label},{x},{y}\n")
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return csv_path
+    figure, axes = plt.subplots(len(series), 1, figsize=(8, 3 * len(series)), squeeze=False)
+    for axis, (label, points) in zip(axes[:, 0], series.items()):
+        axis.plot([x for x, _ in points], [y for _, y in points], marker="o")
+        if log_x:
+            axis.set_xscale("log")
+        axis.set_xlabel(x_label)
+        axis.set_ylabel(label)
+        axis.grid(True, alpha=0.3)
+    figure.tight_layout()
+    figure.savefig(os.path.join(PERF_RESULTS_DIR, f"{name}.png"))
+    plt.close(figure)
+    return csv_path
+
+def _git_sha():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def process_tree_rss_mb(root_pid):
+    """Returns the resident memory (MB) of a process and all its descendants. Linux only (/proc)."""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as stat:
+                ppid = int(stat.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    total_kb, pending = 0, [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+        except OSError:
+            continue
+    return round(total_kb / 1024, 1)
+
+# --- Server lifecycle ---
+
+class NextServer:
+    """Starts a fresh `next start` for the production build (run `npm run build` first)."""
+
+    def __init__(self, port, cwd=PROJECT_ROOT):
+        self.port = port
+        self.cwd = cwd
+        self.process = None
+
+    @property
+    def base_url(self):
+        return f"http://localhost:{self.port}"
+
+    def port_in_use(self):
+        try:
+            with socket.create_connection(("localhost", self.port), timeout=0.5):
+                return True
+        except OSError:
+            return False
+
+    def start(self):
+        """Launches the server and blocks until its port accepts connections. Returns startup time in ms.
+
+        Fails at once if something already listens on the port: a leftover server would be warm,
+        and every "cold" measurement against it would be wrong.
+        """
+        if self.port_in_use():
+            raise RuntimeError(f"Port {self.port} is already in use; stop the server listening there first")
+        start = time.perf_counter()
+        # Its own process group, so stop() also reaches the node process npx starts
+        self.process = subprocess.Popen(
+            ["npx", "next", "start", "-p", str(self.port)],
+            cwd=self.cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + PERF_SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"next start exited with code {self.process.returncode}")
+            if self.port_in_use():
+                return (time.perf_counter() - start) * 1000
+            time.sleep(0.1)
+        self.stop()
+        raise RuntimeError(f"next start did not listen on port {self.port} within {PERF_SERVER_START_TIMEOUT}s")
+
+    def _signal_group(self, sig):
+        try:
+            os.killpg(self.process.pid, sig)
+        except ProcessLookupError:
+            pass  # The whole group has exited already
+
+    def stop(self):
+        """Terminates the server's whole process group and waits for the port to close."""
+        if self.process is None:
+            return
+        self._signal_group(signal.SIGTERM)
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._signal_group(signal.SIGKILL)
+            self.process.wait()
+        deadline = time.monotonic() + 10
+        while self.port_in_use():
+            if time.monotonic() > deadline:
+                self._signal_group(signal.SIGKILL)
+                break
+            time.sleep(0.1)
+        self.process = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,138 @@
+"""
+Per-test and per-request SQL query accounting with N+1 detection.
+
+Enabled with `pytest --sql-accounting=test` or `--sql-accounting=request`. MySQL's
+performance_schema.events_statements_summary_by_digest is snapshotted around each test
+(setup, call and teardown) or, in request mode, around each HTTP request made through
+tests.perf.timed_request. Statement counts, total latency and rows examined are attributed to
+the test or route, and any digest repeated SQL_N_PLUS_ONE_THRESHOLD or more times within
+one unit is flagged as an N+1 candidate.
+
+Digest counters are server-wide, so request mode serializes timed_request calls to keep the
+attribution exact; use it for query counting, not for throughput numbers.
+"""
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import pytest
+
+from tests.config import SQL_N_PLUS_ONE_THRESHOLD
+from tests.db import connect, digest_delta, digest_snapshot
+
+_active = None
+
+def active_accounting():
+    """Returns the registered QueryAccounting plugin, or None when accounting is off."""
+    return _active
+
+class QueryAccounting:
+    """Pytest plugin that records SQL statements per test or per HTTP route."""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.units = []
+        self._lock = threading.Lock()
+        self._connection_context = connect(autocommit=True)
+        self._connection = None
+
+    # --- Snapshots ---
+
+    def _snapshot(self):
+        with self._connection.cursor() as cursor:
+            return digest_snapshot(cursor)
+
+    @contextmanager
+    def track(self, kind, name):
+        """Attributes every statement executed inside the block to (kind, name)."""
+        with self._lock:
+            before = self._snapshot()
+            yield
+            statements = digest_delta(before, self._snapshot())
+        self.units.append(self._summarize(kind, name, statements))
+
+    def track_request(self, method, url):
+        """Context manager used by tests.perf.timed_request in request mode."""
+        if self.mode != "request":
+            return _no_tracking()
+        return self.track("route", f"{method} {urlparse(url).path}")
+
+    @staticmethod
+    def _summarize(kind, name, statements):
+        return {
+            "kind": kind,
+            "name": name,
+            "statements": sum(s["count"] for s in statements),
+            "total_ms": round(sum(s["total_ms"] for s in statements), 3),
+            "rows_examined": sum(s["rows_examined"] for s in statements),
+            "n_plus_one": [
+                {"count": s["count"], "text": s["text"]}
+                for s in statements
+                if s["count"] >= SQL_N_PLUS_ONE_THRESHOLD
+            ],
+            "digests": statements,
+        }
+
+    # --- Pytest hooks ---
+
+    def pytest_sessionstart(self, session):
+        global _active
+        self._connection = self._connection_context.__enter__()
+        _active = self
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.mode != "test":
+            yield
+            return
+        with self.track("test", item.nodeid):
+            yield
+
+    def pytest_sessionfinish(self, session):
+        global _active
+        _active = None
+        self._connection_context.__exit__(None, None, None)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.units:
+            return
+        from tests.perf import write_report
+        merged = self._merge_routes() if self.mode == "request" else self.units
+        write_report(f"sql_accounting_{self.mode}", {"mode": self.mode, "units": merged})
+
+        terminalreporter.section(f"SQL accounting per {self.mode}")
+        for unit in sorted(merged, key=lambda u: u["statements"], reverse=True):
+            per_request = (f"  ({unit['statements_per_request']:.1f} stmts, {unit['ms_per_request']:.1f}ms "
+                           f"per request over {unit['requests']})" if "requests" in unit else "")
+            terminalreporter.write_line(
+                f"{unit['statements']:>6} stmts {unit['total_ms']:>10.1f}ms {unit['rows_examined']:>10} rows  {unit['name']}{per_request}"
+            )
+        candidates = [(unit["name"], n) for unit in merged for n in unit["n_plus_one"]]
+        if candidates:
+            terminalreporter.section("N+1 candidates")
+            for name, candidate in candidates:
+                terminalreporter.write_line(f"{candidate['count']:>5}x in {name}: {candidate['text'][:160]}")
+
+    def _merge_routes(self):
+        """Folds per-request units into one entry per route with per-request averages for N+1 checks."""
+        routes = {}
+        for unit in self.units:
+            route = routes.setdefault(unit["name"], {
+                "kind": "route", "name": unit["name"], "requests": 0,
+                "statements": 0, "total_ms": 0.0, "rows_examined": 0, "n_plus_one": [],
+            })
+            route["requests"] += 1
+            route["statements"] += unit["statements"]
+            route["total_ms"] = round(route["total_ms"] + unit["total_ms"], 3)
+            route["rows_examined"] += unit["rows_examined"]
+            known = {n["text"] for n in route["n_plus_one"]}
+            route["n_plus_one"].extend(n for n in unit["n_plus_one"] if n["text"] not in known)
+        for route in routes.values():
+            route["statements_per_request"] = round(route["statements"] / route["requests"], 2)
+            route["ms_per_request"] = round(route["total_ms"] / route["requests"], 3)
+            route["rows_examined_per_request"] = round(route["rows_examined"] / route["requests"], 1)
+        return list(routes.values())
+
+@contextmanager
+def _no_tracking():
+    yield
@@ -0,0 +1,291 @@
+"""
+Production traffic replay from access logs.
+
+    python -m tests.replay plan access.log -o plan.json     # parse and compile
+    python -m tests.replay run plan.json --speed 5          # replay against BASE_URL
+
+Two log formats are understood, detected per line:
+
+* JSON lines with `timestamp` (ISO 8601 or epoch seconds), `method`, `path` (may include the
+  query), optional `query`, `status`, `duration_ms` and `user` (anonymized user key).
+* Combined log format, optionally followed by `rt=<seconds>` and `uk=<user key>`, e.g.
+  `1.2.3.4 - - [10/Oct/2026:13:55:36 +0000] "GET /api/listings?page=2 HTTP/1.1" 200 512 "-" "UA" rt=0.042 uk=9f2c`
+
+Static assets (/_next/*, files with an extension) are dropped. The plan keeps each request's
+offset from the first one and its user key. During a replay, requests start at
+offset / speed. Requests of the same user never overtake each other, which keeps per-session
+ordering. User keys are mapped onto test accounts (tests/accounts.py) and product ids onto the
+seeded catalog. Request bodies are not logged, so cart and wishlist writes get synthesized
+bodies built from the session's last viewed product and current cart.
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from tests.accounts import AccountPool, authenticated_session
+from tests.config import BASE_URL, REPLAY_ACCOUNTS, REPLAY_WINDOW_SECONDS, REPLAY_WORKERS
+from tests.db import connect, product_ids
+from tests.perf import summarize, timed_request
+
+ANONYMOUS = "-"
+COMBINED_LOG = re.compile(
+    r'\S+ \S+ (?P<remote_user>\S+) \[(?P<time>[^\]]+)\] "(?P<method>[A-Z]+) (?P<target>\S+)[^"]*" '
+    r'(?P<status>\d{3}) \S+(?: "[^"]*" "[^"]*")?(?P<extra>.*)$'
+)
+PRODUCT_PATH = re.compile(r"^(/(?:api/)?products?/)(\d+)(?=/|$)")
+STATIC_PATH = re.compile(r"^/_next/|\.\w{2,5}$")
+
+# --- Parsing ---
+
+def _parse_time(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return datetime.strptime(value, "%d/%b/%Y:%H:%M:%S %z").timestamp()
+
+def parse_line(line):
+    """Returns {time, method, path, query, status, duration_ms, user} for one log line, or None."""
+    line = line.strip()
+    if not line:
+        return None
+    if line.startswith("{"):
+        record = json.loads(line)
+        target = urlsplit(record.get("path") or record.get("url", ""))
+        query = record.get("query") or target.query
+        return {
+            "time": _parse_time(record.get("timestamp", record.get("time"))),
+            "method": record.get("method", "GET").upper(),
+            "path": target.path,
+            "query": query if isinstance(query, str) else urlencode(query),
+            "status": int(record["status"]) if record.get("status") is not None else None,
+            "duration_ms": record.get("duration_ms", record.get("response_time")),
+            "user": str(record.get("user") or record.get("user_key") or ANONYMOUS),
+        }
+    match = COMBINED_LOG.match(line)
+    if not match:
+        return None
+    target = urlsplit(match["target"])
+    extra = dict(re.findall(r"(\w+)=(\S+)", match["extra"]))
+    return {
+        "time": _parse_time(match["time"]),
+        "method": match["method"],
+        "path": target.path,
+        "query": target.query,
+        "status": int(match["status"]),
+        "duration_ms": float(extra["rt"]) * 1000 if "rt" in extra else None,
+        "user": extra.get("uk") or match["remote_user"],
+    }
+
+def compile_plan(lines, window_seconds=REPLAY_WINDOW_SECONDS):
+    """Parses log lines into a replay plan: {"duration_s", "users", "requests": [...]} ordered by offset."""
+    entries = [entry for entry in map(parse_line, lines) if entry and not STATIC_PATH.search(entry["path"])]
+    entries.sort(key=lambda entry: entry["time"])
+    if not entries:
+        return {"duration_s": 0, "users": 0, "requests": []}
+    start = entries[0]["time"]
+    plan = []
+    for entry in entries:
+        offset = entry.pop("time") - start
+        if window_seconds is not None and offset > window_seconds:
+            break
+        plan.append({"offset_s": round(offset, 3), **entry})
+    return {
+        "duration_s": plan[-1]["offset_s"],
+        "users": len({entry["user"] for entry in plan if entry["user"] != ANONYMOUS}),
+        "requests": plan,
+    }
+
+def route_of(path):
+    """Collapses numeric path segments so /api/products/12 and /api/products/7 report together."""
+    return re.sub(r"/\d+(?=/|$)", "/[id]", path)
+
+# --- Replay ---
+
+class Replayer:
+    """Replays a plan against base_url with users mapped onto accounts and products onto catalog ids."""
+
+    def __init__(self, accounts, catalog, base_url=BASE_URL):
+        self.accounts = accounts
+        self.catalog = catalog
+        self.base_url = base_url
+        self._user_accounts = {}
+        self._products = {}
+        self._sessions = {}
+        self._last_product = {}
+        self._lock = threading.Lock()
+
+    def product_for(self, original_id):
+        """Maps a logged product id onto the seeded catalog, stable for the whole replay."""
+        with self._lock:
+            if original_id not in self._products:
+                self._products[original_id] = self.catalog[len(self._products) % len(self.catalog)]
+            return self._products[original_id]
+
+    def session_for(self, user):
+        """Returns the requests session for a logged user key (anonymous users share no cookies)."""
+        if user == ANONYMOUS or not self.accounts:
+            return requests.Session()
+        with self._lock:
+            if user not in self._sessions:
+                account = self.accounts[len(self._user_accounts) % len(self.accounts)]
+                self._user_accounts[user] = account
+                self._sessions[user] = authenticated_session(account)
+            return self._sessions[user]
+
+    def remap(self, entry):
+        """Returns (path, query) with product ids remapped to the catalog."""
+        path = PRODUCT_PATH.sub(lambda m: f"{m.group(1)}{self.product_for(m.group(2))}", entry["path"])
+        query = [
+            (key, self.product_for(value) if key == "productId" and value.isdigit() else value)
+            for key, value in parse_qsl(entry["query"], keep_blank_values=True)
+        ]
+        match = PRODUCT_PATH.match(path)
+        if match:
+            self._last_product[entry["user"]] = int(match.group(2))
+        return path, urlencode(query)
+
+    def body_for(self, entry, session):
+        """Synthesizes the JSON body a logged write would have carried, or None for reads."""
+        path = entry["path"]
+        product_id = self._last_product.get(entry["user"], self.catalog[0])
+        if path == "/api/cart/add":
+            return {"productId": product_id, "quantity": 1}
+        if path in ("/api/cart/update", "/api/cart/remove"):
+            response = session.get(f"{self.base_url}/api/cart", timeout=30)
+            items = response.json().get("items", []) if response.ok else []
+            if not items:
+                return None
+            if path == "/api/cart/update":
+                return {"itemId": items[0]["id"], "quantity": items[0]["quantity"] + 1}
+            return {"itemId": items[0]["id"]}
+        if path == "/api/wishlist" and entry["method"] in ("POST", "DELETE"):
+            return {"productId": product_id}
+        return None
+
+    def execute(self, entry, scheduled_at):
+        """Sends one planned request and returns its result record."""
+        lateness_ms = (time.perf_counter() - scheduled_at) * 1000
+        session = self.session_for(entry["user"])
+        path, query = self.remap(entry)
+        body = self.body_for(entry, session) if entry["method"] != "GET" else None
+        if entry["method"] != "GET" and body is None and path.startswith("/api/cart/"):
+            return {"route": route_of(entry["path"]), "skipped": True}
+        url = f"{self.base_url}{path}" + (f"?{query}" if query else "")
+        try:
+            response, elapsed_ms = timed_request(session, entry["method"], url, json=body)
+            status = response.status_code
+        except requests.RequestException:
+            status, elapsed_ms = None, None
+        return {
+            "route": route_of(entry["path"]),
+            "status": status,
+            "logged_status": entry["status"],
+            "latency_ms": elapsed_ms,
+            "logged_ms": entry["duration_ms"],
+            "lateness_ms": lateness_ms,
+        }
+
+    def replay(self, plan, speed, workers=REPLAY_WORKERS):
+        """Replays the plan at `speed`x and returns the per-request result records.
+
+        A request is submitted when its scheduled time arrives and first waits for the previous
+        request of the same user, so sessions keep their order even when the server falls behind.
+        """
+        previous = {}
+        futures = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            started = time.perf_counter()
+            for entry in plan["requests"]:
+                scheduled_at = started + entry["offset_s"] / speed
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                before = previous.get(entry["user"]) if entry["user"] != ANONYMOUS else None
+                future = executor.submit(self._after, before, entry, scheduled_at)
+                previous[entry["user"]] = future
+                futures.append(future)
+            results = [future.result() for future in futures]
+        return results, time.perf_counter() - started
+
+    def _after(self, before, entry, scheduled_at):
+        if before is not None:
+            before.result()
+        return self.execute(entry, scheduled_at)
+
+def summarize_replay(results, wall_seconds):
+    """Aggregates replay results: overall throughput and errors, then latency and status drift per route."""
+    sent = [r for r in results if not r.get("skipped")]
+    by_route = defaultdict(list)
+    for result in sent:
+        by_route[result["route"]].append(result)
+    return {
+        "requests": len(sent),
+        "skipped": len(results) - len(sent),
+        "wall_s": round(wall_seconds, 2),
+        "throughput_rps": round(len(sent) / wall_seconds, 2) if wall_seconds else None,
+        "errors": sum(1 for r in sent if r["status"] is None or r["status"] >= 500),
+        "lateness_ms": summarize([r["lateness_ms"] for r in sent]),
+        "routes": {
+            route: {
+                "latency": summarize([r["latency_ms"] for r in rows if r["latency_ms"] is not None]),
+                "logged_latency": summarize([r["logged_ms"] for r in rows if r["logged_ms"] is not None]),
+                "status_mismatches": sum(1 for r in rows if r["logged_status"] and r["status"] != r["logged_status"]),
+            }
+            for route, rows in sorted(by_route.items(), key=lambda item: -len(item[1]))
+        },
+    }
+
+# --- Entry point ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile access logs into replay plans and replay them.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    plan_parser = commands.add_parser("plan", help="Parse an access log into a replay plan.")
+    plan_parser.add_argument("log")
+    plan_parser.add_argument("-o", "--output", default="replay_plan.json")
+    run_parser = commands.add_parser("run", help="Replay a plan against BASE_URL.")
+    run_parser.add_argument("plan")
+    run_parser.add_argument("--speed", type=float, default=1)
+    args = parser.parse_args(argv)
+
+    if args.command == "plan":
+        with open(args.log, encoding="utf-8") as log:
+            plan = compile_plan(log)
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(plan, output)
+        print(f"{len(plan['requests'])} requests from {plan['users']} users over {plan['duration_s']:.0f}s -> {args.output}")
+        return 0
+
+    with open(args.plan, encoding="utf-8") as plan_file:
+        plan = json.load(plan_file)
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            catalog = product_ids(cursor)
+    pool = AccountPool(size=REPLAY_ACCOUNTS, prefix="perf-replay")
+    accounts = [pool.lease() for _ in range(REPLAY_ACCOUNTS)]
+    try:
+        results, wall_seconds = Replayer(accounts, catalog).replay(plan, args.speed)
+    finally:
+        for account in accounts:
+            pool.release(account)
+        pool.close()
+    print(json.dumps(summarize_replay(results, wall_seconds), indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
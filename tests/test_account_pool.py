@@ -0,0 +1,70 @@
+"""
+Tests for the pre-provisioned test account pool (tests/accounts.py).
+
+Requires a running app at BASE_URL and DB access (see tests/db.py); skipped when the DB_*
+settings are not available, so the functional suite still needs only BASE_URL.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from tests.accounts import authenticated_session, owner_prefix, sweep_stale_accounts
+from tests.config import BASE_URL
+from tests.db import connect, create_users, db_settings, delete_users, known_password_hash, user_data_counts
+
+try:
+    db_settings()
+except RuntimeError as e:
+    pytest.skip(f"Account pool tests need DB access: {e}", allow_module_level=True)
+
+# --- Test Data ---
+PRODUCT_ID = 1
+
+# --- Helper Functions ---
+
+def data_counts(user_id):
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            return user_data_counts(cursor, user_id)
+
+def finished_pid():
+    """Returns the pid of a process that has already exited."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+# --- Test Cases ---
+
+def test_tc_acct_001_release_wipes_leased_account(account_pool):
+    """TC-ACCT-001: Lease an account, add to its cart and wishlist, release it; all of its data is gone."""
+    account = account_pool.lease()
+    try:
+        session = authenticated_session(account)
+        for path, payload in [("/api/cart/add", {"productId": PRODUCT_ID, "quantity": 1}),
+                              ("/api/wishlist", {"productId": PRODUCT_ID})]:
+            response = session.post(f"{BASE_URL}{path}", json=payload, timeout=30)
+            assert response.ok, f"POST {path} as {account['email']}: HTTP {response.status_code}"
+        before = data_counts(account["id"])
+    finally:
+        account_pool.release(account)
+
+    assert before["carts"] and before["wishlists"], f"The leased account's changes were not stored: {before}"
+    after = data_counts(account["id"])
+    assert not any(after.values()), f"Released account still has data: {after}"
+
+def test_tc_acct_002_sweep_removes_accounts_of_finished_sessions(account_pool):
+    """TC-ACCT-002: Accounts left by a session whose process is gone are swept; live pools are kept."""
+    stale_prefix = owner_prefix(finished_pid())
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            create_users(cursor, stale_prefix, 2, known_password_hash(cursor))
+            try:
+                sweep_stale_accounts(cursor)
+            finally:
+                left_behind = delete_users(cursor, stale_prefix)
+            cursor.execute("SELECT COUNT(*) AS count FROM users WHERE email LIKE %s", (f"{account_pool.prefix}-%",))
+            live = cursor.fetchone()["count"]
+
+    assert left_behind == 0, f"{left_behind} accounts of a finished session survived the sweep"
+    assert live == len(account_pool.accounts), "The sweep removed accounts of the running session's pool"
@@ -0,0 +1,37 @@
+"""
+Tests for the distributed runner's command line (tests/distributed.py).
+
+Needs neither the app nor a WebDriver node.
+"""
+
+import shlex
+
+import pytest
+from tests import distributed
+
+# --- Test Data ---
+DOCUMENTED_COMMANDS = [
+    line.split("#")[0].strip()
+    for line in distributed.__doc__.splitlines()
+    if line.strip().startswith("python -m tests.distributed")
+]
+
+# --- Test Cases ---
+
+@pytest.mark.parametrize("command", DOCUMENTED_COMMANDS)
+def test_tc_dist_001_documented_command_lines_parse(command):
+    """TC-DIST-001: Every command line in the module docstring parses; arguments after `--` all go to pytest."""
+    argv = shlex.split(command)[3:]
+    _, args, pytest_args = distributed.parse_args(argv)
+    expected = argv[argv.index("--") + 1:] if "--" in argv else []
+    assert pytest_args == expected
+    assert not [module for module in args.modules if module.startswith("-")], f"Flags taken as modules: {args.modules}"
+
+def test_tc_dist_002_modules_and_pytest_args_are_separated():
+    """TC-DIST-002: Modules before `--` are distributed; flags after it are passed to every pytest run."""
+    _, args, pytest_args = distributed.parse_args(
+        ["tests/test_cart_page.py", "--endpoints", "http://a:4444", "--", "--perf", "-k", "cart"]
+    )
+    assert args.modules == ["tests/test_cart_page.py"]
+    assert args.endpoints == "http://a:4444"
+    assert pytest_args == ["--perf", "-k", "cart"]
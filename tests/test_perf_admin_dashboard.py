@@ -0,0 +1,109 @@
+"""
+Admin dashboard aggregation benchmark at realistic order volume.
+
+/api/admin/dashboard, /api/admin/orders and /api/admin/users compute counts, revenue and
+recent orders with live aggregates over orders/order_items on every page view. This benchmark
+grows a synthetic order history (spread over ADMIN_ORDER_HISTORY_YEARS) through each volume in
+ADMIN_ORDER_VOLUMES, hits the admin page and APIs as the admin user at every step and reports
+how latency grows with order count.
+
+Requires a running app at BASE_URL and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_admin_dashboard.py --perf
+"""
+import random
+
+import pytest
+import requests
+from tests.config import (
+    ADMIN_DASHBOARD_BUDGET_MS,
+    ADMIN_EMAIL,
+    ADMIN_ORDER_HISTORY_YEARS,
+    ADMIN_ORDER_VOLUMES,
+    ADMIN_PASSWORD,
+    ADMIN_REQUESTS_PER_ENDPOINT,
+    ADMIN_SEED_CUSTOMERS,
+    BASE_URL,
+)
+from tests.db import connect, create_users, delete_users, ensure_user, known_password_hash, product_prices, seed_orders
+from tests.perf import api_login, summarize, timed_request, write_report, write_series
+
+REPORT_NAME = "admin_dashboard"
+USER_PREFIX = "perf-admin"
+ENDPOINTS = ["/admin", "/api/admin/dashboard", "/api/admin/orders", "/api/admin/users"]
+
+# --- Helper Functions ---
+
+def count_orders(cursor):
+    cursor.execute("SELECT COUNT(*) AS total FROM orders")
+    return cursor.fetchone()["total"]
+
+def time_endpoints(session):
+    """Times ADMIN_REQUESTS_PER_ENDPOINT requests to each admin endpoint."""
+    timings = {}
+    for path in ENDPOINTS:
+        latencies = []
+        for _ in range(ADMIN_REQUESTS_PER_ENDPOINT):
+            response, elapsed_ms = timed_request(session, "GET", f"{BASE_URL}{path}")
+            assert response.status_code == 200, f"{path}: HTTP {response.status_code}"
+            latencies.append(elapsed_ms)
+        timings[path] = summarize(latencies)
+    return timings
+
+@pytest.fixture(scope="module")
+def admin_session():
+    """Logs in as the admin user, creating it with the test password if the database has none."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            ensure_user(cursor, ADMIN_EMAIL, "admin", known_password_hash(cursor), "ADMIN0001")
+    session = requests.Session()
+    api_login(session, ADMIN_EMAIL, ADMIN_PASSWORD)
+    return session
+
+@pytest.fixture(scope="module")
+def order_seeder():
+    """Yields a function that tops the orders table up to a target count with synthetic orders."""
+    rng = random.Random(34)
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+            customers = [user_id for user_id, _ in create_users(cursor, USER_PREFIX, ADMIN_SEED_CUSTOMERS, known_password_hash(cursor))]
+            products = product_prices(cursor)
+    assert products, "No products in the database to order"
+
+    def seed_to(target):
+        with connect() as connection:
+            with connection.cursor() as cursor:
+                missing = target - count_orders(cursor)
+                if missing > 0:
+                    seed_orders(cursor, customers, products, missing, ADMIN_ORDER_HISTORY_YEARS * 365, rng)
+                return count_orders(cursor)
+
+    yield seed_to
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_009_admin_dashboard_latency_vs_order_volume(admin_session, order_seeder):
+    """TC-PERF-009: Measure admin page and API latency as the order history grows."""
+    results = []
+    for volume in ADMIN_ORDER_VOLUMES:
+        orders = order_seeder(volume)
+        results.append({"orders": orders, "endpoints": time_endpoints(admin_session)})
+
+    write_report(REPORT_NAME, {"results": results})
+    write_series(REPORT_NAME, "orders", {
+        f"{path}_p50_ms".replace("/", "_").strip("_"): [(r["orders"], r["endpoints"][path]["p50"]) for r in results]
+        for path in ENDPOINTS
+    })
+
+    print(f"\n{'orders':>8} " + " ".join(f"{path:>22}" for path in ENDPOINTS))
+    for r in results:
+        print(f"{r['orders']:>8} " + " ".join(f"{r['endpoints'][path]['p95']:>20.1f}ms" for path in ENDPOINTS))
+
+    over_budget = [r["orders"] for r in results if r["endpoints"]["/api/admin/dashboard"]["p95"] > ADMIN_DASHBOARD_BUDGET_MS]
+    if over_budget:
+        print(f"/api/admin/dashboard exceeds {ADMIN_DASHBOARD_BUDGET_MS}ms p95 from {over_budget[0]} orders: "
+              f"consider pre-aggregated rollups")
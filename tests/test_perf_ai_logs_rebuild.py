@@ -0,0 +1,226 @@
+"""
+Benchmark and regression guard for the /featured -> /api/ai-logs/update rebuild.
+
+Every /featured visit calls /api/ai-logs/update. That route re-runs four INSERT ... SELECT
+statements over the last hour of browsing_history, wishlists and carts, with no check for
+rows it already logged. Its only guard is an in-process 5-minute throttle, and concurrent
+first visits all get past it before it is set. This benchmark seeds recent interactions for
+AI_LOGS_SEED_USERS users, then runs AI_LOGS_ROUNDS rounds. Each round starts a fresh
+`next start`, which resets the throttle just as a new instance or an elapsed window would. It
+then fires AI_LOGS_CONCURRENT_VISITS simultaneous /featured visits. Each round reports:
+
+* per-call latency of /api/ai-logs/update, and how many calls actually rebuilt;
+* rows inserted per visit and per rebuild;
+* duplication, meaning the seeded users' log rows divided by their distinct interactions (1.0 means no duplicates);
+* /api/recommendations latency for a seeded user, relative to before the first rebuild.
+
+The final rows per visit and duplication must stay within AI_LOGS_REGRESSION_TOLERANCE of the
+best recorded run, and update p95 within it of the median recorded run.
+
+Writes to ai_recommendation_logs for every user with recent activity, not only seeded ones.
+Requires `npm run build` and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_ai_logs_rebuild.py --perf
+"""
+import random
+import statistics
+from datetime import timedelta
+
+import pytest
+import requests
+from tests.config import (
+    AI_LOGS_CART_ITEMS_PER_USER,
+    AI_LOGS_CONCURRENT_VISITS,
+    AI_LOGS_REGRESSION_TOLERANCE,
+    AI_LOGS_ROUNDS,
+    AI_LOGS_SEED_USERS,
+    AI_LOGS_VIEWS_PER_USER,
+    AI_LOGS_WISHLIST_PER_USER,
+    PERF_SERVER_PORT,
+    RECOMMENDATION_REQUESTS_PER_USER,
+    VALID_PASSWORD,
+)
+from tests.db import connect, create_users, delete_users, insert_many, known_password_hash, product_ids
+from tests.perf import (
+    NextServer,
+    api_login,
+    load_history,
+    run_concurrently,
+    summarize,
+    thread_session,
+    timed_request,
+    write_report,
+    write_series,
+)
+
+REPORT_NAME = "ai_logs_rebuild"
+USER_PREFIX = "perf-ailogs"
+REBUILT_MESSAGE = "AI logs updated successfully"
+WINDOW_SECONDS = 50 * 60  # Seeded interactions stay inside the route's one-hour window for the whole run
+
+# --- Helper Functions ---
+
+def seed_recent_interactions(cursor, user_ids, products, rng):
+    """Gives every user views, wishlist entries and an active cart, all within the last WINDOW_SECONDS."""
+    cursor.execute("SELECT NOW() AS now")
+    now = cursor.fetchone()["now"]
+
+    def recent():
+        return now - timedelta(seconds=rng.randint(0, WINDOW_SECONDS))
+
+    insert_many(cursor, "INSERT INTO browsing_history (user_id, product_id, view_timestamp) VALUES (%s, %s, %s)", [
+        (user_id, rng.choice(products), recent()) for user_id in user_ids for _ in range(AI_LOGS_VIEWS_PER_USER)
+    ])
+    insert_many(cursor, "INSERT INTO wishlists (user_id, product_id, created_at) VALUES (%s, %s, %s)", [
+        (user_id, product_id, recent())
+        for user_id in user_ids for product_id in rng.sample(products, min(AI_LOGS_WISHLIST_PER_USER, len(products)))
+    ])
+    insert_many(cursor, "INSERT INTO carts (user_id, status) VALUES (%s, %s)", [(user_id, "active") for user_id in user_ids])
+    cursor.execute(
+        "SELECT c.id FROM carts c JOIN users u ON u.id = c.user_id WHERE u.email LIKE %s ORDER BY c.id",
+        (f"{USER_PREFIX}-%@mavs.uta.edu",),
+    )
+    insert_many(cursor, "INSERT INTO cart_items (cart_id, product_id, quantity, created_at) VALUES (%s, %s, %s, %s)", [
+        (row["id"], product_id, 1, recent())
+        for row in cursor.fetchall() for product_id in rng.sample(products, min(AI_LOGS_CART_ITEMS_PER_USER, len(products)))
+    ])
+
+def log_counts(cursor):
+    """Returns (all log rows, seeded users' log rows, seeded users' distinct interactions)."""
+    cursor.execute("SELECT COUNT(*) AS total FROM ai_recommendation_logs")
+    total = cursor.fetchone()["total"]
+    cursor.execute(
+        """
+        SELECT COUNT(*) AS seeded,
+               COUNT(DISTINCT l.user_id, l.product_id, l.interaction_type, l.recommendation_time) AS distinct_rows
+        FROM ai_recommendation_logs l JOIN users u ON u.id = l.user_id
+        WHERE u.email LIKE %s
+        """,
+        (f"{USER_PREFIX}-%@mavs.uta.edu",),
+    )
+    row = cursor.fetchone()
+    return total, row["seeded"], row["distinct_rows"]
+
+def visit_featured(base_url):
+    """Loads /featured the way the browser does: the page, then the update call its effect makes."""
+    session = thread_session()
+    timed_request(session, "GET", f"{base_url}/featured")
+    response, elapsed_ms = timed_request(session, "GET", f"{base_url}/api/ai-logs/update")
+    rebuilt = response.status_code == 200 and response.json().get("message") == REBUILT_MESSAGE
+    return {"status": response.status_code, "latency_ms": elapsed_ms, "rebuilt": rebuilt}
+
+def time_recommendations(base_url, email):
+    session = requests.Session()
+    api_login(session, email, VALID_PASSWORD, base_url)
+    latencies = []
+    for _ in range(RECOMMENDATION_REQUESTS_PER_USER):
+        response, elapsed_ms = timed_request(session, "GET", f"{base_url}/api/recommendations")
+        assert response.status_code == 200, f"/api/recommendations: HTTP {response.status_code}"
+        latencies.append(elapsed_ms)
+    return summarize(latencies)
+
+def regressions(current, history):
+    """Lists the guarded metrics that grew past AI_LOGS_REGRESSION_TOLERANCE over the recorded runs.
+
+    Rows per visit and duplication are compared against the best recorded run, so slow growth
+    across many runs adds up instead of resetting each time. Update p95 is noisy, so it is
+    compared against the median run.
+    """
+    failures = []
+    for metric, pick, label in [("rows_per_visit", min, "best"), ("duplication", min, "best"),
+                                ("update_p95_ms", statistics.median, "median")]:
+        recorded = [run[metric] for run in history if run.get(metric)]
+        after = current[metric]
+        if not recorded or after is None:
+            continue
+        before = pick(recorded)
+        if after > before * AI_LOGS_REGRESSION_TOLERANCE:
+            failures.append(f"{metric} {after:.2f} vs {before:.2f} ({label} of {len(recorded)} recorded runs)")
+    return failures
+
+@pytest.fixture(scope="module")
+def seeded_users():
+    """Creates AI_LOGS_SEED_USERS users with recent interactions; yields one email to time recommendations with."""
+    rng = random.Random(42)
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+            products = product_ids(cursor)
+            assert products, "No products in the database to seed interactions against"
+            users = create_users(cursor, USER_PREFIX, AI_LOGS_SEED_USERS, known_password_hash(cursor))
+            seed_recent_interactions(cursor, [user_id for user_id, _ in users], products, rng)
+    yield users[0][1]
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_016_featured_ai_logs_rebuild(seeded_users):
+    """TC-PERF-016: Measure /api/ai-logs/update cost, duplicate amplification and the /api/recommendations slowdown."""
+    history = load_history(REPORT_NAME)
+    rounds = []
+    baseline = None
+    server = NextServer(PERF_SERVER_PORT)
+    try:
+        for round_number in range(AI_LOGS_ROUNDS + 1):
+            server.start()
+            if round_number == 0:
+                # Before any rebuild in this run
+                baseline = time_recommendations(server.base_url, seeded_users)
+                server.stop()
+                continue
+            with connect() as connection:
+                with connection.cursor() as cursor:
+                    total_before, _, _ = log_counts(cursor)
+            visits = run_concurrently(lambda _: visit_featured(server.base_url), range(AI_LOGS_CONCURRENT_VISITS), AI_LOGS_CONCURRENT_VISITS)
+            with connect() as connection:
+                with connection.cursor() as cursor:
+                    total_after, seeded, distinct_rows = log_counts(cursor)
+            recommendations = time_recommendations(server.base_url, seeded_users)
+            server.stop()
+
+            inserted = total_after - total_before
+            rebuilds = sum(1 for visit in visits if visit["rebuilt"])
+            rounds.append({
+                "round": round_number,
+                "visits": len(visits),
+                "errors": sum(1 for visit in visits if visit["status"] >= 500),
+                "rebuilds": rebuilds,
+                "update_latency": summarize([visit["latency_ms"] for visit in visits]),
+                "rows_inserted": inserted,
+                "rows_per_visit": round(inserted / len(visits), 1),
+                "rows_per_rebuild": round(inserted / rebuilds, 1) if rebuilds else None,
+                "seeded_log_rows": seeded,
+                "duplication": round(seeded / distinct_rows, 2) if distinct_rows else None,
+                "recommendations": recommendations,
+                "recommendations_slowdown": round(recommendations["p95"] / baseline["p95"], 2),
+            })
+    finally:
+        server.stop()
+
+    last = rounds[-1]
+    current = {
+        "rows_per_visit": last["rows_per_visit"],
+        "duplication": last["duplication"],
+        "update_p95_ms": last["update_latency"]["p95"],
+    }
+    write_report(REPORT_NAME, {"recommendations_baseline": baseline, "rounds": rounds, **current})
+    write_series(REPORT_NAME, "round", {
+        "rows_inserted": [(r["round"], r["rows_inserted"]) for r in rounds],
+        "duplication": [(r["round"], r["duplication"]) for r in rounds],
+        "update_p95_ms": [(r["round"], r["update_latency"]["p95"]) for r in rounds],
+        "recommendations_p95_ms": [(r["round"], r["recommendations"]["p95"]) for r in rounds],
+    }, log_x=False)
+
+    print(f"\n{'round':>5} {'rebuilds':>9} {'rows':>8} {'rows/visit':>11} {'dup':>6} {'update p95':>11} {'recs p95':>10} {'slowdown':>9}")
+    for r in rounds:
+        print(f"{r['round']:>5} {r['rebuilds']:>4}/{r['visits']:<4} {r['rows_inserted']:>8} {r['rows_per_visit']:>11.1f} "
+              f"{r['duplication'] or 0:>5.2f}x {r['update_latency']['p95']:>9.1f}ms {r['recommendations']['p95']:>8.1f}ms "
+              f"{r['recommendations_slowdown']:>8.2f}x")
+    if any(r["rebuilds"] > 1 for r in rounds):
+        print("Concurrent visits ran the rebuild more than once: the 5-minute throttle is checked before it is set")
+
+    assert not any(r["errors"] for r in rounds), "/api/ai-logs/update returned 5xx"
+    failures = regressions(current, history)
+    assert not failures, "ai-logs rebuild regressed: " + "; ".join(failures)
@@ -0,0 +1,67 @@
+"""
+Semester-start sign-up/login storm benchmark.
+
+Runs the storm from tests/auth_storm.py at each offered rate in AUTH_STORM_RATES for
+AUTH_STORM_STEP_SECONDS, after a probes-only baseline. Each step reports sign-up and login
+latency and status codes, the user id collisions the sign-up route ran into, and the stall
+seen by the /api/listings and event-loop-only probes. The ramp stops at the first rate that is
+not sustainable (see auth_storm.sustainable). The highest sustainable rate is reported as the
+max sustainable auth rate.
+
+Signs up real users under the perf-auth-signup prefix and deletes them afterwards.
+Requires a running app at BASE_URL and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_auth_storm.py --perf
+"""
+import pytest
+from tests.auth_storm import AUTH_KINDS, PROBES, AuthStorm, create_login_users, delete_storm_users
+from tests.config import AUTH_STORM_RATES, AUTH_STORM_STEP_SECONDS
+from tests.perf import over_baseline, write_report, write_series
+
+REPORT_NAME = "auth_storm"
+KINDS = list(AUTH_KINDS) + list(PROBES)
+
+# --- Helper Functions ---
+
+@pytest.fixture(scope="module")
+def auth_storm():
+    """Creates the login accounts; removes them and every signed-up account afterwards."""
+    yield AuthStorm(create_login_users())
+    delete_storm_users()
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_023_auth_storm_capacity(auth_storm):
+    """TC-PERF-023: Ramp concurrent sign-ups and logins; report latency, probe stall and the max sustainable auth rate."""
+    baseline = auth_storm.run(0, AUTH_STORM_STEP_SECONDS)
+    steps = []
+    for rate in AUTH_STORM_RATES:
+        step = auth_storm.run(rate, AUTH_STORM_STEP_SECONDS)
+        step["stall_ms"] = {kind: over_baseline(step, baseline, kind) for kind in PROBES}
+        steps.append(step)
+        if not step["sustainable"]:
+            break
+
+    max_sustainable = max((s["offered_rate"] for s in steps if s["sustainable"]), default=None)
+    write_report(REPORT_NAME, {"baseline": baseline, "steps": steps, "max_sustainable_rate": max_sustainable})
+    write_series(REPORT_NAME, "offered_rate", {
+        "achieved_rate": [(s["offered_rate"], s["achieved_rate"]) for s in steps],
+        **{f"{kind}_p95_ms": [(s["offered_rate"], s["latency"].get(kind, {}).get("p95")) for s in steps] for kind in KINDS},
+        **{f"{kind}_stall_p95_ms": [(s["offered_rate"], s["stall_ms"][kind]["p95"]) for s in steps] for kind in PROBES},
+    })
+
+    print(f"\n{'rate':>6} {'achieved':>9} {'errors':>7} {'id 409s':>8} " + " ".join(f"{kind + ' p95':>20}" for kind in KINDS)
+          + " " + " ".join(f"{kind + ' stall':>22}" for kind in PROBES) + f" {'ok':>4}")
+    for s in steps:
+        cells = [s["latency"].get(kind, {}).get("p95") for kind in KINDS] + [s["stall_ms"][kind]["p95"] for kind in PROBES]
+        widths = [20] * len(KINDS) + [22] * len(PROBES)
+        print(f"{s['offered_rate']:>6} {s['achieved_rate']:>9.1f} {s['auth_failed']:>7} {s['id_conflicts']:>8} "
+              + " ".join(f"{c:>{w - 2}.1f}ms" if c is not None else f"{'-':>{w}}" for c, w in zip(cells, widths))
+              + f" {'yes' if s['sustainable'] else 'no':>4}")
+    print(f"Max sustainable auth rate: {max_sustainable} req/s" if max_sustainable is not None
+          else f"No rate in {AUTH_STORM_RATES} was sustainable")
+    if any(s["id_conflicts"] for s in steps):
+        print("Sign-ups collided on the route's random 5-digit user id and were answered 409")
+
+    failures = {s["offered_rate"]: s["statuses"] for s in steps[:1] if s["auth_failed"]}
+    assert not failures, f"Auth requests failed at the lowest rate: {failures}"
@@ -0,0 +1,141 @@
+"""
+Warm-vs-cold browser cache effectiveness for repeat visits.
+
+Runs the home -> listings -> PDP -> cart journey twice in the same Chrome profile. The first
+pass starts from an empty HTTP cache; the second shows what a returning shopper re-downloads.
+For every route, CDP network events are classified as memory cache, disk cache, revalidated
+(304) or network, and the Cache-Control/ETag headers of each resource are recorded so caching
+gaps for /api/products/featured, /api/category, JS chunks and product images are measurable.
+
+Requires a running app at BASE_URL. Run with: pytest tests/test_perf_browser_cache.py --perf
+"""
+from collections import Counter, defaultdict
+from urllib.parse import urlparse
+
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+from tests.cdp import clear_browser_cache, collect_requests, drain_network_events, wait_for_network_idle
+from tests.config import BASE_URL
+from tests.conftest import login
+from tests.perf import write_report
+
+REPORT_NAME = "browser_cache"
+CACHE_SOURCES = ("memory", "disk")
+
+# --- Test Data ---
+PRODUCT_ID = "1"
+JOURNEY = [
+    ("home", "/"),
+    ("listings", "/listings"),
+    ("pdp", f"/product/{PRODUCT_ID}"),
+    ("cart", "/cart"),
+]
+
+# --- Helper Functions ---
+
+def resource_key(url):
+    """Groups requests by path so hashed chunks and query-string variants stay readable."""
+    parsed = urlparse(url)
+    return parsed.path if parsed.netloc == urlparse(BASE_URL).netloc else f"{parsed.netloc}{parsed.path}"
+
+def summarize_route(requests_seen, sizes):
+    """Totals requests and bytes by cache source and resource type for one page load.
+
+    CDP reports (almost) no bytes for a cache hit, so cached_bytes counts each hit at the size of
+    the last network fetch of the same resource. sizes ({resource: bytes}) holds those sizes; it is
+    shared across passes and updated here.
+    """
+    for r in requests_seen:
+        if r["source"] == "network":
+            sizes[resource_key(r["url"])] = r["bytes"]
+    cached_sizes = [
+        sizes.get(resource_key(r["url"]), r["bytes"]) if r["source"] in CACHE_SOURCES else None for r in requests_seen
+    ]
+    sources = Counter(r["source"] for r in requests_seen)
+    by_type = defaultdict(lambda: {"requests": 0, "network_bytes": 0, "cached": 0, "cached_bytes": 0})
+    for r, cached_size in zip(requests_seen, cached_sizes):
+        bucket = by_type[r["resource_type"]]
+        bucket["requests"] += 1
+        bucket["network_bytes"] += r["bytes"] if r["source"] in ("network", "revalidated") else 0
+        bucket["cached"] += r["source"] in CACHE_SOURCES
+        bucket["cached_bytes"] += cached_size or 0
+    return {
+        "requests": len(requests_seen),
+        "network_bytes": sum(r["bytes"] for r in requests_seen if r["source"] in ("network", "revalidated")),
+        "cached_bytes": {
+            source: sum(size for r, size in zip(requests_seen, cached_sizes) if r["source"] == source)
+            for source in CACHE_SOURCES
+        },
+        "sources": dict(sources),
+        "by_type": dict(by_type),
+        "resources": [
+            {
+                "resource": resource_key(r["url"]),
+                "type": r["resource_type"],
+                "source": r["source"],
+                "bytes": r["bytes"],
+                "cached_bytes": cached_size,
+                "cache_control": r["headers"].get("cache-control"),
+                "etag": r["headers"].get("etag"),
+            }
+            for r, cached_size in zip(requests_seen, cached_sizes)
+        ],
+    }
+
+def run_journey(driver, sizes):
+    """Visits each journey route and returns {route name: summary}."""
+    results = {}
+    for name, path in JOURNEY:
+        drain_network_events(driver)
+        driver.get(f"{BASE_URL}{path}")
+        wait_for_network_idle(driver)
+        results[name] = summarize_route(collect_requests(drain_network_events(driver)), sizes)
+    return results
+
+def caching_gaps(warm_pass):
+    """Lists resources that were fetched from the network again on the warm pass, with their headers."""
+    gaps = {}
+    for name, summary in warm_pass.items():
+        for resource in summary["resources"]:
+            if resource["source"] == "network":
+                gaps.setdefault(resource["resource"], {
+                    "route": name,
+                    "type": resource["type"],
+                    "cache_control": resource["cache_control"],
+                    "etag": resource["etag"],
+                })
+    return gaps
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_004_browser_cache_effectiveness(perf_driver):
+    """TC-PERF-004: Compare cold and warm passes of the shopping journey in one browser profile."""
+    driver = perf_driver
+    login(driver, WebDriverWait(driver, 10))
+    clear_browser_cache(driver)
+
+    sizes = {}
+    cold = run_journey(driver, sizes)
+    warm = run_journey(driver, sizes)
+    gaps = caching_gaps(warm)
+
+    write_report(REPORT_NAME, {"cold": cold, "warm": warm, "gaps": gaps})
+    print(f"\n{'route':<10} {'pass':<5} {'requests':>9} {'net KB':>9} {'mem KB':>9} {'disk KB':>9} "
+          f"{'memory':>7} {'disk':>6} {'304':>5} {'network':>8}")
+    for name, _ in JOURNEY:
+        for label, run in (("cold", cold), ("warm", warm)):
+            summary = run[name]
+            sources, cached = summary["sources"], summary["cached_bytes"]
+            print(
+                f"{name:<10} {label:<5} {summary['requests']:>9} {summary['network_bytes'] / 1024:>9.1f} "
+                f"{cached['memory'] / 1024:>9.1f} {cached['disk'] / 1024:>9.1f} "
+                f"{sources.get('memory', 0):>7} {sources.get('disk', 0):>6} {sources.get('revalidated', 0):>5} {sources.get('network', 0):>8}"
+            )
+    print(f"\nRe-downloaded on the warm pass ({len(gaps)}):")
+    for resource, info in sorted(gaps.items()):
+        print(f"  [{info['type']}] {resource}  cache-control={info['cache_control']!r} etag={info['etag']!r}")
+
+    cold_bytes = sum(s["network_bytes"] for s in cold.values())
+    warm_bytes = sum(s["network_bytes"] for s in warm.values())
+    assert warm_bytes <= cold_bytes, f"Warm pass transferred more than the cold pass ({warm_bytes} > {cold_bytes} bytes)"
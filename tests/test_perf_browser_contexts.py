@@ -0,0 +1,97 @@
+"""
+Parallel logged-in users in isolated browser contexts of a single Chrome.
+
+Seeds BROWSER_CONTEXT_POOL_SIZE users, logs each one in from its own browser context (see
+tests/browser_contexts.py) in parallel threads and walks cart and wishlist. Every context must
+still see its own user afterwards, which proves cookies are not shared between contexts. The
+report compares the memory of that Chrome and its chromedrivers against one standalone Chrome
+per user.
+
+Requires a running app at BASE_URL and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_browser_contexts.py --perf
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from tests.config import BASE_URL, BROWSER_CONTEXT_POOL_SIZE, VALID_PASSWORD
+from tests.conftest import chrome_options, create_chrome, login
+from tests.db import connect, create_users, delete_users, known_password_hash
+from tests.perf import process_tree_rss_mb, run_concurrently, write_report
+
+REPORT_NAME = "browser_contexts"
+USER_PREFIX = "perf-ctx"
+
+# --- Locators ---
+BODY = (By.TAG_NAME, "body")
+
+# --- Helper Functions ---
+
+_CURRENT_USER_JS = """
+const done = arguments[arguments.length - 1];
+fetch('/api/auth/current-user', {credentials: 'same-origin'})
+  .then((response) => response.ok ? response.json() : null)
+  .then((user) => done(user ? user.email : null))
+  .catch(() => done(null));
+"""
+
+def current_user_email(driver):
+    """Asks the app which user this context's cookies belong to."""
+    return driver.execute_async_script(_CURRENT_USER_JS)
+
+def browse_as(session):
+    """Logs one context in and visits its cart and wishlist."""
+    (driver, wait), email = session
+    login(driver, wait, email, VALID_PASSWORD)
+    for path in ["/cart", "/wishlist"]:
+        driver.get(f"{BASE_URL}{path}")
+        wait.until(EC.presence_of_element_located(BODY))
+    return email
+
+def standalone_chrome_rss_mb():
+    """Memory of one ordinary Chrome (as the `driver` fixture starts) showing the home page."""
+    driver = create_chrome(chrome_options())
+    try:
+        driver.get(BASE_URL)
+        return process_tree_rss_mb(driver.service.process.pid)
+    finally:
+        driver.quit()
+
+@pytest.fixture(scope="module")
+def context_users():
+    """Creates BROWSER_CONTEXT_POOL_SIZE users with the test password and removes them afterwards."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+            users = create_users(cursor, USER_PREFIX, BROWSER_CONTEXT_POOL_SIZE, known_password_hash(cursor))
+    yield [email for _, email in users]
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_010_parallel_users_in_isolated_browser_contexts(browser_context_pool, context_sessions, context_users):
+    """TC-PERF-010: Log in different users in parallel contexts of one Chrome; check isolation and memory."""
+    sessions = context_sessions(len(context_users))
+    run_concurrently(browse_as, list(zip(sessions, context_users)), len(sessions))
+
+    mismatched = []
+    for (driver, _), email in zip(sessions, context_users):
+        seen = current_user_email(driver)
+        if seen != email:
+            mismatched.append(f"{email} sees {seen}")
+
+    pool_rss = browser_context_pool.rss_mb()
+    single_rss = standalone_chrome_rss_mb()
+    report = {
+        "contexts": len(sessions),
+        "pool_rss_mb": pool_rss,
+        "standalone_chrome_rss_mb": single_rss,
+        "one_chrome_per_user_estimate_mb": round(single_rss * len(sessions), 1),
+    }
+    write_report(REPORT_NAME, report)
+    print(f"\n{len(sessions)} contexts in one Chrome (with their chromedrivers): {pool_rss:.0f} MB; "
+          f"one Chrome per user: ~{report['one_chrome_per_user_estimate_mb']:.0f} MB")
+
+    assert not mismatched, "Browser contexts share cookies: " + "; ".join(mismatched)
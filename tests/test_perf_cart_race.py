@@ -0,0 +1,262 @@
+"""
+Same-user concurrent cart mutation race and lock-time test.
+
+The cart routes read cart_items and then write in separate statements, under plain
+(non-locking) reads. Two tabs, or a double-click on the +/- buttons, can therefore race. For
+one leased account, each scenario fires CART_RACE_BURST simultaneous calls to
+/api/cart/add, /api/cart/update and /api/cart/remove, starting from a wiped cart each round
+(CART_RACE_ROUNDS rounds). After each burst, the final rows are read back from the database.
+
+Checked every round:
+* no call fails with a 5xx;
+* the user ends with at most one active cart;
+* no (product, size, color) appears in two rows;
+* concurrent adds are conserved: the final quantity equals the number of adds that succeeded;
+* concurrent removes of one item delete it and leave every other row as it was.
+
+Lost increments from +1 updates (a double-click, or two tabs doing read-then-PUT) are
+reported. They are asserted only with CART_RACE_ASSERT_INCREMENTS, because
+PUT /api/cart/update takes an absolute quantity.
+
+The remove DELETE is idempotent, so extra removes answered 200 in the same burst lose no data.
+They are reported as duplicate_removes and never fail the test.
+
+Each scenario reports per-call latency, throughput, InnoDB row lock waits and lock time
+(Innodb_row_lock_*), and statement lock time on the cart tables. A fix can then be shown to be
+correct without giving up throughput.
+
+Requires a running app at BASE_URL and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_cart_race.py --perf
+"""
+import threading
+import time
+from collections import Counter, defaultdict
+
+import pytest
+from tests.accounts import AUTH_COOKIE
+from tests.config import BASE_URL, CART_RACE_ASSERT_INCREMENTS, CART_RACE_BURST, CART_RACE_ROUNDS
+from tests.db import connect, digest_delta, digest_snapshot, global_status, wipe_user_data
+from tests.perf import run_concurrently, summarize, thread_session, timed_request, write_report
+
+REPORT_NAME = "cart_race"
+LOCK_COUNTERS = ["Innodb_row_lock_waits", "Innodb_row_lock_time"]
+VARIANT = {"selectedSize": "M", "selectedColor": "Blue"}
+
+# --- Helper Functions ---
+
+def call(token, kind, method, path, body):
+    response, elapsed_ms = timed_request(
+        thread_session(), method, f"{BASE_URL}{path}", json=body, cookies={AUTH_COOKIE: token}
+    )
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    return {"kind": kind, "status": response.status_code, "latency_ms": elapsed_ms, "body": body}
+
+def fire(token, calls):
+    """Sends every (kind, method, path, body) at once: all threads are released together by a barrier."""
+    barrier = threading.Barrier(len(calls))
+
+    def send(spec):
+        barrier.wait()
+        return call(token, *spec)
+
+    return run_concurrently(send, calls, len(calls))
+
+def add(product_id, variant=None):
+    return ("add", "POST", "/api/cart/add", {"productId": product_id, "quantity": 1, **(variant or {})})
+
+def update(item_id, quantity):
+    return ("update", "PUT", "/api/cart/update", {"itemId": item_id, "quantity": quantity})
+
+def remove(item_id):
+    return ("remove", "DELETE", "/api/cart/remove", {"itemId": item_id})
+
+def cart_state(user_id):
+    """Returns (active cart count, [item rows]) for the user straight from the database."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) AS carts FROM carts WHERE user_id = %s AND status = 'active'", (user_id,))
+            carts = cursor.fetchone()["carts"]
+            cursor.execute(
+                """
+                SELECT ci.id, ci.product_id, ci.quantity, ci.selected_size, ci.selected_color
+                FROM carts c JOIN cart_items ci ON ci.cart_id = c.id
+                WHERE c.user_id = %s AND c.status = 'active'
+                """,
+                (user_id,),
+            )
+            return carts, cursor.fetchall()
+
+def reset(user_id):
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            wipe_user_data(cursor, user_id)
+
+def seed_item(account, product_id, variant=None):
+    """Adds one unit of a product through the API and returns its cart item row."""
+    result = call(account["token"], *add(product_id, variant))
+    assert result["status"] == 200, f"Seeding product {product_id} failed: HTTP {result['status']}"
+    _, items = cart_state(account["id"])
+    return next(item for item in items if item["product_id"] == product_id)
+
+def invariant_violations(carts, items):
+    problems = []
+    if carts > 1:
+        problems.append(f"{carts} active carts")
+    duplicates = [key for key, n in Counter((i["product_id"], i["selected_size"], i["selected_color"]) for i in items).items() if n > 1]
+    if duplicates:
+        problems.append(f"duplicate rows for {duplicates}")
+    return problems
+
+# --- Scenarios ---
+# Each returns (call records, {check name: value}) for one round on a wiped cart.
+
+def scenario_add_same_variant(account, products):
+    records = fire(account["token"], [add(products[0], VARIANT)] * CART_RACE_BURST)
+    carts, items = cart_state(account["id"])
+    added = sum(1 for r in records if r["status"] == 200)
+    quantity = sum(i["quantity"] for i in items if i["product_id"] == products[0])
+    return records, {"lost_adds": added - quantity, "violations": invariant_violations(carts, items)}
+
+def scenario_add_no_variant(account, products):
+    records = fire(account["token"], [add(products[0])] * CART_RACE_BURST)
+    carts, items = cart_state(account["id"])
+    added = sum(1 for r in records if r["status"] == 200)
+    quantity = sum(i["quantity"] for i in items if i["product_id"] == products[0])
+    return records, {"lost_adds": added - quantity, "violations": invariant_violations(carts, items)}
+
+def scenario_double_click_update(account, products):
+    item = seed_item(account, products[0])
+    # Every click before the re-render sends the quantity it saw plus one
+    records = fire(account["token"], [update(item["id"], item["quantity"] + 1)] * CART_RACE_BURST)
+    carts, items = cart_state(account["id"])
+    final = next(i["quantity"] for i in items if i["id"] == item["id"])
+    applied = sum(1 for r in records if r["status"] == 200)
+    return records, {"lost_increments": applied - (final - item["quantity"]), "violations": invariant_violations(carts, items)}
+
+def scenario_two_tab_increment(account, products):
+    item = seed_item(account, products[0])
+    barrier = threading.Barrier(CART_RACE_BURST)
+
+    def read_then_increment(_):
+        barrier.wait()
+        read = call(account["token"], "read", "GET", "/api/cart", None)
+        if read["status"] != 200:
+            return [read]
+        current = next(i["quantity"] for i in read["body"]["items"] if i["id"] == item["id"])
+        return [read, call(account["token"], *update(item["id"], current + 1))]
+
+    records = [r for pair in run_concurrently(read_then_increment, range(CART_RACE_BURST), CART_RACE_BURST) for r in pair]
+    carts, items = cart_state(account["id"])
+    final = next(i["quantity"] for i in items if i["id"] == item["id"])
+    applied = sum(1 for r in records if r["kind"] == "update" and r["status"] == 200)
+    return records, {"lost_increments": applied - (final - item["quantity"]), "violations": invariant_violations(carts, items)}
+
+def scenario_remove_same_item(account, products):
+    item = seed_item(account, products[0])
+    bystander = seed_item(account, products[1])
+    records = fire(account["token"], [remove(item["id"])] * CART_RACE_BURST)
+    carts, items = cart_state(account["id"])
+    problems = invariant_violations(carts, items)
+    if any(i["id"] == item["id"] for i in items):
+        problems.append("removed item is still in the cart")
+    if items != [bystander]:
+        problems.append(f"removing one item changed the other rows: {bystander} became {items}")
+    # The DELETE is idempotent, so several removes answered 200 lose nothing; reported only
+    removed = sum(1 for r in records if r["status"] == 200)
+    return records, {"duplicate_removes": max(removed - 1, 0), "violations": problems}
+
+def scenario_mixed(account, products):
+    updated = seed_item(account, products[0], VARIANT)
+    removed = seed_item(account, products[1], VARIANT)
+    calls = []
+    for n in range(CART_RACE_BURST):
+        calls.append([add(products[2], VARIANT), update(updated["id"], updated["quantity"] + 1), remove(removed["id"])][n % 3])
+    records = fire(account["token"], calls)
+    carts, items = cart_state(account["id"])
+    adds = sum(1 for r in records if r["kind"] == "add" and r["status"] == 200)
+    quantity = sum(i["quantity"] for i in items if i["product_id"] == products[2])
+    return records, {"lost_adds": adds - quantity, "violations": invariant_violations(carts, items)}
+
+SCENARIOS = {
+    "add_same_variant": scenario_add_same_variant,
+    "add_no_variant": scenario_add_no_variant,
+    "double_click_update": scenario_double_click_update,
+    "two_tab_increment": scenario_two_tab_increment,
+    "remove_same_item": scenario_remove_same_item,
+    "mixed": scenario_mixed,
+}
+
+def run_scenario(scenario, account, products):
+    """Runs CART_RACE_ROUNDS rounds of a scenario and aggregates latency, correctness and lock statistics."""
+    records, checks = [], defaultdict(list)
+    busy_seconds = 0.0
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            locks_before, digests_before = global_status(cursor, LOCK_COUNTERS), digest_snapshot(cursor)
+    for _ in range(CART_RACE_ROUNDS):
+        reset(account["id"])
+        started = time.perf_counter()
+        round_records, round_checks = scenario(account, products)
+        busy_seconds += time.perf_counter() - started
+        records.extend(round_records)
+        for name, value in round_checks.items():
+            checks[name].append(value)
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            locks_after, digests_after = global_status(cursor, LOCK_COUNTERS), digest_snapshot(cursor)
+    cart_statements = digest_delta(digests_before, digests_after, text_filter="cart")
+    by_kind = defaultdict(list)
+    for record in records:
+        by_kind[record["kind"]].append(record)
+    return {
+        "calls": len(records),
+        "throughput_rps": round(len(records) / busy_seconds, 1),
+        "errors": sum(1 for r in records if r["status"] >= 500),
+        "statuses": {kind: dict(Counter(r["status"] for r in rows)) for kind, rows in by_kind.items()},
+        "latency": {kind: summarize([r["latency_ms"] for r in rows]) for kind, rows in by_kind.items()},
+        "row_lock_waits": locks_after["Innodb_row_lock_waits"] - locks_before["Innodb_row_lock_waits"],
+        "row_lock_time_ms": locks_after["Innodb_row_lock_time"] - locks_before["Innodb_row_lock_time"],
+        "statement_lock_ms": round(sum(s["lock_ms"] for s in cart_statements), 2),
+        "lost_adds": sum(checks.get("lost_adds", [])),
+        "lost_increments": sum(checks.get("lost_increments", [])),
+        "duplicate_removes": sum(checks.get("duplicate_removes", [])),
+        "violations": [problem for problems in checks["violations"] for problem in problems],
+    }
+
+@pytest.fixture(scope="module")
+def race_products():
+    """Three products with enough stock for a burst of adds and increments."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id FROM products WHERE stock_quantity >= %s ORDER BY id LIMIT 3", (CART_RACE_BURST * 2 + 1,))
+            products = [row["id"] for row in cursor.fetchall()]
+    if len(products) < 3:
+        pytest.skip(f"Needs three products with at least {CART_RACE_BURST * 2 + 1} in stock")
+    return products
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_018_same_user_cart_mutation_race(leased_account, race_products):
+    """TC-PERF-018: Fire parallel add/update/remove bursts for one user; check final quantities, latency and lock waits."""
+    results = {name: run_scenario(scenario, leased_account, race_products) for name, scenario in SCENARIOS.items()}
+    write_report(REPORT_NAME, {"burst": CART_RACE_BURST, "rounds": CART_RACE_ROUNDS, "scenarios": results})
+
+    print(f"\n{'scenario':<22} {'rps':>7} {'p95 ms':>8} {'5xx':>5} {'lock waits':>11} {'lock ms':>8} {'lost adds':>10} "
+          f"{'lost incr':>10} {'dup removes':>12}")
+    for name, r in results.items():
+        p95 = max(stats["p95"] for stats in r["latency"].values())
+        print(f"{name:<22} {r['throughput_rps']:>7.1f} {p95:>8.1f} {r['errors']:>5} {r['row_lock_waits']:>11} "
+              f"{r['row_lock_time_ms']:>8} {r['lost_adds']:>10} {r['lost_increments']:>10} {r['duplicate_removes']:>12}")
+        for problem in sorted(set(r["violations"])):
+            print(f"  {problem}")
+
+    failures = [f"{name}: {r['errors']} calls returned 5xx" for name, r in results.items() if r["errors"]]
+    failures += [f"{name}: {r['lost_adds']} adds lost" for name, r in results.items() if r["lost_adds"]]
+    failures += [f"{name}: {problem}" for name, r in results.items() for problem in sorted(set(r["violations"]))]
+    if CART_RACE_ASSERT_INCREMENTS:
+        failures += [f"{name}: {r['lost_increments']} increments lost" for name, r in results.items() if r["lost_increments"]]
+    assert not failures, "Cart mutation race: " + "; ".join(failures)
@@ -0,0 +1,60 @@
+"""
+Incremental catalog re-seed benchmark.
+
+Syncs the products table with constants/*.json through tests/catalog.py, then applies a
+one-product edit, reverts it, and re-syncs with no edit. Each sync is timed and its counts
+checked: the edit and the revert each rewrite exactly one product, the no-op writes nothing,
+and every incremental sync finishes within CATALOG_INCREMENTAL_BUDGET_S.
+
+Requires DB access (see tests/db.py). Leaves the catalog as it is in constants/.
+Run with: pytest tests/test_perf_catalog_loader.py --perf
+"""
+import copy
+
+import pytest
+from tests.catalog import image_url, read_catalog, sync_catalog
+from tests.config import CATALOG_INCREMENTAL_BUDGET_S
+from tests.db import connect
+from tests.perf import write_report
+
+REPORT_NAME = "catalog_loader"
+
+# --- Helper Functions ---
+
+def product_price(pid):
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT price FROM products WHERE image_url = %s ORDER BY id LIMIT 1", (image_url(pid),))
+            return float(cursor.fetchone()["price"])
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_019_incremental_catalog_reseed():
+    """TC-PERF-019: Re-seed after a one-product edit rewrites only that product, in under the budget."""
+    catalog = read_catalog()
+    assert catalog, "No catalog records found in constants/"
+    initial = sync_catalog(catalog)
+
+    pid = sorted(catalog)[0]
+    edited = copy.deepcopy(catalog)
+    edited[pid]["record"]["price"] = "$1234.56"
+    edit = sync_catalog(edited)
+    edited_price = product_price(pid)
+    revert = sync_catalog(catalog)
+    noop = sync_catalog(catalog)
+
+    runs = {"initial": initial, "edit": edit, "revert": revert, "noop": noop}
+    write_report(REPORT_NAME, {"records": len(catalog), "runs": runs})
+    print(f"\n{'sync':<8} {'inserted':>9} {'updated':>8} {'unchanged':>10} {'deleted':>8} {'seconds':>8}")
+    for name, run in runs.items():
+        print(f"{name:<8} {run['inserted']:>9} {run['updated']:>8} {run['unchanged']:>10} {run['deleted']:>8} {run['seconds']:>8.3f}")
+
+    assert edited_price == 1234.56, f"Edited price was not written (product has {edited_price})"
+    assert product_price(pid) == float(catalog[pid]["record"]["price"].replace("$", ""))
+    for name, expected_updates in [("edit", 1), ("revert", 1), ("noop", 0)]:
+        run = runs[name]
+        assert (run["inserted"], run["updated"], run["deleted"]) == (0, expected_updates, 0), f"{name} sync wrote {run}"
+        assert run["seconds"] <= CATALOG_INCREMENTAL_BUDGET_S, (
+            f"{name} sync took {run['seconds']:.3f}s, over the {CATALOG_INCREMENTAL_BUDGET_S}s budget"
+        )
@@ -0,0 +1,162 @@
+"""
+Category browsing benchmark and validator for /category/[category].
+
+Category pages call /api/category?categoryId=<id>&page=<n>, which runs a COUNT(*) and an
+ORDER BY ... LIMIT 12 OFFSET query for every page. For every category in
+constants/categories.js (walked concurrently, one thread per category), this walks every page
+and records latency by category and page. It then checks:
+
+* the slug -> id mapping is the same in constants/categories.js, the category page and
+  /api/categories/count;
+* totalProducts matches /api/categories/count, and the pages together list exactly that many
+  distinct products, each once and each labelled with the category's name;
+* every page but the last is full.
+
+The stress case has CATEGORY_STRESS_WALKERS clients walking every page of CATEGORY_STRESS_SLUG
+at once, and its p95 must stay within CATEGORY_P95_BUDGET_MS. The counts hard-coded on the
+home page's FeaturedCategories cards are reported against the live counts but do not fail the test.
+
+Requires a running app at BASE_URL. Run with: pytest tests/test_perf_category_pages.py --perf
+"""
+import os
+import re
+from collections import Counter
+
+import pytest
+from tests.config import BASE_URL, CATEGORY_P95_BUDGET_MS, CATEGORY_STRESS_SLUG, CATEGORY_STRESS_WALKERS, PROJECT_ROOT
+from tests.perf import run_concurrently, summarize, thread_session, timed_request, write_report, write_series
+
+REPORT_NAME = "category_pages"
+CATEGORIES_PATH = os.path.join(PROJECT_ROOT, "constants", "categories.js")
+CATEGORY_PAGE_PATH = os.path.join(PROJECT_ROOT, "app", "category", "[category]", "page.jsx")
+COUNT_ROUTE_PATH = os.path.join(PROJECT_ROOT, "app", "api", "categories", "count", "route.js")
+HOME_CARDS_PATH = os.path.join(PROJECT_ROOT, "components", "FeaturedCategories.jsx")
+
+# --- Helper Functions ---
+
+def read_source(path):
+    with open(path, encoding="utf-8") as source:
+        return source.read()
+
+def categories():
+    """Reads [{id, name, slug}] from constants/categories.js so new categories are walked automatically."""
+    return [
+        {"id": int(category_id), "name": name, "slug": slug}
+        for category_id, name, slug in re.findall(
+            r'id:\s*(\d+),\s*name:\s*"([^"]+)".*?slug:\s*"([^"]+)"', read_source(CATEGORIES_PATH), re.S)
+    ]
+
+def mapping_mismatches(expected):
+    """Lists slugs whose id differs between constants/categories.js, the category page and the count route."""
+    page_block = re.search(r"const categoryIds = \{(.*?)\};", read_source(CATEGORY_PAGE_PATH), re.S).group(1)
+    page_ids = {slug: int(category_id) for slug, category_id in re.findall(r'"?([\w-]+)"?:\s*(\d+)', page_block)}
+    count_block = re.search(r"const categoryMap = \{(.*?)\};", read_source(COUNT_ROUTE_PATH), re.S).group(1)
+    count_ids = {slug: int(category_id) for category_id, slug in re.findall(r'(\d+):\s*"([\w-]+)"', count_block)}
+    mismatches = []
+    for category in expected:
+        found = {"category page": page_ids.get(category["slug"]), "/api/categories/count": count_ids.get(category["slug"])}
+        mismatches += [f"{category['slug']}: id {category['id']} in constants, {found_id} in {where}"
+                       for where, found_id in found.items() if found_id != category["id"]]
+    return mismatches
+
+def home_card_counts():
+    """Returns {name: count} as hard-coded on the home page's FeaturedCategories cards."""
+    return {name: int(count) for name, count in re.findall(r'name:\s*"([^"]+)".*?count:\s*(\d+)', read_source(HOME_CARDS_PATH), re.S)}
+
+def live_counts():
+    response, _ = timed_request(thread_session(), "GET", f"{BASE_URL}/api/categories/count")
+    assert response.status_code == 200, f"/api/categories/count: HTTP {response.status_code}"
+    return response.json()["categoryCounts"]
+
+def walk_category(category):
+    """Fetches every /api/category page for one category; returns per-page latency, ids and labels."""
+    session = thread_session()
+    pages, page, total_pages, total_products, limit = [], 1, 1, 0, None
+    while page <= total_pages:
+        response, elapsed_ms = timed_request(
+            session, "GET", f"{BASE_URL}/api/category", params={"categoryId": category["id"], "page": page})
+        assert response.status_code == 200, f"{category['slug']} page {page}: HTTP {response.status_code}"
+        data = response.json()
+        total_pages = data["pagination"]["totalPages"]
+        total_products = data["pagination"]["totalProducts"]
+        limit = data["pagination"]["limit"]
+        pages.append({
+            "page": page,
+            "latency_ms": round(elapsed_ms, 2),
+            "ids": [product["id"] for product in data["products"]],
+            "labels": {product["category"] for product in data["products"]},
+        })
+        page += 1
+    return {**category, "total_pages": total_pages, "total_products": total_products, "limit": limit, "pages": pages}
+
+def validate(walk, expected_count):
+    """Lists the ways one category walk disagrees with /api/categories/count or with itself."""
+    problems = []
+    seen = Counter(product_id for page in walk["pages"] for product_id in page["ids"])
+    if walk["total_products"] != expected_count:
+        problems.append(f"totalProducts {walk['total_products']} vs {expected_count} from /api/categories/count")
+    if len(seen) != walk["total_products"]:
+        problems.append(f"{len(seen)} distinct products listed vs totalProducts {walk['total_products']}")
+    duplicates = sorted(product_id for product_id, count in seen.items() if count > 1)
+    if duplicates:
+        problems.append(f"{len(duplicates)} products on several pages")
+    labels = set().union(*(page["labels"] for page in walk["pages"])) - {walk["name"]}
+    if labels:
+        problems.append(f"products labelled {sorted(labels)}")
+    short = [page["page"] for page in walk["pages"][:-1] if len(page["ids"]) != walk["limit"]]
+    if short:
+        problems.append(f"pages {short} hold fewer than {walk['limit']} products")
+    return problems
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_022_category_pages():
+    """TC-PERF-022: Walk every page of every category; validate counts against /api/categories/count and record latency."""
+    expected = categories()
+    assert expected, f"No categories found in {CATEGORIES_PATH}"
+    stress = next((c for c in expected if c["slug"] == CATEGORY_STRESS_SLUG), None)
+    assert stress, f"Stress category {CATEGORY_STRESS_SLUG!r} is not in {CATEGORIES_PATH}"
+    counts = live_counts()
+    walks = run_concurrently(walk_category, expected, len(expected))
+    stress_walks = run_concurrently(lambda _: walk_category(stress), range(CATEGORY_STRESS_WALKERS), CATEGORY_STRESS_WALKERS)
+
+    problems = [f"mapping: {m}" for m in mapping_mismatches(expected)]
+    report = []
+    for walk in walks:
+        problems += [f"{walk['slug']}: {p}" for p in validate(walk, counts.get(walk["slug"]))]
+        report.append({
+            "slug": walk["slug"],
+            "total_pages": walk["total_pages"],
+            "total_products": walk["total_products"],
+            "latency": summarize([page["latency_ms"] for page in walk["pages"]]),
+            "latency_by_page": [(page["page"], page["latency_ms"]) for page in walk["pages"]],
+        })
+    stress_latency = summarize([page["latency_ms"] for walk in stress_walks for page in walk["pages"]])
+    cards = home_card_counts()
+    stale_cards = {c["name"]: {"card": cards[c["name"]], "live": counts.get(c["slug"])}
+                   for c in expected if c["name"] in cards and cards[c["name"]] != counts.get(c["slug"])}
+
+    write_report(REPORT_NAME, {
+        "categories": report,
+        "stress": {"slug": CATEGORY_STRESS_SLUG, "walkers": CATEGORY_STRESS_WALKERS, "latency": stress_latency},
+        "home_card_counts_stale": stale_cards,
+        "problems": problems,
+    })
+    write_series(REPORT_NAME, "page", {f"{r['slug']}_ms": r["latency_by_page"] for r in report}, log_x=False)
+
+    print(f"\n{'category':<16} {'products':>9} {'pages':>6} {'p50 ms':>8} {'p95 ms':>8} {'first':>8} {'last':>8}")
+    for r in report:
+        first, last = r["latency_by_page"][0][1], r["latency_by_page"][-1][1]
+        print(f"{r['slug']:<16} {r['total_products']:>9} {r['total_pages']:>6} {r['latency']['p50']:>8.1f} "
+              f"{r['latency']['p95']:>8.1f} {first:>8.1f} {last:>8.1f}")
+    print(f"{CATEGORY_STRESS_SLUG} x{CATEGORY_STRESS_WALKERS} walkers: p50 {stress_latency['p50']:.1f}ms, "
+          f"p95 {stress_latency['p95']:.1f}ms over {stress_latency['count']} pages")
+    for name, stale in stale_cards.items():
+        print(f"Home page card {name!r} shows {stale['card']} items; the category has {stale['live']}")
+
+    assert not problems, "Category pages are inconsistent: " + "; ".join(problems)
+    assert stress_latency["p95"] <= CATEGORY_P95_BUDGET_MS, (
+        f"/api/category p95 {stress_latency['p95']:.0f}ms for {CATEGORY_STRESS_SLUG} with {CATEGORY_STRESS_WALKERS} "
+        f"concurrent walkers exceeds the {CATEGORY_P95_BUDGET_MS}ms budget"
+    )
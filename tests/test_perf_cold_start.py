@@ -0,0 +1,84 @@
+"""
+Cold-start vs warm-path latency benchmark for every route in app/.
+
+Starts a fresh `next start` against the production build, records the latency of the
+first request to each page and GET API handler, then K steady-state requests. The cold
+penalty (first hit minus warm p50) is written to perf_results/ and compared with the
+previous run so regressions in route compilation, module loading or the database/db.js
+pool warm-up are visible over time.
+
+Requires `npm run build` beforehand. Run with: pytest tests/test_perf_cold_start.py --perf
+"""
+import pytest
+import requests
+from tests.config import COLD_START_ISOLATE_ROUTES, COLD_START_SKIP_ROUTES, COLD_START_WARM_REQUESTS, PERF_SERVER_PORT
+from tests.perf import NextServer, discover_routes, load_history, summarize, timed_request, write_report
+
+REPORT_NAME = "cold_start"
+
+# --- Helper Functions ---
+
+def measure_route(base_url, path, warm_requests):
+    """Times the first request to a path, then warm_requests more on the same connection."""
+    session = requests.Session()
+    response, cold_ms = timed_request(session, "GET", f"{base_url}{path}")
+    warm_samples = []
+    for _ in range(warm_requests):
+        _, elapsed_ms = timed_request(session, "GET", f"{base_url}{path}")
+        warm_samples.append(elapsed_ms)
+    warm = summarize(warm_samples)
+    return {
+        "status": response.status_code,
+        "cold_ms": round(cold_ms, 2),
+        "warm": warm,
+        "cold_penalty_ms": round(cold_ms - warm["p50"], 2) if warm["p50"] is not None else None,
+    }
+
+def previous_penalties():
+    """Returns {route: cold_penalty_ms} from the last recorded run, if any."""
+    history = load_history(REPORT_NAME)
+    if not history:
+        return {}
+    return {r["route"]: r["cold_penalty_ms"] for r in history[-1]["routes"]}
+
+def print_report(results, previous):
+    print(f"\n{'route':<42} {'status':>6} {'cold ms':>9} {'warm p50':>9} {'penalty':>9} {'delta':>9}")
+    for r in sorted(results, key=lambda r: r["cold_penalty_ms"] or 0, reverse=True):
+        before = previous.get(r["route"])
+        delta = f"{r['cold_penalty_ms'] - before:+.1f}" if before is not None and r["cold_penalty_ms"] is not None else "-"
+        warm = f"{r['warm']['p50']:.1f}" if r["warm"]["p50"] is not None else "-"
+        penalty = f"{r['cold_penalty_ms']:.1f}" if r["cold_penalty_ms"] is not None else "-"
+        print(f"{r['route']:<42} {r['status']:>6} {r['cold_ms']:>9.1f} {warm:>9} {penalty:>9} {delta:>9}")
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_001_cold_start_penalty_per_route():
+    """TC-PERF-001: Measure cold (first hit) vs warm latency for every page and API route."""
+    routes = [r for r in discover_routes() if r["route"] not in COLD_START_SKIP_ROUTES]
+    assert routes, "No routes discovered under app/"
+    previous = previous_penalties()
+    results = []
+
+    server = NextServer(PERF_SERVER_PORT)
+    try:
+        if not COLD_START_ISOLATE_ROUTES:
+            server.start()
+        for route in routes:
+            if COLD_START_ISOLATE_ROUTES:
+                server.stop()
+                server.start()
+            measurement = measure_route(server.base_url, route["path"], COLD_START_WARM_REQUESTS)
+            results.append({**route, **measurement})
+    finally:
+        server.stop()
+
+    write_report(REPORT_NAME, {
+        "warm_requests": COLD_START_WARM_REQUESTS,
+        "isolated": COLD_START_ISOLATE_ROUTES,
+        "routes": results,
+    })
+    print_report(results, previous)
+
+    server_errors = [r["route"] for r in results if r["status"] >= 500]
+    assert not server_errors, f"Routes returned 5xx during the benchmark: {server_errors}"
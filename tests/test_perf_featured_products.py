@@ -0,0 +1,140 @@
+"""
+Throughput and pricing-consistency benchmark for /api/products/featured.
+
+The home page's featured section (TC-HOME-002) calls this endpoint on every visit. Each call
+runs a sales check and a top-8 query, then builds a PricingService for every product. The
+benchmark drives FEATURED_REQUESTS_PER_LEVEL requests at each level in
+FEATURED_CONCURRENCY_LEVELS. It splits server time using the route's Server-Timing header:
+pool (waiting for a connection), db (both queries) and pricing (the per-product
+PricingService loop). Everything else in the client-measured latency is framework,
+serialization and network overhead.
+
+Every response must price each product identically: price, originalPrice and discount must
+match across concurrent calls, and must match the PricingService rules applied to the
+product's row in the database.
+
+Requires a running app at BASE_URL and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_featured_products.py --perf
+"""
+import math
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+from tests.config import BASE_URL, FEATURED_CONCURRENCY_LEVELS, FEATURED_P95_BUDGET_MS, FEATURED_REQUESTS_PER_LEVEL
+from tests.db import connect
+from tests.perf import run_concurrently, server_timing, summarize, thread_session, timed_request, write_report, write_series
+
+REPORT_NAME = "featured_products"
+ENDPOINT = "/api/products/featured"
+PHASES = ["pool", "db", "pricing"]
+
+# --- Helper Functions ---
+
+def expected_price(base_price, total_sales, stock_quantity, month=None):
+    """Mirrors services/pricingService.js as /api/products/featured configures it (regular user)."""
+    month = datetime.now().month - 1 if month is None else month  # JS getMonth() is 0-based
+    time_factor = 1.1 if 7 <= month <= 9 or 0 <= month <= 2 else 1.0
+    demand_factor = 1.1 if (total_sales or 0) > 10 else 1.0
+    inventory_factor = 1.15 if (stock_quantity or 100) <= 5 else 1.0
+    final_price = base_price * time_factor * demand_factor * inventory_factor * 1.0
+    return math.floor(final_price * 100 + 0.5) / 100  # Math.round(x * 100) / 100
+
+def fetch_featured(_):
+    response, elapsed_ms = timed_request(thread_session(), "GET", f"{BASE_URL}{ENDPOINT}")
+    record = {"status": response.status_code, "latency_ms": elapsed_ms, "timings": server_timing(response), "prices": {}}
+    if response.status_code == 200:
+        products = response.json()["products"]
+        record["prices"] = {p["id"]: (p["price"], p["originalPrice"], p["discount"]) for p in products}
+    return record
+
+def database_prices(product_ids):
+    """Returns {id: (price, originalPrice, discount)} computed from the products table."""
+    if not product_ids:
+        return {}
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT id, CAST(price AS DECIMAL(10,2)) AS price, total_sales, stock_quantity FROM products WHERE id IN ("
+                + ", ".join(["%s"] * len(product_ids)) + ")",
+                tuple(product_ids),
+            )
+            rows = cursor.fetchall()
+    prices = {}
+    for row in rows:
+        base = float(row["price"])
+        price = expected_price(base, row["total_sales"], row["stock_quantity"])
+        prices[row["id"]] = (price, base, math.floor((base - price) / base * 100 + 0.5) if base > price else 0)
+    return prices
+
+def pricing_mismatches(records, expected):
+    """Lists products whose prices differ between responses or from the database rules."""
+    seen = defaultdict(set)
+    for record in records:
+        for product_id, price in record["prices"].items():
+            seen[product_id].add(price)
+    mismatches = []
+    for product_id, prices in sorted(seen.items()):
+        if len(prices) > 1:
+            mismatches.append(f"product {product_id}: {len(prices)} different prices across calls {sorted(prices)}")
+        elif expected.get(product_id) not in prices:
+            mismatches.append(f"product {product_id}: served {next(iter(prices))}, expected {expected.get(product_id)}")
+    return mismatches
+
+def measure_level(concurrency):
+    started = time.perf_counter()
+    records = run_concurrently(fetch_featured, range(FEATURED_REQUESTS_PER_LEVEL), concurrency)
+    wall_seconds = time.perf_counter() - started
+    ok = [r for r in records if r["status"] == 200]
+    timed = [r for r in ok if all(phase in r["timings"] for phase in PHASES)]
+    return records, {
+        "concurrency": concurrency,
+        "requests": len(records),
+        "errors": len(records) - len(ok),
+        "throughput_rps": round(len(records) / wall_seconds, 1),
+        "latency": summarize([r["latency_ms"] for r in ok]),
+        "server_timing": {phase: summarize([r["timings"][phase] for r in timed]) for phase in PHASES},
+        "pricing_per_product_ms": summarize([r["timings"]["pricing"] / len(r["prices"]) for r in timed if r["prices"]]),
+        "overhead_ms": summarize([r["latency_ms"] - sum(r["timings"][phase] for phase in PHASES) for r in timed]),
+    }
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_017_featured_products_throughput_and_pricing():
+    """TC-PERF-017: Drive /api/products/featured at rising concurrency; split SQL vs pricing time; check price consistency."""
+    levels = []
+    mismatches = {}
+    for concurrency in FEATURED_CONCURRENCY_LEVELS:
+        records, level = measure_level(concurrency)
+        expected = database_prices(sorted({product_id for r in records for product_id in r["prices"]}))
+        level["pricing_mismatches"] = pricing_mismatches(records, expected)
+        mismatches[concurrency] = level["pricing_mismatches"]
+        levels.append(level)
+
+    write_report(REPORT_NAME, {"levels": levels})
+    write_series(REPORT_NAME, "concurrency", {
+        "throughput_rps": [(l["concurrency"], l["throughput_rps"]) for l in levels],
+        "latency_p95_ms": [(l["concurrency"], l["latency"]["p95"]) for l in levels],
+        **{f"{phase}_p95_ms": [(l["concurrency"], l["server_timing"][phase]["p95"]) for l in levels] for phase in PHASES},
+    })
+
+    print(f"\n{'conc':>5} {'rps':>8} {'p50':>9} {'p95':>9} {'pool p95':>9} {'db p95':>9} {'pricing p95':>12} {'overhead p50':>13}")
+    for l in levels:
+        timing = l["server_timing"]
+        cells = [timing[phase]["p95"] for phase in PHASES] + [l["overhead_ms"]["p50"]]
+        print(f"{l['concurrency']:>5} {l['throughput_rps']:>8.1f} {l['latency']['p50']:>7.1f}ms {l['latency']['p95']:>7.1f}ms "
+              + " ".join(f"{c:>7.2f}ms" if c is not None else f"{'-':>9}" for c in cells))
+    if all(l["server_timing"]["db"]["count"] == 0 for l in levels):
+        print(f"{ENDPOINT} sent no Server-Timing header; only end-to-end latency was measured")
+
+    assert not any(l["errors"] for l in levels), f"{ENDPOINT} failed: " + ", ".join(
+        f"{l['errors']} errors at concurrency {l['concurrency']}" for l in levels if l["errors"])
+    assert not any(mismatches.values()), "Inconsistent featured prices: " + "; ".join(
+        f"concurrency {c}: {m}" for c, found in mismatches.items() for m in found)
+    heaviest = levels[-1]
+    assert heaviest["latency"]["p95"] <= FEATURED_P95_BUDGET_MS, (
+        f"{ENDPOINT} p95 {heaviest['latency']['p95']:.0f}ms at concurrency {heaviest['concurrency']} "
+        f"exceeds the {FEATURED_P95_BUDGET_MS}ms budget"
+    )
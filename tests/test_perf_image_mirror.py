@@ -0,0 +1,92 @@
+"""
+What the home page's external images cost, live versus served from the local mirror.
+
+Loads the home page IMAGE_MIRROR_LOADS times from an empty browser cache in each mode. In
+"live" mode the images come from IMAGE_MIRROR_HOSTS, either directly or through Next's
+/_next/image optimizer. In "mirrored" mode they come from tests/image_mirror.py. Each load
+records navigation-to-load time and, from the Resource Timing entries of the external images,
+their count, their summed duration and the span from the first one starting to the last one
+finishing. The report gives the load time the mirror saves and that saving as a share of the
+live load.
+
+Requires a running app at BASE_URL, a filled mirror (python -m tests.image_mirror) and network
+access for the live pass. Run with: pytest tests/test_perf_image_mirror.py --perf
+"""
+import pytest
+from tests.cdp import clear_browser_cache, navigation_load_ms, wait_for_network_idle
+from tests.config import BASE_URL, IMAGE_MIRROR_LOADS
+from tests.conftest import apply_selected_device_profile, chrome_options, create_chrome
+from tests.image_mirror import ImageMirror, source_url
+from tests.perf import summarize, write_report
+
+REPORT_NAME = "image_mirror"
+RESOURCE_TIMING_SCRIPT = (
+    "return performance.getEntriesByType('resource').map(e => [e.name, e.startTime, e.responseEnd]);"
+)
+
+# --- Helper Functions ---
+
+def load_home(driver):
+    """Loads the home page from an empty cache; returns its load time and external image timings."""
+    clear_browser_cache(driver)
+    driver.get("about:blank")
+    driver.get(BASE_URL)
+    wait_for_network_idle(driver)
+    images = [(start, end) for name, start, end in driver.execute_script(RESOURCE_TIMING_SCRIPT) if source_url(name)]
+    return {
+        "load_ms": navigation_load_ms(driver),
+        "external_requests": len(images),
+        "external_total_ms": round(sum(end - start for start, end in images), 1),
+        "external_span_ms": round(max(end for _, end in images) - min(start for start, _ in images), 1) if images else 0.0,
+    }
+
+def summarize_mode(loads):
+    return {
+        "load_ms": summarize([l["load_ms"] for l in loads if l["load_ms"] is not None]),
+        "external_requests": max((l["external_requests"] for l in loads), default=0),
+        "external_total_ms": summarize([l["external_total_ms"] for l in loads]),
+        "external_span_ms": summarize([l["external_span_ms"] for l in loads]),
+    }
+
+@pytest.fixture(scope="function")
+def home_driver(request):
+    """A fresh Chrome without --image-mirror applied, so the test controls when images are mirrored."""
+    _driver = create_chrome(chrome_options())
+    apply_selected_device_profile(request.config, _driver)
+    yield _driver
+    _driver.quit()
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_021_external_image_cost(home_driver):
+    """TC-PERF-021: Compare home-page load time with external images fetched live and served from the local mirror."""
+    live = summarize_mode([load_home(home_driver) for _ in range(IMAGE_MIRROR_LOADS)])
+    with ImageMirror(home_driver) as mirror:
+        mirrored = summarize_mode([load_home(home_driver) for _ in range(IMAGE_MIRROR_LOADS)])
+
+    live_p50, mirrored_p50 = live["load_ms"]["p50"], mirrored["load_ms"]["p50"]
+    saved_ms = round(live_p50 - mirrored_p50, 1) if live_p50 is not None and mirrored_p50 is not None else None
+    share = round(saved_ms / live_p50, 3) if saved_ms is not None and live_p50 else None
+    write_report(REPORT_NAME, {
+        "live": live,
+        "mirrored": mirrored,
+        "load_saved_p50_ms": saved_ms,
+        "load_share_external": share,
+        "served_from_mirror": dict(mirror.served),
+        "missing_from_mirror": dict(mirror.misses),
+    })
+
+    print(f"\n{'mode':>9} {'load p50':>10} {'load p95':>10} {'images':>7} {'image span p50':>15} {'image total p50':>16}")
+    for mode, summary in [("live", live), ("mirrored", mirrored)]:
+        cells = [summary["load_ms"]["p50"], summary["load_ms"]["p95"]]
+        print(f"{mode:>9} " + " ".join(f"{c:>8.1f}ms" if c is not None else f"{'-':>10}" for c in cells)
+              + f" {summary['external_requests']:>7} {summary['external_span_ms']['p50'] or 0:>13.1f}ms "
+              f"{summary['external_total_ms']['p50'] or 0:>14.1f}ms")
+    if share is not None:
+        print(f"External images cost {saved_ms:.0f}ms ({share:.0%}) of the live home-page load")
+
+    assert not mirror.misses, (
+        f"{len(mirror.misses)} external images are not mirrored; run `python -m tests.image_mirror`: {sorted(mirror.misses)}"
+    )
+    assert mirror.served, "No external image requests were intercepted on the home page"
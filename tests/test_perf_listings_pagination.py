@@ -0,0 +1,90 @@
+"""
+Deep-pagination crawler for /api/listings across every sort option.
+
+app/api/listings/route.js runs COUNT(*) plus ORDER BY ... LIMIT ? OFFSET ? for every page.
+For each sort in constants/sort-options.js (crawled concurrently, one thread per sort) this
+walks every page, records latency against page number, and checks that the pages together
+list every product exactly once, which fails when ties in the sort key (common for price)
+let rows shift between pages.
+
+Requires a running app at BASE_URL. Run with: pytest tests/test_perf_listings_pagination.py --perf
+"""
+import os
+import re
+from collections import Counter
+
+import pytest
+from tests.config import BASE_URL, LISTINGS_MAX_PAGES, PROJECT_ROOT
+from tests.perf import run_concurrently, summarize, thread_session, timed_request, write_report, write_series
+
+REPORT_NAME = "listings_pagination"
+SORT_OPTIONS_PATH = os.path.join(PROJECT_ROOT, "constants", "sort-options.js")
+
+# --- Helper Functions ---
+
+def sort_values():
+    """Reads the sort option values from constants/sort-options.js so new sorts are crawled automatically."""
+    with open(SORT_OPTIONS_PATH, encoding="utf-8") as source:
+        return re.findall(r'value:\s*"([^"]+)"', source.read())
+
+def crawl_sort(sort):
+    """Fetches every page for one sort and returns per-page latency and product ids."""
+    session = thread_session()
+    pages, page, total_pages, total_products = [], 1, 1, 0
+    while page <= total_pages and (LISTINGS_MAX_PAGES is None or page <= LISTINGS_MAX_PAGES):
+        response, elapsed_ms = timed_request(session, "GET", f"{BASE_URL}/api/listings", params={"page": page, "sort": sort})
+        assert response.status_code == 200, f"sort={sort} page={page}: HTTP {response.status_code}"
+        data = response.json()
+        total_pages = data["pagination"]["totalPages"]
+        total_products = data["pagination"]["totalProducts"]
+        pages.append({
+            "page": page,
+            "latency_ms": round(elapsed_ms, 2),
+            "ids": [product["id"] for product in data["products"]],
+        })
+        page += 1
+    return {"sort": sort, "total_pages": total_pages, "total_products": total_products, "pages": pages}
+
+def check_consistency(crawl):
+    """Returns product ids that appeared on more than one page and how many expected products never appeared."""
+    seen = Counter(product_id for page in crawl["pages"] for product_id in page["ids"])
+    duplicates = sorted(product_id for product_id, count in seen.items() if count > 1)
+    complete = LISTINGS_MAX_PAGES is None or crawl["total_pages"] <= LISTINGS_MAX_PAGES
+    missing = crawl["total_products"] - len(seen) if complete else 0
+    return duplicates, missing
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_007_listings_deep_pagination_per_sort():
+    """TC-PERF-007: Crawl every /api/listings page for each sort; check for overlaps/skips and record latency by page."""
+    sorts = sort_values()
+    assert sorts, f"No sort options found in {SORT_OPTIONS_PATH}"
+    crawls = run_concurrently(crawl_sort, sorts, len(sorts))
+
+    report, problems = [], []
+    for crawl in crawls:
+        duplicates, missing = check_consistency(crawl)
+        latencies = [page["latency_ms"] for page in crawl["pages"]]
+        report.append({
+            "sort": crawl["sort"],
+            "total_pages": crawl["total_pages"],
+            "total_products": crawl["total_products"],
+            "latency": summarize(latencies),
+            "latency_by_page": [(page["page"], page["latency_ms"]) for page in crawl["pages"]],
+            "duplicate_ids": duplicates,
+            "missing_count": missing,
+        })
+        if duplicates or missing:
+            problems.append(f"{crawl['sort']}: {len(duplicates)} products on several pages, {missing} never listed")
+
+    write_report(REPORT_NAME, {"sorts": report})
+    write_series(REPORT_NAME, "page", {f"{r['sort']}_ms": r["latency_by_page"] for r in report}, log_x=False)
+
+    print(f"\n{'sort':<12} {'pages':>6} {'p50 ms':>8} {'p95 ms':>8} {'first':>8} {'last':>8} {'dupes':>6} {'missing':>8}")
+    for r in report:
+        first, last = r["latency_by_page"][0][1], r["latency_by_page"][-1][1]
+        print(f"{r['sort']:<12} {r['total_pages']:>6} {r['latency']['p50']:>8.1f} {r['latency']['p95']:>8.1f} "
+              f"{first:>8.1f} {last:>8.1f} {len(r['duplicate_ids']):>6} {r['missing_count']:>8}")
+
+    assert not problems, "Pagination is not stable: " + "; ".join(problems)
@@ -0,0 +1,166 @@
+"""
+Order-history scaling benchmark for heavy buyers.
+
+/api/orders returns every order a user ever placed, each with all of its items, in one
+GROUP_CONCAT query. /orders renders the whole list client-side, and
+/checkout/[orderId]/confirmation loads one order through /api/orders/[orderId]. The benchmark
+seeds one user for each size in ORDER_HISTORY_SIZES (1 to 4 items per order, spread over
+ORDER_HISTORY_DAYS). For each user it times ORDER_HISTORY_REQUESTS calls to /api/orders and to
+/api/orders/<latest order>, records payload sizes, and times the /orders and confirmation page
+renders in the browser. Every order and item the database holds must come back.
+
+The report plots latency and payload size against order count. It names the first size where
+/api/orders p95 or payload exceeds ORDER_HISTORY_P95_BUDGET_MS or
+ORDER_HISTORY_PAYLOAD_BUDGET_BYTES, which is where order history needs pagination or a
+lighter list payload.
+
+Requires a running app at BASE_URL and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_order_history.py --perf
+"""
+import random
+import time
+from collections import Counter
+
+import pytest
+import requests
+from selenium.webdriver.support.ui import WebDriverWait
+from tests.accounts import AUTH_COOKIE, sign_in_browser
+from tests.config import (
+    BASE_URL,
+    ORDER_HISTORY_DAYS,
+    ORDER_HISTORY_P95_BUDGET_MS,
+    ORDER_HISTORY_PAYLOAD_BUDGET_BYTES,
+    ORDER_HISTORY_RENDER_TIMEOUT,
+    ORDER_HISTORY_REQUESTS,
+    ORDER_HISTORY_SIZES,
+    VALID_PASSWORD,
+)
+from tests.db import connect, create_users, delete_users, known_password_hash, product_prices, seed_orders
+from tests.pages import OrderConfirmationPage, OrdersPage
+from tests.perf import api_login, summarize, timed_request, write_report, write_series
+
+REPORT_NAME = "order_history"
+USER_PREFIX = "perf-orders"
+
+# --- Helper Functions ---
+
+def seeded_item_counts(user_id):
+    """Returns {order id: item count} for the user's orders as stored in the database."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT o.id, COUNT(oi.id) AS items FROM orders o LEFT JOIN order_items oi ON oi.order_id = o.id "
+                "WHERE o.user_id = %s GROUP BY o.id",
+                (user_id,),
+            )
+            return {row["id"]: row["items"] for row in cursor.fetchall()}
+
+def time_endpoint(session, path):
+    """Calls path ORDER_HISTORY_REQUESTS times; returns (latency summary, payload bytes, errors, last 200 body)."""
+    latencies, sizes, errors, body = [], [], 0, None
+    for _ in range(ORDER_HISTORY_REQUESTS):
+        response, elapsed_ms = timed_request(session, "GET", f"{BASE_URL}{path}")
+        if response.status_code != 200:
+            errors += 1
+            continue
+        latencies.append(elapsed_ms)
+        sizes.append(len(response.content))
+        body = response.json()
+    return summarize(latencies), max(sizes, default=0), errors, body
+
+def time_render(page, open_page):
+    """Returns (seconds from navigation until the page rendered, result of open_page)."""
+    started = time.perf_counter()
+    result = open_page(page)
+    return round(time.perf_counter() - started, 3), result
+
+def measure_user(driver, user_id, email, size):
+    session = requests.Session()
+    api_login(session, email, VALID_PASSWORD)
+    expected = seeded_item_counts(user_id)
+
+    listing, listing_bytes, listing_errors, served = time_endpoint(session, "/api/orders")
+    served = served or []
+    served_items = {order["id"]: len(order["items"]) for order in served}
+    latest_id = served[0]["id"] if served else max(expected)
+    detail, detail_bytes, detail_errors, _ = time_endpoint(session, f"/api/orders/{latest_id}")
+
+    sign_in_browser(driver, {"token": session.cookies[AUTH_COOKIE]})
+    wait = WebDriverWait(driver, ORDER_HISTORY_RENDER_TIMEOUT)
+    render_s, cards = time_render(OrdersPage(driver, wait), lambda page: len(page.open().order_cards()))
+    confirmation_s, _ = time_render(OrderConfirmationPage(driver, wait), lambda page: page.open(latest_id).title())
+    driver.delete_cookie(AUTH_COOKIE)
+
+    return {
+        "orders": size,
+        "items": sum(expected.values()),
+        "api_orders": {"latency": listing, "payload_bytes": listing_bytes, "errors": listing_errors},
+        "api_order_detail": {"latency": detail, "payload_bytes": detail_bytes, "errors": detail_errors},
+        "bytes_per_order": round(listing_bytes / size) if listing_bytes else None,
+        "orders_page_render_s": render_s,
+        "orders_page_cards": cards,
+        "confirmation_render_s": confirmation_s,
+        "missing_orders": len(set(expected) - set(served_items)) if served else None,
+        "orders_with_missing_items": sum(1 for order_id, count in served_items.items() if count < expected.get(order_id, 0)),
+    }
+
+@pytest.fixture(scope="module")
+def heavy_buyers():
+    """Creates one user per ORDER_HISTORY_SIZES entry with that many orders; yields [(id, email, size)]."""
+    rng = random.Random(46)
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+            products = product_prices(cursor)
+            assert products, "No products in the database to seed orders against"
+            users = create_users(cursor, USER_PREFIX, len(ORDER_HISTORY_SIZES), known_password_hash(cursor))
+            for (user_id, _), size in zip(users, ORDER_HISTORY_SIZES):
+                seed_orders(cursor, [user_id], products, size, ORDER_HISTORY_DAYS, rng)
+    yield [(user_id, email, size) for (user_id, email), size in zip(users, ORDER_HISTORY_SIZES)]
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_020_order_history_scaling(driver, heavy_buyers):
+    """TC-PERF-020: Time /api/orders, /api/orders/[orderId] and the /orders render as a user's order count grows."""
+    results = [measure_user(driver, user_id, email, size) for user_id, email, size in heavy_buyers]
+
+    over_budget = next((
+        r["orders"] for r in results
+        if (r["api_orders"]["latency"]["p95"] or 0) > ORDER_HISTORY_P95_BUDGET_MS
+        or r["api_orders"]["payload_bytes"] > ORDER_HISTORY_PAYLOAD_BUDGET_BYTES
+    ), None)
+    write_report(REPORT_NAME, {"users": results, "pagination_needed_at": over_budget})
+    write_series(REPORT_NAME, "orders", {
+        "api_orders_p95_ms": [(r["orders"], r["api_orders"]["latency"]["p95"]) for r in results],
+        "api_orders_kb": [(r["orders"], round(r["api_orders"]["payload_bytes"] / 1024, 1)) for r in results],
+        "api_order_detail_p95_ms": [(r["orders"], r["api_order_detail"]["latency"]["p95"]) for r in results],
+        "orders_page_render_ms": [(r["orders"], r["orders_page_render_s"] * 1000) for r in results],
+        "confirmation_render_ms": [(r["orders"], r["confirmation_render_s"] * 1000) for r in results],
+    })
+
+    print(f"\n{'orders':>7} {'items':>7} {'list p95':>10} {'list KB':>9} {'B/order':>8} {'detail p95':>11} "
+          f"{'/orders':>9} {'cards':>6} {'confirm':>9}")
+    for r in results:
+        listing, detail = r["api_orders"], r["api_order_detail"]
+        print(f"{r['orders']:>7} {r['items']:>7} {listing['latency']['p95'] or 0:>8.1f}ms {listing['payload_bytes'] / 1024:>9.1f} "
+              f"{r['bytes_per_order'] or 0:>8} {detail['latency']['p95'] or 0:>9.1f}ms {r['orders_page_render_s']:>8.2f}s "
+              f"{r['orders_page_cards']:>6} {r['confirmation_render_s']:>8.2f}s")
+    if over_budget is not None:
+        print(f"/api/orders exceeds {ORDER_HISTORY_P95_BUDGET_MS}ms p95 or {ORDER_HISTORY_PAYLOAD_BUDGET_BYTES} bytes "
+              f"from {over_budget} orders: paginate it or trim the list payload")
+
+    errors = Counter()
+    for r in results:
+        errors[f"/api/orders at {r['orders']} orders"] += r["api_orders"]["errors"]
+        errors[f"/api/orders/[orderId] at {r['orders']} orders"] += r["api_order_detail"]["errors"]
+    assert not +errors, "Order history requests failed: " + ", ".join(f"{count}x {where}" for where, count in (+errors).items())
+    incomplete = [r for r in results if r["missing_orders"] or r["orders_with_missing_items"] or r["orders_page_cards"] != r["orders"]]
+    assert not incomplete, "Order history incomplete: " + "; ".join(
+        f"{r['orders']} orders: {r['missing_orders']} missing from /api/orders, "
+        f"{r['orders_with_missing_items']} with missing items, {r['orders_page_cards']} cards rendered"
+        for r in incomplete
+    )
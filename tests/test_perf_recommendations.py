@@ -0,0 +1,109 @@
+"""
+Recommendation latency vs user-history-size benchmark.
+
+/api/recommendations ranks a user's ai_recommendation_logs rows with a ROW_NUMBER() CTE and
+TRIM(interaction_type) predicates, so its cost grows with the user's history. This benchmark
+seeds one user per size in RECOMMENDATION_HISTORY_SIZES, calls the endpoint as each of them
+and records latency plus rows examined (from performance_schema) against history size.
+
+Requires a running app at BASE_URL and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_recommendations.py --perf
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+from tests.config import (
+    BASE_URL,
+    RECOMMENDATION_HISTORY_SIZES,
+    RECOMMENDATION_LATENCY_BUDGET_MS,
+    RECOMMENDATION_REQUESTS_PER_USER,
+    VALID_PASSWORD,
+)
+from tests.db import connect, create_users, delete_users, digest_delta, digest_snapshot, insert_many, known_password_hash, product_ids
+from tests.perf import api_login, summarize, timed_request, write_report, write_series
+
+REPORT_NAME = "recommendations_history"
+USER_PREFIX = "perf-rec"
+INTERACTION_TYPES = ["View", "Wishlist", "Add to Cart", "Purchase"]
+
+# --- Helper Functions ---
+
+def seed_interaction_logs(cursor, user_id, size, products, rng):
+    """Inserts `size` interactions for a user, spread over the 30-day window the endpoint reads."""
+    now = datetime.now()
+    rows = [
+        (
+            user_id,
+            rng.choice(products),
+            rng.choice(INTERACTION_TYPES),
+            now - timedelta(seconds=rng.randint(0, 29 * 24 * 3600)),
+        )
+        for _ in range(size)
+    ]
+    insert_many(cursor, (
+        "INSERT INTO ai_recommendation_logs (user_id, product_id, interaction_type, recommendation_time) "
+        "VALUES (%s, %s, %s, %s)"
+    ), rows)
+
+@pytest.fixture(scope="module")
+def history_users():
+    """Creates one user per history size and yields [(size, email)]. Users and logs are removed afterwards."""
+    rng = random.Random(27)
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+            products = product_ids(cursor)
+            assert products, "No products in the database to log interactions against"
+            users = create_users(cursor, USER_PREFIX, len(RECOMMENDATION_HISTORY_SIZES), known_password_hash(cursor))
+            for (user_id, _), size in zip(users, RECOMMENDATION_HISTORY_SIZES):
+                seed_interaction_logs(cursor, user_id, size, products, rng)
+    yield [(size, email) for (_, email), size in zip(users, RECOMMENDATION_HISTORY_SIZES)]
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            delete_users(cursor, USER_PREFIX)
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_002_recommendation_latency_vs_history_size(history_users):
+    """TC-PERF-002: Measure /api/recommendations latency and rows examined as interaction history grows."""
+    results = []
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            for size, email in history_users:
+                session = requests.Session()
+                api_login(session, email, VALID_PASSWORD)
+
+                before = digest_snapshot(cursor)
+                latencies = []
+                for _ in range(RECOMMENDATION_REQUESTS_PER_USER):
+                    response, elapsed_ms = timed_request(session, "GET", f"{BASE_URL}/api/recommendations")
+                    assert response.status_code == 200, f"History size {size}: HTTP {response.status_code}"
+                    latencies.append(elapsed_ms)
+                statements = digest_delta(before, digest_snapshot(cursor), text_filter="ai_recommendation_logs")
+                rows_examined = sum(s["rows_examined"] for s in statements) / RECOMMENDATION_REQUESTS_PER_USER
+
+                results.append({
+                    "history_size": size,
+                    "latency": summarize(latencies),
+                    "rows_examined_per_call": rows_examined,
+                    "recommendations": len(response.json()),
+                })
+
+    write_report(REPORT_NAME, {"results": results})
+    write_series(REPORT_NAME, "history_size", {
+        "latency_p50_ms": [(r["history_size"], r["latency"]["p50"]) for r in results],
+        "rows_examined": [(r["history_size"], r["rows_examined_per_call"]) for r in results],
+    })
+
+    print(f"\n{'history':>8} {'p50 ms':>9} {'p95 ms':>9} {'rows examined':>14}")
+    for r in results:
+        print(f"{r['history_size']:>8} {r['latency']['p50']:>9.1f} {r['latency']['p95']:>9.1f} {r['rows_examined_per_call']:>14.0f}")
+
+    heaviest = results[-1]
+    assert heaviest["latency"]["p95"] <= RECOMMENDATION_LATENCY_BUDGET_MS, (
+        f"/api/recommendations p95 {heaviest['latency']['p95']:.0f}ms for a {heaviest['history_size']}-row history "
+        f"exceeds the {RECOMMENDATION_LATENCY_BUDGET_MS}ms budget"
+    )
@@ -0,0 +1,123 @@
+"""
+Combinatorial parameter sweep and slow-query fuzzer for /api/products/search.
+
+The search handler builds dynamic SQL from q, category, minPrice, maxPrice, colors, sortBy,
+sortOrder and page. The sweep covers the cartesian product of representative values; the
+fuzzer adds random and pathological inputs (long color lists, wildcard-heavy q, deep pages,
+wide or inverted price ranges). Both run concurrently and are ranked by latency; the slowest
+cases are then re-run one at a time to attribute rows examined from performance_schema.
+
+Requires a running app at BASE_URL and DB access (see tests/db.py).
+Run with: pytest tests/test_perf_search_sweep.py --perf
+"""
+import itertools
+import random
+import string
+
+import pytest
+from tests.config import BASE_URL, SEARCH_FUZZ_CASES, SEARCH_FUZZ_SEED, SEARCH_ROWS_EXAMINED_TOP_N, SEARCH_SWEEP_WORKERS
+from tests.db import connect, digest_delta, digest_snapshot
+from tests.perf import run_concurrently, thread_session, timed_request, write_report
+
+REPORT_NAME = "search_sweep"
+SEARCH_URL = f"{BASE_URL}/api/products/search"
+
+# --- Test Data ---
+SWEEP_VALUES = {
+    "q": ["", "hoodie", "a", "uta maverick"],
+    "category": ["", "Apparel", "Gifts"],
+    "price": [(None, None), ("20", "50")],
+    "colors": ["", "Blue", "White,Gray,Black,Blue,Orange"],
+    "sort": [("created_at", "DESC"), ("price", "ASC"), ("total_sold", "DESC"), ("name", "ASC")],
+    "page": ["1", "20"],
+}
+COLORS = ["White", "Gray", "Black", "Blue", "Orange"]
+CATEGORIES = ["Apparel", "Accessories", "Spirit Gear", "School Supplies", "Gifts"]
+
+# --- Helper Functions ---
+
+def build_params(q, category, price, colors, sort, page):
+    """Builds a query-string dict, leaving out empty values the way the listings page does."""
+    params = {"q": q, "category": category, "colors": colors, "sortBy": sort[0], "sortOrder": sort[1], "page": page}
+    params["minPrice"], params["maxPrice"] = price
+    return {key: value for key, value in params.items() if value not in ("", None)}
+
+def sweep_cases():
+    """Yields every combination of SWEEP_VALUES."""
+    keys = list(SWEEP_VALUES)
+    for combo in itertools.product(*(SWEEP_VALUES[key] for key in keys)):
+        yield {"source": "sweep", "params": build_params(**dict(zip(keys, combo)))}
+
+def fuzz_case(rng):
+    """Generates one random, deliberately hostile parameter set."""
+    params = {}
+    if rng.random() < 0.8:
+        params["q"] = rng.choice([
+            lambda: "%" * rng.randint(1, 50),
+            lambda: "_%" * rng.randint(1, 50),
+            lambda: "".join(rng.choice(string.ascii_lowercase + "%_ ") for _ in range(rng.randint(1, 200))),
+            lambda: rng.choice(["hoodie", "shirt", "mug", "uta"]),
+        ])()
+    if rng.random() < 0.5:
+        params["category"] = rng.choice(CATEGORIES + ["no-such-category"])
+    if rng.random() < 0.6:
+        params["colors"] = ",".join(rng.choice(COLORS + ["Neon", "%"]) for _ in range(rng.randint(1, 100)))
+    if rng.random() < 0.6:
+        low, high = sorted(rng.uniform(0, 1000000) for _ in range(2))
+        params["minPrice"], params["maxPrice"] = f"{low:.2f}", f"{high:.2f}"
+        if rng.random() < 0.2:
+            params["minPrice"], params["maxPrice"] = params["maxPrice"], params["minPrice"]
+    params["sortBy"] = rng.choice(["price", "created_at", "total_sold", "name", "id"])
+    params["sortOrder"] = rng.choice(["ASC", "DESC", "asc"])
+    params["page"] = str(rng.choice([1, 2, 10, 100, 1000, 100000]))
+    return {"source": "fuzz", "params": params}
+
+def run_case(case):
+    """Issues one search and records status, latency and result count."""
+    response, elapsed_ms = timed_request(thread_session(), "GET", SEARCH_URL, params=case["params"])
+    total = None
+    if response.status_code == 200:
+        total = response.json().get("pagination", {}).get("totalProducts")
+    return {**case, "status": response.status_code, "latency_ms": round(elapsed_ms, 2), "total_products": total}
+
+def attribute_rows_examined(results):
+    """Re-runs cases one at a time and adds the rows examined by their SQL."""
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            for result in results:
+                before = digest_snapshot(cursor)
+                timed_request(thread_session(), "GET", SEARCH_URL, params=result["params"])
+                statements = digest_delta(before, digest_snapshot(cursor), text_filter="products")
+                result["rows_examined"] = sum(s["rows_examined"] for s in statements)
+
+def print_ranking(title, results, key):
+    print(f"\n{title}")
+    for result in results:
+        print(f"  {result[key]:>12} {result['latency_ms']:>9.1f}ms  HTTP {result['status']}  {result['params']}")
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_003_search_parameter_sweep_and_fuzz():
+    """TC-PERF-003: Rank search parameter combinations by latency and rows examined."""
+    rng = random.Random(SEARCH_FUZZ_SEED)
+    cases = list(sweep_cases()) + [fuzz_case(rng) for _ in range(SEARCH_FUZZ_CASES)]
+    results = run_concurrently(run_case, cases, SEARCH_SWEEP_WORKERS)
+
+    by_latency = sorted(results, key=lambda r: r["latency_ms"], reverse=True)
+    slowest = by_latency[:SEARCH_ROWS_EXAMINED_TOP_N]
+    attribute_rows_examined(slowest)
+    by_rows = sorted(slowest, key=lambda r: r["rows_examined"], reverse=True)
+
+    write_report(REPORT_NAME, {
+        "cases": len(results),
+        "workers": SEARCH_SWEEP_WORKERS,
+        "fuzz_seed": SEARCH_FUZZ_SEED,
+        "slowest": slowest,
+        "results": by_latency,
+    })
+    print_ranking("Slowest by latency (rows examined):", slowest, "rows_examined")
+    print_ranking("Slowest by rows examined:", by_rows, "rows_examined")
+
+    server_errors = [r["params"] for r in results if r["status"] >= 500]
+    assert not server_errors, f"{len(server_errors)} parameter sets caused a 5xx, e.g. {server_errors[:3]}"
@@ -0,0 +1,66 @@
+"""
+Support-chat polling capacity benchmark.
+
+Opens each count in CHAT_STUDENT_COUNTS of concurrent student support tabs, together with
+CHAT_ADMIN_CONSOLES admin consoles, all polling at the real cadence with occasional sends
+(see tests/chat_load.py). A checkout probe (CHAT_PROBE_PATH) runs alongside. For each step the
+benchmark reports database queries/sec, per-poll latency and estimated connection-pool wait,
+and the first student count at which the probe's p95 exceeds CHAT_PROBE_BUDGET_MS.
+
+Requires a running app at BASE_URL and DB access with performance_schema (see tests/db.py).
+Run with: pytest tests/test_perf_support_chat.py --perf
+"""
+import pytest
+from tests.chat_load import ChatLoad, admin_token
+from tests.config import CHAT_ADMIN_CONSOLES, CHAT_PROBE_BUDGET_MS, CHAT_PROBE_PATH, CHAT_STEP_SECONDS, CHAT_STUDENT_COUNTS
+from tests.perf import over_baseline, write_report, write_series
+
+REPORT_NAME = "support_chat_polling"
+USER_PREFIX = "perf-chat"
+KINDS = ["student_poll", "admin_sessions", "admin_messages", "probe"]
+
+# --- Helper Functions ---
+
+@pytest.fixture(scope="module")
+def chat_load():
+    """Leases one account per student plus one for the checkout probe."""
+    from tests.accounts import AccountPool
+    size = max(CHAT_STUDENT_COUNTS) + 1
+    pool = AccountPool(size=size, prefix=USER_PREFIX)
+    accounts = [pool.lease() for _ in range(size)]
+    yield ChatLoad(accounts[1:], admin_token(), accounts[0])
+    pool.close()
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_015_support_chat_polling_capacity(chat_load):
+    """TC-PERF-015: Report DB queries/sec, poll latency and pool wait as open support chats grow."""
+    baseline = chat_load.run(0, 0, CHAT_STEP_SECONDS)
+    steps = []
+    for students in CHAT_STUDENT_COUNTS:
+        step = chat_load.run(students, CHAT_ADMIN_CONSOLES, CHAT_STEP_SECONDS)
+        step["pool_wait_ms"] = over_baseline(step, baseline, "probe")
+        steps.append(step)
+
+    starved = next((s["students"] for s in steps if (s["latency"]["probe"]["p95"] or 0) > CHAT_PROBE_BUDGET_MS), None)
+    write_report(REPORT_NAME, {"baseline": baseline, "steps": steps, "probe_budget_exceeded_at": starved})
+    write_series(REPORT_NAME, "students", {
+        "queries_per_s": [(s["students"], s["queries_per_s"]) for s in steps],
+        "chat_queries_per_s": [(s["students"], s["chat_queries_per_s"]) for s in steps],
+        "pool_wait_p95_ms": [(s["students"], s["pool_wait_ms"]["p95"]) for s in steps],
+        **{f"{kind}_p95_ms": [(s["students"], s["latency"].get(kind, {}).get("p95")) for s in steps] for kind in KINDS},
+    })
+
+    print(f"\n{'students':>8} {'q/s':>8} {'chat q/s':>9} {'errors':>7} " + " ".join(f"{kind + ' p95':>20}" for kind in KINDS)
+          + f" {'pool wait p95':>14}")
+    for s in steps:
+        cells = [s["latency"].get(kind, {}).get("p95") for kind in KINDS]
+        wait_p95 = s["pool_wait_ms"]["p95"]
+        print(f"{s['students']:>8} {s['queries_per_s']:>8.1f} {s['chat_queries_per_s']:>9.1f} {s['errors']:>7} "
+              + " ".join(f"{c:>18.1f}ms" if c is not None else f"{'-':>20}" for c in cells)
+              + (f" {wait_p95:>12.1f}ms" if wait_p95 is not None else f" {'-':>14}"))
+    if starved is not None:
+        print(f"{CHAT_PROBE_PATH} p95 exceeds {CHAT_PROBE_BUDGET_MS}ms from {starved} open support chats")
+
+    assert steps[0]["errors"] == 0, f"{steps[0]['errors']} requests failed with {steps[0]['students']} open chats"
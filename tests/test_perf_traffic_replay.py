@@ -0,0 +1,88 @@
+"""
+Capacity test driven by replayed production traffic.
+
+Compiles REPLAY_LOG_PATH into a replay plan (see tests/replay.py) and replays it against
+BASE_URL at each speed in REPLAY_SPEEDS. The result is the real mix of /api/listings,
+/api/products/search, /api/cart/* and page requests, compressed in time. Reports throughput,
+errors, how far the replayer fell behind schedule, and per-route latency next to the latency
+logged in production.
+
+Requires a running app at BASE_URL, DB access (see tests/db.py) and an access log.
+Run with: REPLAY_LOG_PATH=access.log pytest tests/test_perf_traffic_replay.py --perf
+"""
+import pytest
+from tests.config import REPLAY_ACCOUNTS, REPLAY_LOG_PATH, REPLAY_SPEEDS
+from tests.db import connect, product_ids
+from tests.perf import write_report, write_series
+from tests.replay import Replayer, compile_plan, summarize_replay
+
+REPORT_NAME = "traffic_replay"
+USER_PREFIX = "perf-replay"
+
+# --- Helper Functions ---
+
+@pytest.fixture(scope="module")
+def replay_plan():
+    if not REPLAY_LOG_PATH:
+        pytest.skip("Set REPLAY_LOG_PATH to an access log to replay")
+    with open(REPLAY_LOG_PATH, encoding="utf-8") as log:
+        plan = compile_plan(log)
+    assert plan["requests"], f"No replayable requests in {REPLAY_LOG_PATH}"
+    return plan
+
+@pytest.fixture(scope="module")
+def replay_accounts():
+    """Leases REPLAY_ACCOUNTS accounts; yields a function that wipes them between replays."""
+    from tests.accounts import AccountPool
+    pool = AccountPool(size=REPLAY_ACCOUNTS, prefix=USER_PREFIX)
+    accounts = [pool.lease() for _ in range(REPLAY_ACCOUNTS)]
+
+    def reset():
+        for account in accounts:
+            pool.release(account)
+        return [pool.lease() for _ in range(REPLAY_ACCOUNTS)]
+
+    yield accounts, reset
+    for account in accounts:
+        pool.release(account)
+    pool.close()
+
+# --- Test Cases ---
+
+@pytest.mark.perf
+def test_tc_perf_013_replay_production_traffic(replay_plan, replay_accounts):
+    """TC-PERF-013: Replay the access log at 1x/5x/20x; report throughput, errors and per-route latency."""
+    accounts, reset = replay_accounts
+    with connect() as connection:
+        with connection.cursor() as cursor:
+            catalog = product_ids(cursor)
+    assert catalog, "No products in the database to map logged product ids onto"
+
+    runs = []
+    for speed in REPLAY_SPEEDS:
+        results, wall_seconds = Replayer(accounts, catalog).replay(replay_plan, speed)
+        runs.append({"speed": speed, **summarize_replay(results, wall_seconds)})
+        accounts = reset()
+
+    write_report(REPORT_NAME, {
+        "log": REPLAY_LOG_PATH,
+        "plan": {"requests": len(replay_plan["requests"]), "users": replay_plan["users"], "duration_s": replay_plan["duration_s"]},
+        "runs": runs,
+    })
+    write_series(REPORT_NAME, "speed", {
+        "throughput_rps": [(run["speed"], run["throughput_rps"]) for run in runs],
+        "lateness_p95_ms": [(run["speed"], run["lateness_ms"]["p95"]) for run in runs],
+        "errors": [(run["speed"], run["errors"]) for run in runs],
+    })
+
+    print(f"\n{'speed':>6} {'requests':>9} {'rps':>8} {'errors':>7} {'late p95':>10}")
+    for run in runs:
+        print(f"{run['speed']:>5}x {run['requests']:>9} {run['throughput_rps']:>8.1f} {run['errors']:>7} {run['lateness_ms']['p95']:>8.0f}ms")
+    print(f"\n{'route':<36} " + " ".join(f"{'p95 @' + str(run['speed']) + 'x':>12}" for run in runs) + f" {'logged p95':>12}")
+    for route, stats in runs[0]["routes"].items():
+        cells = [run["routes"].get(route, {}).get("latency", {}).get("p95") for run in runs]
+        logged = stats["logged_latency"]["p95"]
+        print(f"{route:<36} " + " ".join(f"{c:>10.1f}ms" if c is not None else f"{'-':>12}" for c in cells)
+              + (f" {logged:>10.1f}ms" if logged is not None else f" {'-':>12}"))
+
+    assert runs[0]["errors"] == 0, f"{runs[0]['errors']} requests failed when replayed at {runs[0]['speed']}x"
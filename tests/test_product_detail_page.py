@@ -2,38 +2,28 @@
 Tests for the Product Detail Page (PDP).
 """
 
-import pytest
 import time
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from tests.config import BASE_URL
+from selenium.common.exceptions import NoSuchElementException
 from tests.conftest import check_toast_message
-
-# --- Locators based on actual implementation ---
-HEADER_SELECTOR = "header"
-PRODUCT_IMAGES_SELECTOR = "div.space-y-4"
-MAIN_IMAGE_SELECTOR = "div.relative.aspect-square.overflow-hidden.rounded-lg img"
-THUMBNAIL_IMAGES_SELECTOR = "div.grid.grid-cols-4.gap-4 button"
-PRODUCT_TITLE_SELECTOR = "h1.text-2xl.font-semibold.text-zinc-900"
-PRODUCT_CATEGORY_SELECTOR = "p.text-zinc-500"
-PRODUCT_PRICE_SELECTOR = "span.text-3xl.font-bold.text-\\[\\#0064B1\\]"
-PRODUCT_ORIGINAL_PRICE_SELECTOR = "span.text-lg.text-zinc-400.line-through"
-PRODUCT_DISCOUNT_SELECTOR = "span.bg-red-500"
-PRODUCT_RATING_SELECTOR = "div.flex.items-center.gap-2"
-PRODUCT_STARS_SELECTOR = "svg.w-5.h-5"
-PRODUCT_REVIEW_COUNT_SELECTOR = "span.text-zinc-600"
-SIZE_SELECTOR = "select[value='']"
-COLOR_SELECTOR = "select[value='']"
-QUANTITY_SELECTOR = "select[value='1']"
-ADD_TO_CART_BUTTON_SELECTOR = "button.bg-\\[\\#0064B1\\]"
-WISHLIST_BUTTON_SELECTOR = "button[aria-label='Add to wishlist'], button[aria-label='Remove from wishlist']"
-SHARE_BUTTON_SELECTOR = "button:has(svg.h-4.w-4)"
-PRODUCT_DESCRIPTION_SELECTOR = "p.text-zinc-600"
-PRODUCT_DETAILS_SELECTOR = "ul.list-disc.list-inside.space-y-2.text-zinc-600"
-LOADING_SKELETON_SELECTOR = "div.animate-pulse.bg-gray-200.rounded-lg"
-ERROR_MESSAGE_SELECTOR = "div.text-center h1.text-2xl.font-bold.text-red-600"
+from tests.locators import (
+    HEADER,
+    PDP_CATEGORY,
+    PDP_ERROR_DETAIL,
+    PDP_ERROR_MESSAGE,
+    PDP_IMAGES,
+    PDP_LOADING_SKELETON,
+    PDP_MAIN_IMAGE,
+    PDP_PRICE,
+    PDP_RATING,
+    PDP_REVIEW_COUNT,
+    PDP_STAR,
+    PDP_THUMBNAIL,
+    PDP_TITLE,
+    TOAST_VIEW_CART_BUTTON,
+)
+from tests.pages import ProductDetailPage
 
 # --- Test Data ---
 PRODUCT_ID = "1"
@@ -41,105 +31,48 @@ QUANTITY = "2"
 SIZE = "M"
 COLOR = "Navy Blue"
 
-# --- Helper Functions ---
-
-def add_to_cart(driver, wait, quantity, size=None, color=None):
-    """Adds a product to cart with specified options."""
-    try:
-        # Select quantity if provided
-        if quantity:
-            quantity_select = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, QUANTITY_SELECTOR)))
-            quantity_select.click()
-            quantity_select.send_keys(quantity)
-        
-        # Select size if provided
-        if size:
-            size_select = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, SIZE_SELECTOR)))
-            size_select.click()
-            size_select.send_keys(size)
-        
-        # Select color if provided
-        if color:
-            color_select = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, COLOR_SELECTOR)))
-            color_select.click()
-            color_select.send_keys(color)
-        
-        # Click add to cart button
-        add_to_cart_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, ADD_TO_CART_BUTTON_SELECTOR)))
-        add_to_cart_button.click()
-        
-        # Wait for success toast
-        check_toast_message(wait, "Added to cart!")
-        
-    except TimeoutException:
-        pytest.fail("Failed to add product to cart")
-
-def toggle_wishlist(driver, wait):
-    """Toggles the wishlist status of a product."""
-    try:
-        # Find wishlist button
-        wishlist_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, WISHLIST_BUTTON_SELECTOR)))
-        initial_state = wishlist_button.get_attribute("aria-label")
-        
-        # Click button
-        wishlist_button.click()
-        
-        # Wait for state change
-        wait.until(lambda d: d.find_element(By.CSS_SELECTOR, WISHLIST_BUTTON_SELECTOR).get_attribute("aria-label") != initial_state)
-        
-        # Check toast message
-        if "Add" in initial_state:
-            check_toast_message(wait, "Added to wishlist")
-        else:
-            check_toast_message(wait, "Removed from wishlist")
-            
-    except TimeoutException:
-        pytest.fail("Failed to toggle wishlist status")
-
 # --- Test Cases ---
 
 def test_tc_pdp_001_verify_page_load(driver, wait):
     """TC-PDP-001: Verify product detail page loads correctly."""
-    driver.get(f"{BASE_URL}/product/{PRODUCT_ID}")
+    page = ProductDetailPage(driver, wait).open(PRODUCT_ID)
     
     # Verify header
-    wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, HEADER_SELECTOR)))
+    page.find(HEADER, EC.visibility_of_element_located)
     
     # Wait for loading skeleton to disappear
-    try:
-        wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, LOADING_SKELETON_SELECTOR)))
-    except TimeoutException:
-        pass
+    page.wait_until_gone(PDP_LOADING_SKELETON)
     
     # Verify product images
-    images_section = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, PRODUCT_IMAGES_SELECTOR)))
-    assert images_section.find_element(By.CSS_SELECTOR, MAIN_IMAGE_SELECTOR).is_displayed()
-    thumbnails = images_section.find_elements(By.CSS_SELECTOR, THUMBNAIL_IMAGES_SELECTOR)
+    images_section = page.find(PDP_IMAGES, EC.visibility_of_element_located)
+    assert page.find(PDP_MAIN_IMAGE, within=images_section).is_displayed()
+    thumbnails = page.find_all(PDP_THUMBNAIL, within=images_section)
     assert len(thumbnails) > 0
     
     # Verify product info
-    assert wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, PRODUCT_TITLE_SELECTOR))).text != ""
-    assert wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, PRODUCT_CATEGORY_SELECTOR))).text != ""
-    assert wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, PRODUCT_PRICE_SELECTOR))).text.startswith("$")
+    assert page.text(PDP_TITLE) != ""
+    assert page.text(PDP_CATEGORY) != ""
+    assert page.text(PDP_PRICE).startswith("$")
     
     # Verify rating
-    rating_section = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, PRODUCT_RATING_SELECTOR)))
-    stars = rating_section.find_elements(By.CSS_SELECTOR, PRODUCT_STARS_SELECTOR)
+    rating_section = page.find(PDP_RATING, EC.visibility_of_element_located)
+    stars = page.find_all(PDP_STAR, within=rating_section)
     assert len(stars) == 5
-    assert rating_section.find_element(By.CSS_SELECTOR, PRODUCT_REVIEW_COUNT_SELECTOR).text != ""
+    assert page.find(PDP_REVIEW_COUNT, within=rating_section).text != ""
 
 def test_tc_pdp_002_verify_image_gallery(driver, wait):
     """TC-PDP-002: Verify product image gallery functionality."""
-    driver.get(f"{BASE_URL}/product/{PRODUCT_ID}")
+    page = ProductDetailPage(driver, wait).open(PRODUCT_ID)
     
     # Wait for images to load
-    images_section = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, PRODUCT_IMAGES_SELECTOR)))
-    thumbnails = images_section.find_elements(By.CSS_SELECTOR, THUMBNAIL_IMAGES_SELECTOR)
+    images_section = page.find(PDP_IMAGES, EC.visibility_of_element_located)
+    thumbnails = page.find_all(PDP_THUMBNAIL, within=images_section)
     
     # Click each thumbnail and verify main image changes
     for i, thumbnail in enumerate(thumbnails):
-        # Get current main image src
-        main_image = images_section.find_element(By.CSS_SELECTOR, MAIN_IMAGE_SELECTOR)
+        # Get current main image src (re-resolved each time: a thumbnail click may swap the <img>)
+        page.invalidate(PDP_MAIN_IMAGE)
+        main_image = page.find(PDP_MAIN_IMAGE, within=images_section)
         initial_src = main_image.get_attribute("src")
         
         # Click thumbnail
@@ -152,52 +85,48 @@ def test_tc_pdp_002_verify_image_gallery(driver, wait):
 
 def test_tc_pdp_003_verify_add_to_cart(driver, wait):
     """TC-PDP-003: Verify add to cart functionality."""
-    driver.get(f"{BASE_URL}/product/{PRODUCT_ID}")
+    page = ProductDetailPage(driver, wait).open(PRODUCT_ID)
     
     # Add to cart with default options
-    add_to_cart(driver, wait, None)
+    page.add_to_cart()
     
     # Verify cart action in toast
-    toast_action = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button:has-text('View Cart')")))
-    assert toast_action.is_displayed()
+    assert page.find(TOAST_VIEW_CART_BUTTON, EC.element_to_be_clickable).is_displayed()
 
 def test_tc_pdp_004_verify_add_to_cart_with_options(driver, wait):
     """TC-PDP-004: Verify add to cart with size and color selection."""
-    driver.get(f"{BASE_URL}/product/{PRODUCT_ID}")
+    page = ProductDetailPage(driver, wait).open(PRODUCT_ID)
     
     # Add to cart with options
-    add_to_cart(driver, wait, QUANTITY, SIZE, COLOR)
+    page.add_to_cart(QUANTITY, SIZE, COLOR)
     
     # Verify cart action in toast
-    toast_action = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button:has-text('View Cart')")))
-    assert toast_action.is_displayed()
+    assert page.find(TOAST_VIEW_CART_BUTTON, EC.element_to_be_clickable).is_displayed()
 
 def test_tc_pdp_005_verify_wishlist_functionality(driver, wait):
     """TC-PDP-005: Verify wishlist functionality."""
-    driver.get(f"{BASE_URL}/product/{PRODUCT_ID}")
+    page = ProductDetailPage(driver, wait).open(PRODUCT_ID)
     
     # Toggle wishlist status
-    toggle_wishlist(driver, wait)
+    page.toggle_wishlist()
     
     # Toggle again to return to original state
-    toggle_wishlist(driver, wait)
+    page.toggle_wishlist()
 
 def test_tc_pdp_006_verify_share_functionality(driver, wait):
     """TC-PDP-006: Verify share functionality."""
-    driver.get(f"{BASE_URL}/product/{PRODUCT_ID}")
+    page = ProductDetailPage(driver, wait).open(PRODUCT_ID)
     
     # Click share button
-    share_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, SHARE_BUTTON_SELECTOR)))
-    share_button.click()
+    page.share()
     
     # Verify toast message
     check_toast_message(wait, "Link copied to clipboard!")
 
 def test_tc_pdp_007_verify_error_handling(driver, wait):
     """TC-PDP-007: Verify error handling for invalid product ID."""
-    driver.get(f"{BASE_URL}/product/invalid_id")
+    page = ProductDetailPage(driver, wait).open("invalid_id")
     
     # Verify error message
-    error_message = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ERROR_MESSAGE_SELECTOR)))
-    assert "Error" in error_message.text
-    assert "Product not found" in driver.find_element(By.CSS_SELECTOR, "p.text-zinc-600").text 
\ No newline at end of file
+    assert "Error" in page.text(PDP_ERROR_MESSAGE)
+    assert "Product not found" in page.text(PDP_ERROR_DETAIL)
@@ -0,0 +1,325 @@
+"""
+Timing-variance analysis: which tests are slow, which are noisy, and where they wait.
+
+    pytest tests/test_cart_page.py --timing-reruns 5                  # K runs in one session
+    python -m tests.timing_variance --runs 5 --parallel 3 -- tests/test_cart_page.py
+
+`--timing-reruns K` parametrizes every selected test K times (ids run1..runK), so each run gets
+fresh function fixtures while session fixtures such as `driver` are shared. During each run,
+every wait is recorded with the innermost tests/ frame that issued it:
+
+* explicit: WebDriverWait.until/until_not. It hit its timeout if it raised TimeoutException;
+* implicit: find_element/find_elements outside an explicit wait. It hit the implicit wait if
+  nothing was found after at least TIMING_VARIANCE_TIMEOUT_SLACK of the timeout;
+* sleep: time.sleep called from tests/ outside an explicit wait.
+
+Wasted wait is the time spent in waits that hit their timeout, plus every fixed sleep. For
+each test the report gives mean, variance, min and max duration, which waits hit their timeout
+and how often, and wasted wait per run. Tests are ranked by wasted wait. A test is "noisy"
+when its coefficient of variation is at least TIMING_VARIANCE_NOISY_CV and its standard
+deviation at least TIMING_VARIANCE_NOISE_FLOOR_S. It is "slow" when even its fastest run took
+TIMING_VARIANCE_SLOW_S or more.
+
+The module entry point runs K separate pytest processes (each with --timing-reruns 1), up to
+--parallel at a time, and merges their runs into the same report. Parallel runs share the app
+and database, so they measure under contention. They also suit tests that lease accounts
+(tests/accounts.py) better than tests sharing VALID_EMAIL.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.wait import WebDriverWait
+
+from tests.config import (
+    PERF_RESULTS_DIR,
+    PROJECT_ROOT,
+    TIMING_VARIANCE_NOISE_FLOOR_S,
+    TIMING_VARIANCE_NOISY_CV,
+    TIMING_VARIANCE_SLOW_S,
+    TIMING_VARIANCE_TIMEOUT_SLACK,
+)
+
+REPORT_NAME = "timing_variance"
+RUN_PARAMETER = "timing_run"
+TESTS_DIR = os.path.join(PROJECT_ROOT, "tests")
+
+# --- Wait instrumentation ---
+
+_state = threading.local()  # .depth: nesting of explicit waits on this thread
+
+def _call_site():
+    """Returns "file:line" of the innermost frame in tests/ outside this module, or None."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(TESTS_DIR) and filename != __file__:
+            return f"{os.path.relpath(filename, PROJECT_ROOT)}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+class WaitRecorder:
+    """Patches Selenium's waits and time.sleep, and hands every wait to `sink(record)`."""
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.implicit_timeouts = {}  # id(driver) -> seconds set through implicitly_wait
+        self._originals = {}
+
+    def _record(self, kind, started, timeout, timed_out, where):
+        self.sink({
+            "kind": kind,
+            "where": where,
+            "timeout_s": timeout,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            "timed_out": timed_out,
+        })
+
+    def install(self):
+        recorder = self
+        originals = self._originals = {
+            (WebDriverWait, "until"): WebDriverWait.until,
+            (WebDriverWait, "until_not"): WebDriverWait.until_not,
+            (WebDriver, "implicitly_wait"): WebDriver.implicitly_wait,
+            (WebDriver, "find_element"): WebDriver.find_element,
+            (WebDriver, "find_elements"): WebDriver.find_elements,
+            (WebElement, "find_element"): WebElement.find_element,
+            (WebElement, "find_elements"): WebElement.find_elements,
+            (time, "sleep"): time.sleep,
+        }
+
+        def explicit(original):
+            def wait(self, *args, **kwargs):
+                where, started = _call_site(), time.perf_counter()
+                _state.depth = getattr(_state, "depth", 0) + 1
+                try:
+                    result = original(self, *args, **kwargs)
+                except TimeoutException:
+                    recorder._record("explicit", started, self._timeout, True, where)
+                    raise
+                finally:
+                    _state.depth -= 1
+                recorder._record("explicit", started, self._timeout, False, where)
+                return result
+            return wait
+
+        def implicitly_wait(self, time_to_wait):
+            recorder.implicit_timeouts[id(self)] = time_to_wait
+            return originals[(WebDriver, "implicitly_wait")](self, time_to_wait)
+
+        def finder(owner, name):
+            original = originals[(owner, name)]
+
+            def find(self, *args, **kwargs):
+                if getattr(_state, "depth", 0):
+                    return original(self, *args, **kwargs)
+                driver = self if isinstance(self, WebDriver) else self.parent
+                timeout = recorder.implicit_timeouts.get(id(driver), 0)
+                where, started = _call_site(), time.perf_counter()
+                try:
+                    result = original(self, *args, **kwargs)
+                except NoSuchElementException:
+                    recorder._record("implicit", started, timeout, timeout > 0 and recorder._used_up(started, timeout), where)
+                    raise
+                if timeout and not result:
+                    recorder._record("implicit", started, timeout, recorder._used_up(started, timeout), where)
+                return result
+            return find
+
+        def sleep(seconds):
+            where = None if getattr(_state, "depth", 0) else _call_site()
+            started = time.perf_counter()
+            originals[(time, "sleep")](seconds)
+            if where is not None:
+                recorder._record("sleep", started, seconds, True, where)
+
+        WebDriverWait.until = explicit(originals[(WebDriverWait, "until")])
+        WebDriverWait.until_not = explicit(originals[(WebDriverWait, "until_not")])
+        WebDriver.implicitly_wait = implicitly_wait
+        for owner in (WebDriver, WebElement):
+            for name in ("find_element", "find_elements"):
+                setattr(owner, name, finder(owner, name))
+        time.sleep = sleep
+
+    @staticmethod
+    def _used_up(started, timeout):
+        return time.perf_counter() - started >= timeout * TIMING_VARIANCE_TIMEOUT_SLACK
+
+    def uninstall(self):
+        for (owner, name), original in self._originals.items():
+            setattr(owner, name, original)
+        self._originals = {}
+
+# --- Analysis ---
+
+def base_nodeid(nodeid):
+    """Strips the run parameter: test_x[run2] -> test_x, test_y[run2-a] -> test_y[a]."""
+    return re.sub(r"\[run\d+-", "[", re.sub(r"\[run\d+\]$", "", nodeid))
+
+def analyze(runs):
+    """Folds per-run records into one entry per test, ranked by wasted wait per run."""
+    by_test = defaultdict(list)
+    for run in runs:
+        by_test[base_nodeid(run["nodeid"])].append(run)
+    tests = []
+    for nodeid, test_runs in by_test.items():
+        durations = [run["seconds"] for run in test_runs]
+        mean = statistics.fmean(durations)
+        stdev = statistics.stdev(durations) if len(durations) > 1 else 0.0
+        sites = defaultdict(lambda: {"hits": 0, "runs_hit": set(), "wasted_ms": 0.0, "timeout_s": 0})
+        wasted = []
+        for run in test_runs:
+            run_wasted = 0.0
+            for wait in run["waits"]:
+                if not wait["timed_out"]:
+                    continue
+                site = sites[(wait["kind"], wait["where"])]
+                site["timeout_s"] = max(site["timeout_s"], round(wait["timeout_s"], 2))
+                site["hits"] += 1
+                site["runs_hit"].add(run["run"])
+                site["wasted_ms"] += wait["elapsed_ms"]
+                run_wasted += wait["elapsed_ms"]
+            wasted.append(run_wasted)
+        tests.append({
+            "test": nodeid,
+            "runs": len(test_runs),
+            "outcomes": dict(Counter(run["outcome"] for run in test_runs)),
+            "mean_s": round(mean, 3),
+            "variance_s2": round(stdev ** 2, 4),
+            "stdev_s": round(stdev, 3),
+            "cv": round(stdev / mean, 3) if mean else 0.0,
+            "min_s": round(min(durations), 3),
+            "max_s": round(max(durations), 3),
+            "wasted_wait_s": round(statistics.fmean(wasted) / 1000, 3),
+            "wasted_share": round(statistics.fmean(wasted) / 1000 / mean, 3) if mean else 0.0,
+            "noisy": stdev >= TIMING_VARIANCE_NOISE_FLOOR_S and stdev / mean >= TIMING_VARIANCE_NOISY_CV,
+            "slow": min(durations) >= TIMING_VARIANCE_SLOW_S,
+            "timeouts": sorted((
+                {
+                    "kind": kind,
+                    "where": where,
+                    "timeout_s": site["timeout_s"],
+                    "hits": site["hits"],
+                    "runs_hit": len(site["runs_hit"]),
+                    "wasted_s_per_run": round(site["wasted_ms"] / len(test_runs) / 1000, 3),
+                }
+                for (kind, where), site in sites.items()
+            ), key=lambda site: -site["wasted_s_per_run"]),
+        })
+    return sorted(tests, key=lambda test: -test["wasted_wait_s"])
+
+def report_lines(tests, runs_per_test):
+    """Formats the ranking for the terminal."""
+    lines = [f"{'wasted/run':>10} {'mean':>8} {'stdev':>7} {'min':>8} {'cv':>6} {'flags':<11} test  (K={runs_per_test})"]
+    for test in tests:
+        flags = ",".join(flag for flag in ("slow", "noisy") if test[flag]) or "-"
+        lines.append(f"{test['wasted_wait_s']:>9.2f}s {test['mean_s']:>7.2f}s {test['stdev_s']:>6.2f}s {test['min_s']:>7.2f}s "
+                     f"{test['cv']:>6.2f} {flags:<11} {test['test']}")
+        for site in test["timeouts"][:3]:
+            what = f"sleep up to {site['timeout_s']}s" if site["kind"] == "sleep" else f"{site['kind']} {site['timeout_s']}s timeout hit"
+            lines.append(f"{'':>12}{what} in {site['runs_hit']}/{test['runs']} runs "
+                         f"({site['wasted_s_per_run']:.2f}s/run) at {site['where']}")
+    return lines
+
+# --- Pytest plugin ---
+
+class TimingVariance:
+    """Pytest plugin that reruns every test K times and records its duration and waits per run."""
+
+    def __init__(self, runs):
+        self.runs_per_test = runs
+        self.runs = []
+        self._current = None
+        self.recorder = WaitRecorder(self._add_wait)
+
+    def _add_wait(self, record):
+        if self._current is not None:
+            self._current["waits"].append(record)
+
+    def pytest_sessionstart(self, session):
+        self.recorder.install()
+
+    def pytest_sessionfinish(self, session):
+        self.recorder.uninstall()
+
+    def pytest_generate_tests(self, metafunc):
+        metafunc.fixturenames.append(RUN_PARAMETER)
+        metafunc.parametrize(RUN_PARAMETER, range(1, self.runs_per_test + 1), ids=lambda run: f"run{run}")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        run = item.callspec.params.get(RUN_PARAMETER, 1) if hasattr(item, "callspec") else 1
+        self._current = {"nodeid": item.nodeid, "run": run, "seconds": 0.0, "outcome": "passed", "waits": []}
+        yield
+        self.runs.append(self._current)
+        self._current = None
+
+    def pytest_runtest_logreport(self, report):
+        if self._current is None or report.nodeid != self._current["nodeid"]:
+            return
+        self._current["seconds"] = round(self._current["seconds"] + report.duration, 3)
+        if report.outcome != "passed" and self._current["outcome"] == "passed":
+            self._current["outcome"] = report.outcome
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.runs:
+            return
+        from tests.perf import write_report
+        tests = analyze(self.runs)
+        write_report(REPORT_NAME, {"runs_per_test": self.runs_per_test, "tests": tests, "runs": self.runs})
+        terminalreporter.section("timing variance, ranked by wasted wait")
+        for line in report_lines(tests, self.runs_per_test):
+            terminalreporter.write_line(line)
+
+# --- Entry point ---
+
+def run_once(index, pytest_args, run_dir):
+    """Runs the selected tests once in a pytest subprocess; returns its run records."""
+    results_dir = os.path.join(run_dir, f"run{index}")
+    env = {**os.environ, "PERF_RESULTS_DIR": results_dir}
+    command = [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "--timing-reruns", "1", *pytest_args]
+    with open(os.path.join(run_dir, f"run{index}.log"), "w", encoding="utf-8") as log:
+        subprocess.call(command, cwd=PROJECT_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+    path = os.path.join(results_dir, f"{REPORT_NAME}.json")
+    if not os.path.exists(path):
+        print(f"run {index} recorded no tests; see {os.path.join(run_dir, f'run{index}.log')}")
+        return []
+    with open(path, encoding="utf-8") as report:
+        return [{**run, "run": index} for run in json.load(report)["runs"]]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rerun tests K times (optionally in parallel) and rank them by wasted wait.")
+    parser.add_argument("--runs", type=int, required=True, help="Runs per test (K).")
+    parser.add_argument("--parallel", type=int, default=1, help="pytest processes to run at once.")
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER, help="Arguments for pytest, after --.")
+    args = parser.parse_args(argv)
+    pytest_args = args.pytest_args[1:] if args.pytest_args[:1] == ["--"] else args.pytest_args
+
+    run_dir = os.path.join(PERF_RESULTS_DIR, "timing_variance", time.strftime("%Y%m%d-%H%M%S"))
+    os.makedirs(run_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+        batches = list(executor.map(lambda index: run_once(index, pytest_args, run_dir), range(1, args.runs + 1)))
+    runs = [run for batch in batches for run in batch]
+    if not runs:
+        return 1
+
+    from tests.perf import write_report
+    tests = analyze(runs)
+    write_report(REPORT_NAME, {"runs_per_test": args.runs, "parallel": args.parallel, "tests": tests, "runs": runs})
+    print("\n".join(report_lines(tests, args.runs)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())